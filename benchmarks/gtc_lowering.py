@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Time of the GTC lowering passes (GTIR -> OIR -> GTCpp -> C++) on a generated stencil.
+
+The stencil is a chain of ``--statements`` assignments to temporaries, each one reading
+its predecessor and ``--fields`` input fields at horizontal offsets. Each pass is timed
+separately (best of ``--repeat`` runs). With ``--trusted`` the passes after DefIR -> GTIR
+run in trusted construction mode and the GTCpp tree is validated once at the end, as in
+the ``gtc:gt`` backends.
+
+Usage::
+
+    python benchmarks/gtc_lowering.py --statements 200 --fields 10 [--trusted]
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import os
+import tempfile
+import time
+
+import eve
+from gt4py import backend as gt_backend
+from gt4py.backend.gtc_backend.defir_to_gtir import DefIRToGTIR
+from gt4py.stencil_builder import StencilBuilder
+from gtc import gtir_to_oir
+from gtc.gtcpp import gtcpp_codegen, oir_to_gtcpp
+from gtc.passes.gtir_dtype_resolver import resolve_dtype
+from gtc.passes.gtir_prune_unused_parameters import prune_unused_parameters
+from gtc.passes.gtir_upcaster import upcast
+from gtc.passes.oir_optimizations.horizontal_execution_merging import GreedyMerging
+from gtc.passes.oir_optimizations.temporaries import TemporariesToScalars
+
+
+def make_definition(n_statements, n_fields):
+    """Write the stencil definition to a module (the frontend needs its source)."""
+    fields = [f"in{i}" for i in range(n_fields)]
+    lines = [
+        "from gt4py.gtscript import PARALLEL, Field, computation, interval",
+        "",
+        "",
+        f"def definition(out: Field[float], {', '.join(f'{name}: Field[float]' for name in fields)}):",
+        "    with computation(PARALLEL), interval(...):",
+        "        tmp0 = in0",
+    ]
+    for i in range(1, n_statements):
+        a, b = fields[i % n_fields], fields[(i + 1) % n_fields]
+        lines.append(
+            f"        tmp{i} = 0.5 * tmp{i - 1} + {a}[1, 0, 0] + {a}[-1, 0, 0] - {b}[0, 1, 0]"
+        )
+    lines.append(f"        out = tmp{n_statements - 1}")
+
+    path = os.path.join(tempfile.mkdtemp(), "gtc_lowering_stencil.py")
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    spec = importlib.util.spec_from_file_location("gtc_lowering_stencil", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.definition
+
+
+def lower(definition_ir, timings, trusted=False):
+    def run(name, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings[name] = min(timings.get(name, float("inf")), time.perf_counter() - start)
+        return result
+
+    gtir = run("DefIR -> GTIR", DefIRToGTIR.apply, definition_ir)
+    with eve.trusted_construction() if trusted else contextlib.nullcontext():
+        gtir = run(
+            "GTIR passes", lambda node: upcast(resolve_dtype(prune_unused_parameters(node))), gtir
+        )
+        oir = run("GTIR -> OIR", gtir_to_oir.GTIRToOIR().visit, gtir)
+        oir = run(
+            "OIR optimizations",
+            lambda node: TemporariesToScalars().visit(GreedyMerging().visit(node)),
+            oir,
+        )
+        gtcpp = run("OIR -> GTCpp", oir_to_gtcpp.OIRToGTCpp().visit, oir)
+    if trusted:
+        gtcpp = run("GTCpp validation", eve.validate_tree, gtcpp)
+    run("GTCpp codegen", gtcpp_codegen.GTCppCodegen.apply, gtcpp, gt_backend_t="cpu")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--statements", type=int, default=200)
+    parser.add_argument("--fields", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--trusted", action="store_true", help="construct nodes without validation checks"
+    )
+    args = parser.parse_args()
+
+    builder = StencilBuilder(
+        make_definition(args.statements, args.fields),
+        backend=gt_backend.from_name("gtc:gt:cpu_ifirst"),
+    )
+    definition_ir = builder.definition_ir
+
+    timings = {}
+    for _ in range(args.repeat):
+        lower(definition_ir, timings, trusted=args.trusted)
+    for name, seconds in timings.items():
+        print(f"{name:>18}: {seconds * 1e3:10.1f} ms")
+    print(f"{'total':>18}: {sum(timings.values()) * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
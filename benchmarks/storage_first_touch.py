@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Memory bandwidth of CPU storages initialized serially or with a parallel first touch.
+
+A multi-threaded copy kernel (``out = 2 * in``), split over the threads along the J
+dimension like the OpenMP loops of the ``gtmc`` backend, runs on storages allocated with
+``gt4py.storage.zeros`` with and without ``first_touch``. On multi-socket nodes, the
+pages of serially initialized storages all live on the NUMA node of the main thread.
+
+Usage::
+
+    python benchmarks/storage_first_touch.py --shape 512 512 80 --threads 32
+"""
+
+import argparse
+import concurrent.futures
+import os
+import time
+
+import numpy as np
+
+import gt4py.storage as gt_storage
+
+
+def run_kernel(executor, out_field, in_field, n_threads, n_repeat):
+    out_array = out_field.view(np.ndarray)
+    in_array = in_field.view(np.ndarray)
+    n_rows = out_array.shape[1]
+    bounds = [n_rows * t // n_threads for t in range(n_threads + 1)]
+
+    def kernel(t):
+        rows = slice(bounds[t], bounds[t + 1])
+        np.multiply(in_array[:, rows, :], 2.0, out=out_array[:, rows, :])
+
+    best = float("inf")
+    for _ in range(n_repeat):
+        start = time.perf_counter()
+        list(executor.map(kernel, range(n_threads)))
+        best = min(best, time.perf_counter() - start)
+    return 2 * out_array.nbytes / best / 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", default="gtmc")
+    parser.add_argument("--shape", type=int, nargs=3, default=(512, 512, 80))
+    parser.add_argument("--threads", type=int, default=os.cpu_count())
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.threads) as executor:
+        for first_touch in (False, args.threads):
+            fields = [
+                gt_storage.zeros(
+                    args.backend,
+                    (3, 3, 0),
+                    args.shape,
+                    np.float64,
+                    first_touch=first_touch,
+                )
+                for _ in range(2)
+            ]
+            bandwidth = run_kernel(executor, *fields, args.threads, args.repeat)
+            label = "parallel first touch" if first_touch else "serial initialization"
+            print(f"{label:>22}: {bandwidth:8.2f} GB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -41,6 +41,8 @@ from .concepts import (
     field,
     in_field,
     out_field,
+    trusted_construction,
+    validation_check,
 )
 from .iterators import iter_tree
 from .traits import SymbolTableTrait
@@ -61,4 +63,4 @@ from .type_definitions import (
     SymbolName,
     SymbolRef,
 )
-from .visitors import NodeMutator, NodeTranslator, NodeVisitor
+from .visitors import NodeMutator, NodeTranslator, NodeVisitor, validate_tree
@@ -52,6 +52,7 @@ from .typingx import (
     Sequence,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
     cast,
@@ -611,6 +612,7 @@ class TemplatedGenerator(NodeVisitor):
     """
 
     __templates__: ClassVar[Mapping[str, Template]]
+    _template_table_: ClassVar[Dict[Type, Tuple[Optional[Template], Optional[str]]]] = {}
 
     @classmethod
     def __init_subclass__(cls, *, inherit_templates: bool = True, **kwargs: Any) -> None:
@@ -636,6 +638,7 @@ class TemplatedGenerator(NodeVisitor):
         )
 
         cls.__templates__ = types.MappingProxyType(templates)
+        cls._template_table_ = {}
 
     @typing.overload
     @classmethod
@@ -709,11 +712,19 @@ class TemplatedGenerator(NodeVisitor):
         template: Optional[Template] = None
         template_key = None
         if isinstance(node, Node):
+            # templates are looked up once per node class
+            cached = self._template_table_.get(node.__class__, None)
+            if cached is not None:
+                return cached
             for node_class in node.__class__.__mro__:
                 template_key = node_class.__name__
                 template = self.__templates__.get(template_key, None)
                 if template is not None or node_class is Node:
                     break
+            self._template_table_[node.__class__] = (
+                template,
+                None if template is None else template_key,
+            )
 
         return template, None if template is None else template_key
 
@@ -19,19 +19,25 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import functools
+import os
 
 import pydantic
+import pydantic.fields
 import pydantic.generics
 
 from . import iterators, utils
 from .type_definitions import NOTHING, IntEnum, Str, StrEnum
 from .typingx import (
     Any,
+    AnyCallable,
     AnyNoArgCallable,
     ClassVar,
     Dict,
     Generator,
+    Iterator,
     List,
     Optional,
     Set,
@@ -113,6 +119,55 @@ class FrozenModel(pydantic.BaseModel):
         allow_mutation = False
 
 
+# -- Validation --
+#: Always run the full validation of nodes, also inside trusted construction blocks
+#: (enabled by setting the ``EVE_FULL_VALIDATION`` environment variable).
+FULL_VALIDATION = os.environ.get("EVE_FULL_VALIDATION", "0") not in ("", "0")
+
+_EVE_VALIDATION_CHECK_ATTR = "__eve_validation_check__"
+
+#: Container types of the fields, coerced in trusted construction like pydantic does
+_TRUSTED_CONTAINER_TYPES = {
+    pydantic.fields.SHAPE_LIST: list,
+    pydantic.fields.SHAPE_SET: set,
+    pydantic.fields.SHAPE_TUPLE_ELLIPSIS: tuple,
+}
+
+_trusted_construction: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_trusted_construction", default=False
+)
+
+
+@contextlib.contextmanager
+def trusted_construction(enabled: bool = True) -> Iterator[None]:
+    """Construct nodes without validation checks inside the context.
+
+    Meant for internal passes building nodes from an already validated tree:
+    field validators and root validators marked with :func:`validation_check`
+    are skipped, while the remaining root validators (which derive field
+    values) still run. Use ``enabled=False`` to restore full validation in
+    a nested context. Ignored if :data:`FULL_VALIDATION` is set.
+    """
+    token = _trusted_construction.set(enabled)
+    try:
+        yield
+    finally:
+        _trusted_construction.reset(token)
+
+
+def is_trusted_construction() -> bool:
+    return _trusted_construction.get() and not FULL_VALIDATION
+
+
+def validation_check(func: AnyCallable) -> AnyCallable:
+    """Mark a root validator function as a pure check, skipped in trusted construction.
+
+    It should be applied to the plain function, before :func:`pydantic.root_validator`.
+    """
+    setattr(func, _EVE_VALIDATION_CHECK_ATTR, True)
+    return func
+
+
 # -- Nodes --
 _EVE_NODE_INTERNAL_SUFFIX = "__"
 _EVE_NODE_IMPL_SUFFIX = "_"
@@ -152,6 +207,18 @@ class NodeMetaclass(pydantic.main.ModelMetaclass):
         cls.__node_impl_fields__ = impl_fields_metadata
         cls.__node_children__ = children_metadata
 
+        # Root validators deriving field values (run also in trusted construction)
+        cls.__node_trusted_pre_root_validators__ = [
+            func
+            for func in cls.__pre_root_validators__
+            if not getattr(func, _EVE_VALIDATION_CHECK_ATTR, False)
+        ]
+        cls.__node_trusted_post_root_validators__ = [
+            func
+            for _, func in cls.__post_root_validators__
+            if not getattr(func, _EVE_VALIDATION_CHECK_ATTR, False)
+        ]
+
         return cls
 
 
@@ -185,11 +252,73 @@ class BaseNode(pydantic.BaseModel, metaclass=NodeMetaclass):
 
     __node_impl_fields__: ClassVar[NodeImplFieldMetadataDict]
     __node_children__: ClassVar[NodeChildrenMetadataDict]
+    __node_trusted_pre_root_validators__: ClassVar[List[AnyCallable]]
+    __node_trusted_post_root_validators__: ClassVar[List[AnyCallable]]
 
     # Node fields
     #: Unique node-id (implementation field)
     id_: Optional[Str] = None
 
+    #: Symbols defined in the subtree (maintained by :class:`eve.traits.SymbolTableTrait`)
+    _symbols_cache_: Optional[Dict[str, Any]] = pydantic.PrivateAttr(None)
+
+    def __init__(__pydantic_self__, **data: Any) -> None:  # noqa: B902  # pydantic convention
+        if is_trusted_construction():
+            __pydantic_self__._trusted_init(data)
+        else:
+            super().__init__(**data)
+
+    def _trusted_init(self, data: Dict[str, Any]) -> None:
+        """Initialize the node like :meth:`pydantic.BaseModel.construct`, keeping derivations.
+
+        Container values are converted to the declared container types.
+        """
+        cls = self.__class__
+        fields_set = set(data.keys())
+        for validator in cls.__node_trusted_pre_root_validators__:
+            data = validator(cls, data)
+
+        values = {}
+        for name, model_field in cls.__fields__.items():
+            if model_field.alt_alias and model_field.alias in data:
+                value = data[model_field.alias]
+            elif name in data:
+                value = data[name]
+            else:
+                if not model_field.required:
+                    values[name] = model_field.get_default()
+                continue
+            # only the container is coerced, the items are trusted
+            container_type = _TRUSTED_CONTAINER_TYPES.get(model_field.shape, None)
+            if container_type is not None and value is not None:
+                if not isinstance(value, container_type):
+                    value = container_type(value)
+            values[name] = value
+        if values.get("id_", None) is None:
+            values["id_"] = utils.UIDGenerator.sequential_id(prefix=cls.__qualname__)
+
+        for validator in cls.__node_trusted_post_root_validators__:
+            values = validator(cls, values)
+
+        object.__setattr__(self, "__dict__", values)
+        object.__setattr__(self, "__fields_set__", fields_set)
+        self._init_private_attributes()
+
+    # The cached symbols are only valid for this node instance and its current children
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        object.__setattr__(self, "_symbols_cache_", None)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state["__private_attribute_values__"]["_symbols_cache_"] = None
+        return state
+
+    def _copy_and_set_values(self: AnyNode, *args: Any, **kwargs: Any) -> AnyNode:
+        result = super()._copy_and_set_values(*args, **kwargs)
+        object.__setattr__(result, "_symbols_cache_", None)
+        return result
+
     @pydantic.validator("id_", pre=True, always=True)
     def _id_validator(cls: Type[AnyNode], v: Optional[str]) -> str:  # type: ignore  # validators are classmethods
         if v is None:
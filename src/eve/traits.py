@@ -19,47 +19,76 @@
 
 from __future__ import annotations
 
+import collections.abc
+import functools
+
 import pydantic
 
-from . import concepts, visitors
+from . import concepts, iterators, utils
 from .type_definitions import SymbolName
-from .typingx import Any, Dict, Type
+from .typingx import Any, Dict, Iterable, Tuple, Type
+
+
+@functools.lru_cache(maxsize=None)
+def _symbol_name_fields(node_class: Type[concepts.Node]) -> Tuple[str, ...]:
+    return tuple(
+        name
+        for name, metadata in node_class.__node_children__.items()
+        if isinstance(metadata["definition"].type_, type)
+        and issubclass(metadata["definition"].type_, SymbolName)
+    )
 
 
-class _CollectSymbols(visitors.NodeVisitor):
-    def __init__(self) -> None:
-        self.collected: Dict[str, Any] = {}
+def _node_symbols(node: concepts.Node) -> Dict[str, Any]:
+    """Return the symbols defined by a node and, if it does not open a new scope, its children.
 
-    def visit_Node(self, node: concepts.Node) -> None:
-        for name, metadata in node.__node_children__.items():
-            if isinstance(metadata["definition"].type_, type) and issubclass(
-                metadata["definition"].type_, SymbolName
-            ):
-                self.collected[getattr(node, name)] = node
+    The result is cached in the node, so unchanged subtrees are not traversed again
+    when the symbol table of a new parent scope is collected.
+    """
+    symbols = node._symbols_cache_
+    if symbols is None:
+        symbols = {getattr(node, name): node for name in _symbol_name_fields(node.__class__)}
         if not isinstance(node, SymbolTableTrait):
             # don't recurse into a new scope (i.e. node with SymbolTableTrait)
-            self.generic_visit(node)
+            symbols.update(_collect_children_symbols(node.iter_children_values()))
+        object.__setattr__(node, "_symbols_cache_", symbols)
+    return symbols
 
-    @classmethod
-    def apply(cls, node: concepts.TreeNode) -> Dict[str, Any]:
-        instance = cls()
-        instance.generic_visit(node)
-        return instance.collected
+
+def _collect_children_symbols(children: Iterable[Any]) -> Dict[str, Any]:
+    collected: Dict[str, Any] = {}
+    for child in children:
+        if isinstance(child, concepts.Node):
+            collected.update(_node_symbols(child))
+        elif isinstance(child, collections.abc.Collection) and utils.is_collection(child):
+            collected.update(_collect_children_symbols(iterators.generic_iter_children(child)))
+    return collected
 
 
 class SymbolTableTrait(concepts.Model):
+    """Node trait adding a symbol table with the symbols defined in the node scope.
+
+    The symbols defined in each subtree are cached in its root node and merged
+    into the symbol table of new parent nodes. If nodes of the tree are modified
+    in place, :meth:`collect_symbols` should be called to collect the symbols again.
+    """
+
     symtable_: Dict[str, Any] = pydantic.Field(default_factory=dict)
 
     @staticmethod
     def _collect_symbols(root_node: concepts.TreeNode) -> Dict[str, Any]:
-        return _CollectSymbols.apply(root_node)
+        return _collect_children_symbols(iterators.generic_iter_children(root_node))
 
     @pydantic.root_validator(skip_on_failure=True)
     def _collect_symbols_validator(  # type: ignore  # validators are classmethods
         cls: Type[SymbolTableTrait], values: Dict[str, Any]
     ) -> Dict[str, Any]:
-        values["symtable_"] = cls._collect_symbols(values)
+        values["symtable_"] = _collect_children_symbols(
+            values[name] for name in cls.__node_children__ if name in values  # type: ignore
+        )
         return values
 
     def collect_symbols(self) -> None:
+        for node in iterators.iter_tree_pre(self).if_isinstance(concepts.Node):
+            object.__setattr__(node, "_symbols_cache_", None)
         self.symtable_ = self._collect_symbols(self)
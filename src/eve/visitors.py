@@ -28,12 +28,14 @@ from .concepts import NOTHING
 from .typingx import (
     Any,
     Callable,
+    ClassVar,
     Collection,
     Dict,
     Iterable,
     MutableSequence,
     MutableSet,
     Tuple,
+    Type,
     Union,
 )
 
@@ -64,7 +66,10 @@ class NodeVisitor:
         3. ``self.generic_visit()``.
 
     This dispatching mechanism is implemented in the main :meth:`visit`
-    method and can be overriden in subclasses.
+    method and can be overriden in subclasses. The name of the visitor
+    function is resolved once per node class and cached in the visitor
+    class, so visitor functions should not be added to instances or to
+    visitor classes after their first use.
 
     Note that return values are not forwarded to the caller in the default
     :meth:`generic_visit` implementation. If you want to return a value from
@@ -102,23 +107,36 @@ class NodeVisitor:
 
     """
 
-    def visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
-        visitor = self.generic_visit
-
-        method_name = "visit_" + node.__class__.__name__
-        if hasattr(self, method_name):
-            visitor = getattr(self, method_name)
-        elif isinstance(node, concepts.Node):
-            for node_class in node.__class__.__mro__[1:]:
-                method_name = "visit_" + node_class.__name__
-                if hasattr(self, method_name):
-                    visitor = getattr(self, method_name)
-                    break
+    _dispatch_table_: ClassVar[Dict[Type, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore  # mypy issues 4335, 4660
+        cls._dispatch_table_ = {}
 
-                if node_class is concepts.Node:
+    def visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
+        node_class = node.__class__
+        try:
+            method_name = self._dispatch_table_[node_class]
+        except KeyError:
+            method_name = self._dispatch_table_[node_class] = self._find_visitor_name(node_class)
+
+        return getattr(self, method_name)(node, **kwargs)
+
+    @classmethod
+    def _find_visitor_name(cls, node_class: Type) -> str:
+        method_name = "visit_" + node_class.__name__
+        if hasattr(cls, method_name):
+            return method_name
+        elif issubclass(node_class, concepts.Node):
+            for base_class in node_class.__mro__[1:]:
+                method_name = "visit_" + base_class.__name__
+                if hasattr(cls, method_name):
+                    return method_name
+
+                if base_class is concepts.Node:
                     break
 
-        return visitor(node, **kwargs)
+        return "generic_visit"
 
     def generic_visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
         for child in iterators.generic_iter_children(node):
@@ -140,6 +158,14 @@ class NodeTranslator(NodeVisitor):
     you must either transform the child nodes yourself or call the
     :meth:`generic_visit` method for the node first.
 
+    If the :attr:`reuse_unchanged_nodes` class attribute is set, leaf values
+    are not copied and :meth:`generic_visit` returns the original node or
+    collection when all its children are returned unchanged, so the output
+    tree shares the unchanged subtrees with the input tree (new nodes built
+    with full validation hold copies of their children though, see
+    :func:`eve.concepts.trusted_construction`). This is only safe if the
+    nodes of both trees are not modified in place afterwards.
+
     Usually you use a NodeTranslator like this::
 
        output_node = YourTranslator.apply(input_node)
@@ -149,6 +175,8 @@ class NodeTranslator(NodeVisitor):
 
     """
 
+    reuse_unchanged_nodes: ClassVar[bool] = False
+
     _memo_dict_: Dict[int, Any]
 
     def generic_visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
@@ -161,6 +189,10 @@ class NodeTranslator(NodeVisitor):
                 tmp_items = {
                     key: self.visit(value, **kwargs) for key, value in node.iter_children()
                 }
+                if self.reuse_unchanged_nodes and all(
+                    tmp_items[key] is value for key, value in node.iter_children()
+                ):
+                    return node
                 result = node.__class__(  # type: ignore
                     **{key: value for key, value in node.iter_impl_fields()},
                     **{key: value for key, value in tmp_items.items() if value is not NOTHING},
@@ -169,6 +201,10 @@ class NodeTranslator(NodeVisitor):
             elif isinstance(node, (collections.abc.Sequence, collections.abc.Set)):
                 # Sequence or set: create a new container instance with the new values
                 tmp_items = [self.visit(value, **kwargs) for value in node]
+                if self.reuse_unchanged_nodes and all(
+                    new_value is value for new_value, value in zip(tmp_items, node)
+                ):
+                    return node
                 result = node.__class__(  # type: ignore
                     value for value in tmp_items if value is not NOTHING
                 )
@@ -176,10 +212,17 @@ class NodeTranslator(NodeVisitor):
             elif isinstance(node, collections.abc.Mapping):
                 # Mapping: create a new mapping instance with the new values
                 tmp_items = {key: self.visit(value, **kwargs) for key, value in node.items()}
+                if self.reuse_unchanged_nodes and all(
+                    tmp_items[key] is value for key, value in node.items()
+                ):
+                    return node
                 result = node.__class__(  # type: ignore
                     {key: value for key, value in tmp_items.items() if value is not NOTHING}
                 )
 
+        elif self.reuse_unchanged_nodes:
+            result = node
+
         else:
             if not hasattr(self, "_memo_dict_"):
                 self._memo_dict_ = {}
@@ -282,3 +325,13 @@ class NodeMutator(NodeVisitor):
                     set_op(result, key, new_value)
 
         return result
+
+
+def validate_tree(node: concepts.TreeNode) -> concepts.TreeNode:
+    """Rebuild a tree with full validation of its nodes.
+
+    Meant to be used at the boundaries of pipelines built in
+    :func:`eve.concepts.trusted_construction` mode.
+    """
+    with concepts.trusted_construction(False):
+        return NodeTranslator().visit(node)
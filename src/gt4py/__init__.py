@@ -55,6 +55,6 @@ from . import storage
 from . import caching
 
 from .definitions import AccessKind, Boundary, DomainInfo, FieldInfo, ParameterInfo, CartesianSpace
-from .stencil_object import StencilObject
+from .stencil_object import StencilCall, StencilObject
 
 # isort: on
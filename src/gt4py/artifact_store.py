@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Content-addressed store of stencil build artifacts shared between cache directories.
+
+The JIT cache layout depends on the cache root path and the Python version, so identical
+stencils built from different working directories end up in different cache entries.
+The artifact store keeps a copy of the generated module, the extension sources and the
+compiled extension of every stencil under a key derived from its content, such that
+any cache directory can be populated from the store instead of regenerating the stencil.
+
+The store is enabled by setting ``gt4py.config.cache_settings["artifact_store_path"]``
+(environment variable ``GT_ARTIFACT_STORE``). Its size is bounded by
+``cache_settings["artifact_store_max_size"]`` (in bytes, ``GT_ARTIFACT_STORE_MAX_SIZE``),
+least recently used entries are evicted first.
+"""
+
+import json
+import os
+import pathlib
+import shutil
+import sysconfig
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from gt4py import config as gt_config
+from gt4py import utils as gt_utils
+
+
+if TYPE_CHECKING:
+    from gt4py.stencil_builder import StencilBuilder
+
+
+#: Build settings which do not affect the compiled artifacts
+_NON_ARTIFACT_BUILD_SETTINGS = ("parallel_jobs",)
+
+#: Suffixes of the extension source files stored together with the compiled extension
+_PYEXT_SOURCE_SUFFIXES = (".c", ".cc", ".cpp", ".cu", ".h", ".hpp")
+
+
+class ArtifactStore:
+    """
+    Content-addressed store of stencil modules and compiled extensions.
+
+    Each entry is a directory named after the artifact key, containing the stencil files
+    and a ``manifest.json`` file. Entries are written into a temporary directory and renamed
+    into place, so that concurrent readers (possibly of other users) only see complete
+    entries. The modification time of the manifest is used for the LRU eviction.
+
+    Parameters
+    ----------
+    path :
+        Root directory of the store, created if necessary.
+
+    max_size :
+        Maximum total size of the stored files in bytes, unbounded if None.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, path: Union[str, pathlib.Path], *, max_size: Optional[int] = None):
+        self.path = pathlib.Path(path)
+        self.max_size = max_size
+
+    @classmethod
+    def from_settings(cls) -> Optional["ArtifactStore"]:
+        """Create the store configured in :py:data:`gt4py.config.cache_settings` if any."""
+        path = gt_config.cache_settings.get("artifact_store_path", None)
+        if not path:
+            return None
+        return cls(path, max_size=gt_config.cache_settings.get("artifact_store_max_size", None))
+
+    @staticmethod
+    def compiler_settings_id() -> str:
+        """Hash the build settings and the Python ABI which the compiled extensions depend on."""
+        settings = {
+            key: value
+            for key, value in gt_config.build_settings.items()
+            if key not in _NON_ARTIFACT_BUILD_SETTINGS
+        }
+        return gt_utils.shashed_id(settings, sysconfig.get_config_var("EXT_SUFFIX"))
+
+    def make_key(self, builder: "StencilBuilder") -> str:
+        """
+        Compute the artifact key of a stencil.
+
+        The stencil fingerprint already accounts for the (backend-filtered) build options.
+        """
+        stencil_id = builder.stencil_id
+        return gt_utils.shashed_id(
+            stencil_id.qualified_name,
+            stencil_id.version,
+            builder.backend.name,
+            self.compiler_settings_id(),
+            length=32,
+        )
+
+    def entry_path(self, key: str) -> pathlib.Path:
+        return self.path / key
+
+    @staticmethod
+    def _collect_files(builder: "StencilBuilder") -> List[pathlib.Path]:
+        """Collect the files of a generated stencil (relative to its package path)."""
+        files = [builder.module_path]
+        pyext_file_path = builder.backend_data.get("pyext_file_path", None)
+        if pyext_file_path:
+            files.append(pathlib.Path(pyext_file_path))
+        pyext_build_dir_path = getattr(builder.backend, "pyext_build_dir_path", None)
+        if pyext_build_dir_path is not None and pyext_build_dir_path.is_dir():
+            files.extend(
+                path
+                for path in sorted(pyext_build_dir_path.iterdir())
+                if path.is_file() and path.suffix in _PYEXT_SOURCE_SUFFIXES
+            )
+        return files
+
+    def store(self, builder: "StencilBuilder") -> Optional[pathlib.Path]:
+        """
+        Copy the files of a freshly generated stencil into the store.
+
+        Returns
+        -------
+            The path of the store entry, or None if the stencil files are not available.
+        """
+        key = self.make_key(builder)
+        entry_path = self.entry_path(key)
+        if entry_path.exists():
+            self._touch(entry_path)
+            return entry_path
+
+        pkg_path = builder.pkg_path
+        files = self._collect_files(builder)
+        if not all(file_path.exists() for file_path in files):
+            return None
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_path = pathlib.Path(tempfile.mkdtemp(dir=self.path, prefix=f".{key}."))
+        try:
+            relative_paths = []
+            for file_path in files:
+                relative_path = file_path.relative_to(pkg_path)
+                (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(file_path, tmp_path / relative_path)
+                relative_paths.append(str(relative_path))
+
+            pyext_file_path = builder.backend_data.get("pyext_file_path", None)
+            manifest = {
+                "key": key,
+                "stencil_name": builder.stencil_id.qualified_name,
+                "stencil_version": builder.stencil_id.version,
+                "backend": builder.backend.name,
+                "pkg_path": str(pkg_path),
+                "module_file": str(builder.module_path.relative_to(pkg_path)),
+                "pyext_file": str(pathlib.Path(pyext_file_path).relative_to(pkg_path))
+                if pyext_file_path
+                else None,
+                "files": relative_paths,
+                "size": sum(file_path.stat().st_size for file_path in files),
+            }
+            (tmp_path / self.MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+            os.rename(tmp_path, entry_path)
+        except OSError:
+            # the same entry has been stored concurrently, or the store is not writable
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            if not entry_path.exists():
+                raise
+
+        self.evict(keep=(key,))
+        return entry_path
+
+    def restore(self, builder: "StencilBuilder") -> bool:
+        """
+        Populate the cache entry of a stencil from the store.
+
+        The absolute package path recorded in the generated module is replaced by
+        the one of the new cache entry and the cache info is regenerated.
+
+        Returns
+        -------
+            True if the stencil was found in the store and restored.
+        """
+        entry_path = self.entry_path(self.make_key(builder))
+        try:
+            manifest = json.loads((entry_path / self.MANIFEST_NAME).read_text())
+            pkg_path = builder.pkg_path
+            pkg_path.mkdir(parents=True, exist_ok=True)
+            for relative_path in manifest["files"]:
+                target_path = pkg_path / relative_path
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                if relative_path == manifest["module_file"]:
+                    source = (entry_path / relative_path).read_text()
+                    source = source.replace(manifest["pkg_path"], str(pkg_path))
+                    gt_utils.write_file_atomically(target_path, source)
+                else:
+                    shutil.copy2(entry_path / relative_path, target_path)
+        except (OSError, ValueError, KeyError):
+            # missing, concurrently evicted or invalid entry
+            return False
+
+        if manifest["pyext_file"]:
+            builder.with_backend_data({"pyext_file_path": str(pkg_path / manifest["pyext_file"])})
+        builder.caching.update_cache_info()
+        self._touch(entry_path)
+        return True
+
+    def _touch(self, entry_path: pathlib.Path) -> None:
+        try:
+            os.utime(entry_path / self.MANIFEST_NAME)
+        except OSError:
+            pass
+
+    def entries(self) -> List[Tuple[pathlib.Path, Dict[str, Any], float]]:
+        """List the entries with their manifests and last access times, oldest first."""
+        result = []
+        for entry_path in self.path.iterdir() if self.path.is_dir() else []:
+            manifest_path = entry_path / self.MANIFEST_NAME
+            try:
+                manifest = json.loads(manifest_path.read_text())
+                result.append((entry_path, manifest, manifest_path.stat().st_mtime))
+            except (OSError, ValueError):
+                continue
+        return sorted(result, key=lambda item: item[2])
+
+    @property
+    def size(self) -> int:
+        """Total size of the stored files in bytes."""
+        return sum(manifest["size"] for _, manifest, _ in self.entries())
+
+    def evict(self, *, keep: Tuple[str, ...] = ()) -> int:
+        """
+        Remove the least recently used entries until the store fits its maximum size.
+
+        Returns
+        -------
+            The number of removed entries.
+        """
+        if self.max_size is None:
+            return 0
+
+        entries = self.entries()
+        size = sum(manifest["size"] for _, manifest, _ in entries)
+        removed = 0
+        for entry_path, manifest, _ in entries:
+            if size <= self.max_size:
+                break
+            if manifest["key"] in keep:
+                continue
+            # rename first, readers never see a partially removed entry
+            trash_path = self.path / f".{entry_path.name}.{os.getpid()}.{time.time_ns()}.deleted"
+            try:
+                os.rename(entry_path, trash_path)
+            except OSError:
+                continue
+            shutil.rmtree(trash_path, ignore_errors=True)
+            size -= manifest["size"]
+            removed += 1
+        return removed
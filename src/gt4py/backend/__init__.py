@@ -14,6 +14,9 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import importlib.util
+
+
 # Disable isort to avoid circular imports
 # isort: off
 from .base import *
@@ -34,4 +37,7 @@ try:
 except ImportError:
     pass  # dawn4py not installed
 
+if importlib.util.find_spec("numba") is not None:
+    from .numba_backend import *
+
 from . import python_generator
@@ -26,6 +26,7 @@ import jinja2
 
 from gt4py import definitions as gt_definitions
 from gt4py import ir as gt_ir
+from gt4py import profiling
 from gt4py import utils as gt_utils
 
 from . import pyext_builder
@@ -234,6 +235,9 @@ class BaseBackend(Backend):
 
     MODULE_GENERATOR_CLASS: ClassVar[Type["BaseModuleGenerator"]]
 
+    #: Register the generated modules in :py:data:`sys.modules` (under the stencil class name)
+    PUBLIC_MODULE_IMPORT: ClassVar[bool] = False
+
     def load(self) -> Optional[Type["StencilObject"]]:
         stencil_class = None
         if self.builder.stencil_id is not None:
@@ -255,12 +259,19 @@ class BaseBackend(Backend):
     def _load(self) -> Type["StencilObject"]:
         stencil_class_name = self.builder.class_name
         file_name = str(self.builder.module_path)
-        stencil_module = gt_utils.make_module_from_file(stencil_class_name, file_name)
+        stencil_module = gt_utils.make_module_from_file(
+            stencil_class_name, file_name, public_import=self.PUBLIC_MODULE_IMPORT
+        )
         stencil_class = getattr(stencil_module, stencil_class_name)
         stencil_class.__module__ = self.builder.module_qualname
         stencil_class._gt_id_ = self.builder.stencil_id.version
         stencil_class._file_name = file_name
-        stencil_class.definition_func = staticmethod(self.builder.definition)
+        stencil_class.definition_func = staticmethod(
+            # avoid preparing the definition for stencils loaded through the fast index
+            self.builder.raw_definition
+            if self.builder.is_fast_index_hit
+            else self.builder.definition
+        )
 
         return stencil_class
 
@@ -279,7 +290,7 @@ class BaseBackend(Backend):
 
         if not self.builder.options._impl_opts.get("disable-code-generation", False):
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(module_source)
+            gt_utils.write_file_atomically(file_path, module_source)
             self.builder.caching.update_cache_info()
 
         return self._load()
@@ -432,10 +443,12 @@ class BasePyExtBackend(BaseBackend):
             **pyext_build_opts,
         )
 
-        if uses_cuda:
-            module_name, file_path = pyext_builder.build_pybind_cuda_ext(**pyext_build_args)
-        else:
-            module_name, file_path = pyext_builder.build_pybind_ext(**pyext_build_args)
+        with profiling.phase(self.builder.options.build_info, "build_extension_module") as phase:
+            phase.add_info(sources=len(sources))
+            if uses_cuda:
+                module_name, file_path = pyext_builder.build_pybind_cuda_ext(**pyext_build_args)
+            else:
+                module_name, file_path = pyext_builder.build_pybind_ext(**pyext_build_args)
 
         assert module_name == qualified_pyext_name
 
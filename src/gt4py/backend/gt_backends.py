@@ -27,6 +27,7 @@ from gt4py import backend as gt_backend
 from gt4py import definitions as gt_definitions
 from gt4py import gt_src_manager
 from gt4py import ir as gt_ir
+from gt4py import profiling
 from gt4py import utils as gt_utils
 from gt4py.utils import text as gt_text
 
@@ -635,7 +636,8 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
         gt_pyext_generator = self.PYEXT_GENERATOR_CLASS(
             class_name, module_name, self.GT_BACKEND_T, self.builder.options
         )
-        gt_pyext_sources = gt_pyext_generator(ir)
+        with profiling.phase(self.builder.options.build_info, "codegen"):
+            gt_pyext_sources = gt_pyext_generator(ir)
         final_ext = ".cu" if self.languages and self.languages["computation"] == "cuda" else ".cpp"
         comp_src = gt_pyext_sources["computation"]
         for key in [k for k in comp_src.keys() if k.endswith(".src")]:
@@ -16,10 +16,11 @@
 
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
 
+import eve
 from eve import codegen
 from eve.codegen import MakoTemplate as as_mako
 from gt4py import backend as gt_backend
-from gt4py import gt_src_manager
+from gt4py import gt_src_manager, profiling
 from gt4py.backend import BaseGTBackend, CLIBackendMixin
 from gt4py.backend.gt_backends import (
     GTCUDAPyModuleGenerator,
@@ -55,23 +56,51 @@ class GTCGTExtGenerator:
         self.options = options
 
     def __call__(self, definition_ir) -> Dict[str, Dict[str, str]]:
-        gtir = DefIRToGTIR.apply(definition_ir)
-        gtir_without_unused_params = prune_unused_parameters(gtir)
-        dtype_deduced = resolve_dtype(gtir_without_unused_params)
-        upcasted = upcast(dtype_deduced)
-        oir = gtir_to_oir.GTIRToOIR().visit(upcasted)
-        oir = self._optimize_oir(oir)
-        gtcpp = oir_to_gtcpp.OIRToGTCpp().visit(oir)
-        implementation = gtcpp_codegen.GTCppCodegen.apply(gtcpp, gt_backend_t=self.gt_backend_t)
-        bindings = GTCppBindingsCodegen.apply(
-            gtcpp, module_name=self.module_name, gt_backend_t=self.gt_backend_t
-        )
+        build_info = self.options.build_info
+        gtcpp = self._lower(definition_ir)
+        with profiling.phase(build_info, "gtc.codegen"):
+            implementation = gtcpp_codegen.GTCppCodegen.apply(
+                gtcpp, gt_backend_t=self.gt_backend_t, format_source=False
+            )
+            bindings = GTCppBindingsCodegen.apply(
+                gtcpp,
+                module_name=self.module_name,
+                gt_backend_t=self.gt_backend_t,
+                format_source=False,
+            )
+        with profiling.phase(build_info, "gtc.format_source"):
+            implementation = codegen.format_source("cpp", implementation, style="LLVM")
+            bindings = codegen.format_source("cpp", bindings, style="LLVM")
         bindings_ext = ".cu" if self.gt_backend_t == "gpu" else ".cpp"
         return {
             "computation": {"computation.hpp": implementation},
             "bindings": {"bindings" + bindings_ext: bindings},
         }
 
+    def _lower(self, definition_ir):
+        build_info = self.options.build_info
+        with profiling.phase(build_info, "gtc.defir_to_gtir") as phase:
+            gtir = DefIRToGTIR.apply(definition_ir)
+            phase.count_nodes(gtir)
+        # the lowering passes start from a validated tree: check the result only once
+        with eve.trusted_construction():
+            with profiling.phase(build_info, "gtc.gtir_passes") as phase:
+                gtir_without_unused_params = prune_unused_parameters(gtir)
+                dtype_deduced = resolve_dtype(gtir_without_unused_params)
+                upcasted = upcast(dtype_deduced)
+                phase.count_nodes(upcasted)
+            with profiling.phase(build_info, "gtc.gtir_to_oir") as phase:
+                oir = gtir_to_oir.GTIRToOIR().visit(upcasted)
+                phase.count_nodes(oir)
+            with profiling.phase(build_info, "gtc.oir_optimizations") as phase:
+                oir = self._optimize_oir(oir)
+                phase.count_nodes(oir)
+            with profiling.phase(build_info, "gtc.oir_to_gtcpp") as phase:
+                gtcpp = oir_to_gtcpp.OIRToGTCpp().visit(oir)
+                phase.count_nodes(gtcpp)
+        with profiling.phase(build_info, "gtc.validation"):
+            return eve.validate_tree(gtcpp)
+
     def _optimize_oir(self, oir):
         oir = GreedyMerging().visit(oir)
         oir = TemporariesToScalars().visit(oir)
@@ -172,8 +201,10 @@ class GTCppBindingsCodegen(codegen.TemplatedGenerator):
     )
 
     @classmethod
-    def apply(cls, root, *, module_name="stencil", **kwargs) -> str:
+    def apply(cls, root, *, module_name="stencil", format_source=True, **kwargs) -> str:
         generated_code = cls().visit(root, module_name=module_name, **kwargs)
+        if not format_source:
+            return generated_code
         formatted_code = codegen.format_source("cpp", generated_code, style="LLVM")
         return formatted_code
 
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+from gt4py import backend as gt_backend
+from gt4py import definitions as gt_definitions
+from gt4py import ir as gt_ir
+from gt4py.utils import text as gt_text
+
+from .python_generator import PythonSourceGenerator
+
+
+class NumbaSourceGenerator(PythonSourceGenerator):
+    """Generate the body of a function computing the stencil with explicit loops.
+
+    The loops over the parallel axes enclose the vertical loops of every stage, the
+    outermost one is a ``numba.prange`` loop. Since fields written in a stage are never
+    read at horizontal offsets in the same stage, this column-wise evaluation is
+    equivalent to the level-wise evaluation of the other backends.
+    """
+
+    def __init__(self, *args, parallel: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parallel = parallel
+
+    def make_temporary_field(
+        self, name: str, dtype: gt_ir.DataType, extent: gt_definitions.Extent
+    ) -> List[str]:
+        source_lines = super().make_temporary_field(name, dtype, extent)
+        source_lines.append(
+            "{name}{marker} = {origin}".format(
+                name=name,
+                marker=self.origin_marker,
+                origin=tuple(extent.to_boundary().lower_indices),
+            )
+        )
+
+        return source_lines
+
+    def make_stage_source(self, iteration_order: gt_ir.IterationOrder, regions: list) -> List[str]:
+        extent = self.block_info.extent
+        lower_extent = extent.lower_indices
+        upper_extent = extent.upper_indices
+        seq_axis_name = self.domain.sequential_axis.name
+
+        # Loops over the parallel axes, in the order of the storage layout (the sequential
+        # axis being the innermost one)
+        source_lines = []
+        indent = ""
+        for d, axis_name in enumerate(self.domain.axes_names):
+            if axis_name == seq_axis_name:
+                continue
+            start_expr = "{:d}".format(lower_extent[d])
+            size_expr = "{dom}[{d}]".format(dom=self.domain_arg_name, d=d)
+            size_expr += " {:+d}".format(upper_extent[d]) if upper_extent[d] != 0 else ""
+            range_func = "numba.prange" if self.parallel and not source_lines else "range"
+            source_lines.append(
+                "{indent}for {ax} in {range_func}({start}, {size}):".format(
+                    indent=indent,
+                    ax=axis_name,
+                    range_func=range_func,
+                    start=start_expr,
+                    size=size_expr,
+                )
+            )
+            indent += " " * self.indent_size
+
+        # Vertical loops: computation body is split in different vertical regions
+        assert sorted(regions, reverse=iteration_order == gt_ir.IterationOrder.BACKWARD) == regions
+
+        for bounds, body_sources in regions:
+            loop_bounds = [None, None]
+            for r, bound in enumerate(bounds):
+                loop_bounds[r] = "{}".format(self.k_splitters_value[bound[0]])
+                if bound[1]:
+                    loop_bounds[r] += "{:+d}".format(bound[1])
+
+            if iteration_order != gt_ir.IterationOrder.BACKWARD:
+                range_args = loop_bounds
+            else:
+                range_args = [loop_bounds[1] + " -1", loop_bounds[0] + " -1", "-1"]
+
+            source_lines.append(
+                "{indent}for {ax} in range({args}):".format(
+                    indent=indent, ax=seq_axis_name, args=", ".join(range_args)
+                )
+            )
+            source_lines.extend(indent + " " * self.indent_size + line for line in body_sources)
+
+        return source_lines
+
+    # ---- Visitor handlers ----
+    def visit_FieldRef(self, node: gt_ir.FieldRef) -> str:
+        assert node.name in self.block_info.accessors
+        index = []
+        for d, ax in enumerate(self.impl_node.fields[node.name].axes):
+            offset = node.offset.get(ax, 0)
+            index.append(
+                "{name}{marker}[{d}] + {ax}{offset}".format(
+                    name=node.name,
+                    marker=self.origin_marker,
+                    d=d,
+                    ax=ax,
+                    offset=" {:+d}".format(offset) if offset else "",
+                )
+            )
+
+        return "{name}[{index}]".format(name=node.name, index=", ".join(index))
+
+    def visit_TernaryOpExpr(self, node: gt_ir.TernaryOpExpr) -> str:
+        then_fmt = "({})" if isinstance(node.then_expr, gt_ir.CompositeExpr) else "{}"
+        else_fmt = "({})" if isinstance(node.else_expr, gt_ir.CompositeExpr) else "{}"
+        source = "{np}.{dtype}({then_expr} if {condition} else {else_expr})".format(
+            condition=self.visit(node.condition),
+            then_expr=then_fmt.format(self.visit(node.then_expr)),
+            else_expr=else_fmt.format(self.visit(node.else_expr)),
+            dtype=node.data_type.dtype.name,
+            np=self.numpy_prefix,
+        )
+
+        return source
+
+    def visit_If(self, node: gt_ir.If) -> List[str]:
+        body_sources = gt_text.TextBlock(indent_size=self.indent_size)
+        body_sources.append("if {condition}:".format(condition=self.visit(node.condition)))
+        body_sources.indent()
+        for stmt in node.main_body.stmts:
+            body_sources.extend(self.visit(stmt))
+        body_sources.dedent()
+        if node.else_body:
+            body_sources.append("else:")
+            body_sources.indent()
+            for stmt in node.else_body.stmts:
+                body_sources.extend(self.visit(stmt))
+            body_sources.dedent()
+
+        return ["".join([str(item) for item in line]) for line in body_sources.lines]
+
+
+class NumbaModuleGenerator(gt_backend.BaseModuleGenerator):
+    #: Name of the compiled function computing the stencil
+    COMPUTATION_FUNC_NAME = "_gt_computation_"
+
+    def __init__(self):
+        super().__init__()
+        self.source_generator = NumbaSourceGenerator(
+            indent_size=self.TEMPLATE_INDENT_SIZE,
+            origin_marker="__O",
+            domain_arg_name=self.DOMAIN_ARG_NAME,
+            origin_arg_name=self.ORIGIN_ARG_NAME,
+            splitters_name=self.SPLITTERS_NAME,
+            numpy_prefix="np",
+        )
+
+    @property
+    def computation_args(self) -> List[Tuple[str, bool]]:
+        """Names of the arguments of the computation function, flagged if they are fields."""
+        implementation_ir = self.builder.implementation_ir
+        return [
+            (info.name, info.name in implementation_ir.fields)
+            for info in implementation_ir.api_signature
+            if info.name not in implementation_ir.unreferenced
+        ]
+
+    def generate_imports(self) -> str:
+        source = """
+import math
+
+import numba
+"""
+        threading_layer = self.builder.options.backend_opts.get("threading_layer", None)
+        if threading_layer is not None:
+            source += f"""
+numba.config.THREADING_LAYER = {threading_layer!r}
+"""
+        return source
+
+    def generate_module_members(self) -> str:
+        implementation_ir = self.builder.implementation_ir
+        if not implementation_ir.has_effect:
+            return ""
+
+        self.source_generator.parallel = self.builder.options.backend_opts.get("parallel", True)
+        args = [self.DOMAIN_ARG_NAME]
+        for name, is_field in self.computation_args:
+            args.append(name)
+            if is_field:
+                args.append(f"{name}{self.source_generator.origin_marker}")
+
+        sources = gt_text.TextBlock(indent_size=self.TEMPLATE_INDENT_SIZE)
+        sources.append(
+            "@numba.njit(parallel={parallel}, cache=True)".format(
+                parallel=self.source_generator.parallel
+            )
+        )
+        sources.append(
+            "def {name}({args}):".format(name=self.COMPUTATION_FUNC_NAME, args=", ".join(args))
+        )
+        sources.indent()
+        self.source_generator(implementation_ir, sources)
+        sources.dedent()
+
+        return sources.text
+
+    def generate_implementation(self) -> str:
+        if not self.builder.implementation_ir.has_effect:
+            return "\n"
+
+        args = [f"tuple({self.DOMAIN_ARG_NAME})"]
+        for name, is_field in self.computation_args:
+            if is_field:
+                args.append(f"{name}.view(np.ndarray)")
+                args.append(f"tuple({self.ORIGIN_ARG_NAME}['{name}'])")
+            else:
+                args.append(name)
+
+        return "{name}({args})\n".format(name=self.COMPUTATION_FUNC_NAME, args=", ".join(args))
+
+
+def numba_layout(mask: Tuple[int, ...]) -> Tuple[Optional[int], ...]:
+    ctr = iter(range(sum(mask)))
+    layout = [next(ctr) if m else None for m in mask]
+    return tuple(layout)
+
+
+def numba_is_compatible_layout(field: Union[np.ndarray, Any]) -> bool:
+    return sum(field.shape) > 0
+
+
+def numba_is_compatible_type(field: Any) -> bool:
+    return isinstance(field, np.ndarray)
+
+
+@gt_backend.register
+class NumbaBackend(gt_backend.BaseBackend, gt_backend.PurePythonBackendCLIMixin):
+    """Python backend compiling explicit loops with Numba.
+
+    The loops over the parallel axes are distributed over threads with ``numba.prange``.
+    The storage layout is the C layout, so the vertical loops are the innermost ones.
+    Compiled functions are cached by Numba in the ``__pycache__`` directory next to the
+    generated module.
+
+    Other Parameters
+    ----------------
+    Backend options include:
+
+    parallel: `bool`
+        If False, compile the loops without threading. (`True` by default.)
+    threading_layer: `str`
+        Numba threading layer set when the stencil module is loaded, it only applies if
+        no parallel Numba function has run yet in the process and it affects all Numba
+        code of the process. Programs forking worker processes (e.g. parallel builds of
+        gtpyc and gtscript imports) after running parallel stencils should use a
+        fork-safe layer such as ``"workqueue"``, which is however not thread-safe.
+        (Numba configuration by default.)
+    """
+
+    name = "numba"
+    options = {
+        "parallel": {"versioning": True, "type": bool},
+        "threading_layer": {"versioning": True, "type": str},
+    }
+    storage_info = {
+        "alignment": 1,
+        "device": "cpu",
+        "layout_map": numba_layout,
+        "is_compatible_layout": numba_is_compatible_layout,
+        "is_compatible_type": numba_is_compatible_type,
+    }
+
+    languages = {"computation": "python", "bindings": []}
+
+    MODULE_GENERATOR_CLASS = NumbaModuleGenerator
+
+    # Numba looks up the globals of compiled functions by module name
+    PUBLIC_MODULE_IMPORT = True
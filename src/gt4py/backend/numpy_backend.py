@@ -16,6 +16,8 @@
 
 import copy
 import textwrap
+import threading
+import types
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -97,6 +99,44 @@ class NumpyIR(gt_ir.IRNodeMapper):
             return True, final_class(axes=axes, expr=new_node)
 
 
+def _unshaped(node: gt_ir.Expr) -> gt_ir.Expr:
+    return node.expr if isinstance(node, ShapedExpr) else node
+
+
+class _AccessCollector(gt_ir.IRNodeVisitor):
+    """Collect the field and variable accesses of the statements of an apply block, in order."""
+
+    @classmethod
+    def apply(cls, node: gt_ir.Node, local_symbols) -> "_AccessCollector":
+        collector = cls(local_symbols)
+        collector.visit(node)
+        return collector
+
+    def __init__(self, local_symbols):
+        self.local_symbols = local_symbols
+        self.field_reads: List[gt_ir.FieldRef] = []
+        self.field_writes: List[str] = []
+        self.var_reads: List[str] = []
+        self.defined_vars = set()
+        self.reads_undefined_vars = False
+
+    def visit_Assign(self, node: gt_ir.Assign):
+        self.visit(node.value)
+        target = _unshaped(node.target)
+        if isinstance(target, gt_ir.FieldRef):
+            self.field_writes.append(target.name)
+        else:
+            self.defined_vars.add(target.name)
+
+    def visit_FieldRef(self, node: gt_ir.FieldRef):
+        self.field_reads.append(node)
+
+    def visit_VarRef(self, node: gt_ir.VarRef):
+        self.var_reads.append(node.name)
+        if node.name in self.local_symbols and node.name not in self.defined_vars:
+            self.reads_undefined_vars = True
+
+
 class NumPySourceGenerator(PythonSourceGenerator):
     NATIVE_FUNC_TO_PYTHON = {
         gt_ir.NativeFunction.ABS: "np.abs",
@@ -120,12 +160,153 @@ class NumPySourceGenerator(PythonSourceGenerator):
         gt_ir.NativeFunction.TRUNC: "np.trunc",
     }
 
-    def __init__(self, *args, interval_k_start_name, interval_k_end_name, **kwargs):
+    #: Arithmetic binary operators evaluated as ufunc calls (accumulations for recurrences)
+    OP_TO_UFUNC = {
+        gt_ir.BinaryOperator.ADD: "add",
+        gt_ir.BinaryOperator.SUB: "subtract",
+        gt_ir.BinaryOperator.MUL: "multiply",
+        gt_ir.BinaryOperator.DIV: "divide",
+    }
+
+    #: Native functions of first-order recurrences evaluated as ufunc accumulations
+    SCAN_NATIVE_FUNC_TO_UFUNC = {
+        gt_ir.NativeFunction.MIN: "minimum",
+        gt_ir.NativeFunction.MAX: "maximum",
+    }
+
+    def __init__(
+        self,
+        *args,
+        interval_k_start_name,
+        interval_k_end_name,
+        vectorize_sequential=True,
+        temporaries_pool_name=None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.interval_k_start_name = interval_k_start_name
         self.interval_k_end_name = interval_k_end_name
+        self.vectorize_sequential = vectorize_sequential
+        self.temporaries_pool_name = temporaries_pool_name
         self.conditions_depth = 0
 
+    def _is_vectorized(self) -> bool:
+        return (
+            self.block_info.iteration_order == gt_ir.IterationOrder.PARALLEL
+            or self.block_info.vectorized
+        )
+
+    def _match_scan(
+        self, stmt: gt_ir.Statement
+    ) -> Optional[Tuple[str, gt_ir.FieldRef, gt_ir.Expr]]:
+        """Match statements of the form ``a = a[k -/+ 1] <op> expr`` (in iteration order).
+
+        Returns
+        -------
+            The name of the accumulating ufunc, the reference to the previous level
+            and the operand expression, or None if the statement is not a recurrence.
+        """
+        if not isinstance(stmt, gt_ir.Assign):
+            return None
+        target = _unshaped(stmt.target)
+        if not isinstance(target, gt_ir.FieldRef):
+            return None
+
+        k_ax = self.domain.sequential_axis.name
+        forward = self.block_info.iteration_order == gt_ir.IterationOrder.FORWARD
+        carried_offset = {ax: 0 for ax in self.domain.axes_names}
+        carried_offset[k_ax] = -1 if forward else 1
+
+        value = _unshaped(stmt.value)
+        if isinstance(value, gt_ir.BinOpExpr) and value.op in self.OP_TO_UFUNC:
+            ufunc = self.OP_TO_UFUNC[value.op]
+            candidates = [(value.lhs, value.rhs)]
+            if value.op in (gt_ir.BinaryOperator.ADD, gt_ir.BinaryOperator.MUL):
+                candidates.append((value.rhs, value.lhs))
+        elif (
+            isinstance(value, gt_ir.NativeFuncCall)
+            and value.func in self.SCAN_NATIVE_FUNC_TO_UFUNC
+            and len(value.args) == 2
+        ):
+            ufunc = self.SCAN_NATIVE_FUNC_TO_UFUNC[value.func]
+            candidates = [(value.args[0], value.args[1]), (value.args[1], value.args[0])]
+        else:
+            return None
+
+        for carried, operand in candidates:
+            carried = _unshaped(carried)
+            if (
+                isinstance(carried, gt_ir.FieldRef)
+                and carried.name == target.name
+                and {ax: carried.offset.get(ax, 0) for ax in carried_offset} == carried_offset
+            ):
+                return ufunc, carried, operand
+
+        return None
+
+    def _is_exact_scan(self, node: gt_ir.ApplyBlock, target_name: str, operand: gt_ir.Expr):
+        """Check that the accumulation reproduces the rounding of the sequential loop.
+
+        The accumulation runs in the dtype of the target field, which is only equivalent
+        to the loop if all the operands have that (floating point) dtype.
+        """
+        data_type = self.impl_node.fields[target_name].data_type
+        if data_type.dtype.kind != "f":
+            return False
+        accesses = _AccessCollector.apply(operand, node.local_symbols)
+        if any(ref.name == target_name for ref in accesses.field_reads):
+            return False
+        if any(
+            self.impl_node.fields[ref.name].data_type != data_type for ref in accesses.field_reads
+        ):
+            return False
+        for name in accesses.var_reads:
+            decl = node.local_symbols.get(name, None) or self.impl_node.parameters[name]
+            if decl.data_type != data_type:
+                return False
+        return True
+
+    def _analyze_sequential_block(self, node: gt_ir.ApplyBlock) -> Optional[Dict[int, tuple]]:
+        """Check whether a sequential apply block can be evaluated one statement at a time.
+
+        Executing every statement over the whole vertical interval before the next one
+        (loop fission) is equivalent to the sequential loop if no statement reads a field
+        written in the block at a different vertical level, except for first-order
+        recurrences (scans) of a field on itself, which are evaluated as accumulations.
+
+        Returns
+        -------
+            A mapping from the ids of the recurrence statements to their scan info (see
+            :py:meth:`_match_scan`), or None if the block has loop-carried dependencies.
+        """
+        block_accesses = _AccessCollector.apply(node.body, node.local_symbols)
+        if block_accesses.reads_undefined_vars:
+            return None
+        written_fields = set(block_accesses.field_writes)
+        if any(
+            self.impl_node.fields[name].axes != self.domain.axes_names for name in written_fields
+        ):
+            return None
+
+        k_ax = self.domain.sequential_axis.name
+        scans = {}
+        for stmt in node.body.stmts:
+            scan = self._match_scan(stmt)
+            if scan is not None:
+                target_name = scan[1].name
+                if block_accesses.field_writes.count(target_name) != 1 or not self._is_exact_scan(
+                    node, target_name, scan[2]
+                ):
+                    scan = None
+            for ref in _AccessCollector.apply(stmt, node.local_symbols).field_reads:
+                if ref.name in written_fields and ref.offset.get(k_ax, 0) != 0:
+                    if scan is None or ref is not scan[1]:
+                        return None
+            if scan is not None:
+                scans[id(stmt)] = scan
+
+        return scans
+
     def _make_field_origin(self, name: str, origin=None):
         if origin is None:
             origin = "{origin_arg}['{name}']".format(origin_arg=self.origin_arg_name, name=name)
@@ -137,7 +318,7 @@ class NumPySourceGenerator(PythonSourceGenerator):
         return source_lines
 
     def _make_regional_computation(
-        self, iteration_order, interval_definition, body_sources
+        self, iteration_order, interval_definition, body_sources, vectorized, prologue_sources
     ) -> List[str]:
         source_lines = []
         loop_bounds = [None, None]
@@ -152,7 +333,8 @@ class NumPySourceGenerator(PythonSourceGenerator):
         else:
             range_args = [loop_bounds[1] + " -1", loop_bounds[0] + " -1", "-1"]
 
-        if iteration_order != gt_ir.IterationOrder.PARALLEL:
+        if iteration_order != gt_ir.IterationOrder.PARALLEL and not vectorized:
+            source_lines.extend(prologue_sources)
             range_expr = "range({args})".format(args=", ".join(a for a in range_args))
             seq_axis = self.impl_node.domain.sequential_axis.name
             source_lines.append(
@@ -174,11 +356,84 @@ class NumPySourceGenerator(PythonSourceGenerator):
             source_lines.extend("\n")
         return source_lines
 
+    def _plan_temporary_buffers(
+        self, node: gt_ir.StencilImplementation
+    ) -> Dict[str, types.SimpleNamespace]:
+        """Assign the temporary fields to buffers, shared by fields with disjoint live ranges.
+
+        Stages are evaluated one after the other on the whole domain, so a temporary is
+        live from the first to the last stage accessing it. A shared buffer is allocated
+        with the union of the extents of its fields.
+        """
+        api_names = {info.name for info in node.api_signature}
+        temp_names = [name for name in node.fields if name not in api_names]
+        live_ranges = {}
+        stages = [
+            stage
+            for multi_stage in node.multi_stages
+            for group in multi_stage.groups
+            for stage in group.stages
+        ]
+        for index, stage in enumerate(stages):
+            for accessor in stage.accessors:
+                if accessor.symbol in temp_names:
+                    first = live_ranges.get(accessor.symbol, (index, index))[0]
+                    live_ranges[accessor.symbol] = (first, index)
+
+        buffers = []
+        for name in sorted(temp_names, key=lambda name: (live_ranges.get(name, (-1,))[0], name)):
+            field = node.fields[name]
+            key = (field.data_type.dtype, tuple(field.axes))
+            first, last = live_ranges.get(name, (None, None))
+            buffer = None
+            if first is not None:
+                buffer = next(
+                    (
+                        buffer
+                        for buffer in buffers
+                        if buffer.key == key and buffer.last is not None and buffer.last < first
+                    ),
+                    None,
+                )
+            if buffer is None:
+                buffer = types.SimpleNamespace(
+                    name=f"__temporary_buffer_{len(buffers)}",
+                    key=key,
+                    last=last,
+                    extent=node.fields_extents[name],
+                    fields=[],
+                )
+                buffers.append(buffer)
+            else:
+                buffer.last = last
+                buffer.extent |= node.fields_extents[name]
+            buffer.fields.append(name)
+
+        return {name: buffer for buffer in buffers for name in buffer.fields}
+
     def make_temporary_field(
         self, name: str, dtype: gt_ir.DataType, extent: gt_definitions.Extent
     ) -> List[str]:
-        source_lines = super().make_temporary_field(name, dtype, extent)
-        source_lines.extend(self._make_field_origin(name, extent.to_boundary().lower_indices))
+        buffer = self.temporary_buffers[name]
+        if self.temporaries_pool_name:
+            source_lines = [
+                '{name} = {pool}.get("{buffer}", ({shape}), {np}.{dtype})'.format(
+                    name=name,
+                    pool=self.temporaries_pool_name,
+                    buffer=buffer.name,
+                    shape=self.make_temporary_shape(buffer.extent),
+                    np=self.numpy_prefix,
+                    dtype=dtype.dtype.name,
+                )
+            ]
+        elif name in self.allocated_buffers:
+            source_lines = [f"{name} = {self.allocated_buffers[name]}"]
+        else:
+            source_lines = super().make_temporary_field(name, dtype, buffer.extent)
+            self.allocated_buffers.update((other, name) for other in buffer.fields if other != name)
+        source_lines.extend(
+            self._make_field_origin(name, buffer.extent.to_boundary().lower_indices)
+        )
 
         return source_lines
 
@@ -188,15 +443,116 @@ class NumPySourceGenerator(PythonSourceGenerator):
         # Computations body is split in different vertical regions
         assert sorted(regions, reverse=iteration_order == gt_ir.IterationOrder.BACKWARD) == regions
 
-        for bounds, body in regions:
-            region_lines = self._make_regional_computation(iteration_order, bounds, body)
+        for bounds, body, vectorized, prologue in regions:
+            region_lines = self._make_regional_computation(
+                iteration_order, bounds, body, vectorized, prologue
+            )
             source_lines.extend(region_lines)
 
         return source_lines
 
+    def _make_scan_source(
+        self, node: gt_ir.Assign, ufunc: str, carried: gt_ir.FieldRef, operand: gt_ir.Expr
+    ) -> List[str]:
+        """Evaluate a first-order recurrence over the whole interval with ``ufunc.accumulate``.
+
+        The level preceding the interval (in iteration order) is prepended to the operand
+        levels in a preallocated buffer, such that the accumulation performs exactly the
+        operations of the sequential loop.
+        """
+        k_ax = self.domain.sequential_axis.name
+        kd = self.domain.axes_names.index(k_ax)
+        ndim = len(self.domain.axes_names)
+        forward = self.block_info.iteration_order == gt_ir.IterationOrder.FORWARD
+        start_name, end_name = self.interval_k_start_name, self.interval_k_end_name
+
+        # Only the preceding level of the carried field is read
+        if forward:
+            self.interval_k_end_name = f"{start_name} + 1"
+        else:
+            self.interval_k_start_name = f"{end_name} - 1"
+        try:
+            init = self.visit(carried)
+        finally:
+            self.interval_k_start_name, self.interval_k_end_name = start_name, end_name
+
+        def index(k_index):
+            return ", ".join(k_index if d == kd else ":" for d in range(ndim))
+
+        levels = index("1:" if forward else ":0:-1")
+        np_prefix = self.numpy_prefix
+        body_lines = [
+            f"__scan_target = {self.visit(node.target)}",
+            f"__scan = {np_prefix}.empty(__scan_target.shape[:{kd}] + (__scan_target.shape[{kd}] + 1,) "
+            f"+ __scan_target.shape[{kd + 1}:], dtype=__scan_target.dtype)",
+            f"__scan[{index(':1')}] = {init}",
+            f"__scan[{levels}] = {self.visit(operand)}",
+            f"{np_prefix}.{ufunc}.accumulate(__scan, axis={kd}, out=__scan)",
+            f"__scan_target[...] = __scan[{levels}]",
+        ]
+        return [f"if {end_name} > {start_name}:"] + [
+            " " * self.indent_size + line for line in body_lines
+        ]
+
     # ---- Visitor handlers ----
+    def visit_ApplyBlock(self, node: gt_ir.ApplyBlock):
+        is_sequential = self.block_info.iteration_order != gt_ir.IterationOrder.PARALLEL
+        scans = None
+        if is_sequential and self.vectorize_sequential:
+            scans = self._analyze_sequential_block(node)
+        self.block_info.vectorized = scans is not None
+        self.block_info.scans = scans or {}
+        # Sliced views of the fields accessed in sequential loops, created once before the loop
+        self.block_info.views = {} if is_sequential and scans is None else None
+
+        interval_definition, body_sources = super().visit_ApplyBlock(node)
+        prologue_sources = [
+            f"{view_name} = {source}" for source, view_name in (self.block_info.views or {}).items()
+        ]
+
+        return interval_definition, body_sources, self.block_info.vectorized, prologue_sources
+
+    def _make_ufunc_assign_source(self, node: gt_ir.Assign) -> Optional[str]:
+        """Evaluate the outermost ufunc of an assignment to a field directly into the target.
+
+        NumPy resolves overlaps between the operands and the ``out`` array, so this is
+        valid even if the target is also read by the expression.
+        """
+        target = _unshaped(node.target)
+        if not isinstance(target, gt_ir.FieldRef):
+            return None
+        field = self.impl_node.fields[target.name]
+        # only floating point targets accept any result with the `same_kind` casting rule
+        if field.axes != self.domain.axes_names or field.data_type.dtype.kind != "f":
+            return None
+
+        value = _unshaped(node.value)
+        if isinstance(value, gt_ir.BinOpExpr) and value.op in self.OP_TO_UFUNC:
+            ufunc = f"{self.numpy_prefix}.{self.OP_TO_UFUNC[value.op]}"
+            args = [value.lhs, value.rhs]
+        elif isinstance(value, gt_ir.NativeFuncCall):
+            ufunc = self.NATIVE_FUNC_TO_PYTHON[value.func]
+            args = value.args
+        else:
+            return None
+
+        return "{ufunc}({args}, out={target})".format(
+            ufunc=ufunc,
+            args=", ".join(self.visit(arg) for arg in args),
+            target=self.visit(node.target),
+        )
+
+    def visit_Assign(self, node: gt_ir.Assign):
+        scan = self.block_info.scans.get(id(node), None)
+        if scan is not None:
+            return self._make_scan_source(node, *scan)
+        source = self._make_ufunc_assign_source(node)
+        if source is not None:
+            return source
+        return super().visit_Assign(node)
+
     def visit_ShapedExpr(self, node: ShapedExpr) -> str:
-        is_parallel = self.block_info.iteration_order == gt_ir.IterationOrder.PARALLEL
+        is_parallel = self._is_vectorized()
 
         if is_parallel:
             req_axes = self.impl_node.domain.axes_names
@@ -218,7 +574,7 @@ class NumPySourceGenerator(PythonSourceGenerator):
     def visit_FieldRef(self, node: gt_ir.FieldRef) -> str:
         assert node.name in self.block_info.accessors
 
-        is_parallel = self.block_info.iteration_order == gt_ir.IterationOrder.PARALLEL
+        is_parallel = self._is_vectorized()
         extent = self.block_info.extent
         lower_extent = list(extent.lower_indices)
         upper_extent = list(extent.upper_indices)
@@ -269,15 +625,23 @@ class NumPySourceGenerator(PythonSourceGenerator):
                 )
             else:
                 idx = "{:+d}".format(k_offset) if k_offset else ""
-                index.append(
-                    "{name}{marker}[{fd}] + {ax}{idx}".format(
-                        name=node.name,
-                        marker=self.origin_marker,
-                        fd=fd,
-                        ax=k_ax,
-                        idx=idx,
-                    )
+                k_index = "{name}{marker}[{fd}] + {ax}{idx}".format(
+                    name=node.name,
+                    marker=self.origin_marker,
+                    fd=fd,
+                    ax=k_ax,
+                    idx=idx,
                 )
+                views = self.block_info.views
+                if parallel_axes_dims and views is not None:
+                    view_source = "{name}[{index}, :]".format(
+                        name=node.name, index=", ".join(index)
+                    )
+                    view_name = views.setdefault(view_source, f"{node.name}__V{len(views)}")
+                    return "{view}[{slices}{k_index}]".format(
+                        view=view_name, slices=":, " * len(index), k_index=k_index
+                    )
+                index.append(k_index)
 
         source = "{name}[{index}]".format(name=node.name, index=", ".join(index))
         if not parallel_axes_dims and not is_parallel:
@@ -286,6 +650,8 @@ class NumPySourceGenerator(PythonSourceGenerator):
         return source
 
     def visit_StencilImplementation(self, node: gt_ir.StencilImplementation) -> None:
+        self.temporary_buffers = self._plan_temporary_buffers(node)
+        self.allocated_buffers = {}
         self.sources.empty_line()
 
         # Accessors for IO fields
@@ -417,7 +783,28 @@ class NumPySourceGenerator(PythonSourceGenerator):
         return sources
 
 
+class TemporaryBufferPool(threading.local):
+    """Buffers of the temporary fields of a stencil class, reused across calls.
+
+    Buffers are kept per thread, so that concurrent calls never share temporaries.
+    """
+
+    def __init__(self):
+        self.buffers: Dict[str, np.ndarray] = {}
+
+    def get(self, name: str, shape: Tuple[int, ...], dtype: Any) -> np.ndarray:
+        buffer = self.buffers.get(name, None)
+        if buffer is None or buffer.shape != shape:
+            buffer = self.buffers[name] = np.empty(shape, dtype=dtype)
+        return buffer
+
+    def clear(self) -> None:
+        self.buffers.clear()
+
+
 class NumPyModuleGenerator(gt_backend.BaseModuleGenerator):
+    TEMPORARIES_POOL_NAME = "_gt_temporaries_"
+
     def __init__(self):
         super().__init__()
         self.source_generator = NumPySourceGenerator(
@@ -431,11 +818,31 @@ class NumPyModuleGenerator(gt_backend.BaseModuleGenerator):
             interval_k_end_name="interval_k_end",
         )
 
+    @property
+    def pool_temporaries(self) -> bool:
+        return self.builder.options.backend_opts.get("pool_temporaries", True)
+
+    def generate_imports(self) -> str:
+        if self.pool_temporaries:
+            return "from gt4py.backend.numpy_backend import TemporaryBufferPool"
+        return ""
+
     def generate_module_members(self) -> str:
         return ""
 
+    def generate_class_members(self) -> str:
+        if self.pool_temporaries:
+            return f"\n\n{self.TEMPORARIES_POOL_NAME} = TemporaryBufferPool()\n"
+        return ""
+
     def generate_implementation(self) -> str:
         block = gt_text.TextBlock(indent_size=self.TEMPLATE_INDENT_SIZE)
+        self.source_generator.vectorize_sequential = self.builder.options.backend_opts.get(
+            "vectorize_sequential", True
+        )
+        self.source_generator.temporaries_pool_name = (
+            f"self.{self.TEMPORARIES_POOL_NAME}" if self.pool_temporaries else None
+        )
         numpy_ir = NumpyIR.apply(self.builder.implementation_ir)
         self.source_generator(numpy_ir, block)
         if self.builder.options.backend_opts.get("ignore_np_errstate", True):
@@ -469,10 +876,22 @@ class NumPyBackend(gt_backend.BaseBackend, gt_backend.PurePythonBackendCLIMixin)
     Backend options include:
     - ignore_np_errstate: `bool`
         If False, does not ignore NumPy floating-point errors. (`True` by default.)
+    - vectorize_sequential: `bool`
+        If False, always evaluate FORWARD and BACKWARD computations level by level.
+        Otherwise, regions without loop-carried dependencies are evaluated on whole
+        columns and first-order recurrences as accumulations. (`True` by default.)
+    - pool_temporaries: `bool`
+        If False, allocate the temporary fields in every call. Otherwise, the buffers
+        of the temporaries are kept by the stencil class and reused across calls
+        (one set of buffers per thread). (`True` by default.)
     """
 
     name = "numpy"
-    options = {"ignore_np_errstate": {"versioning": True, "type": bool}}
+    options = {
+        "ignore_np_errstate": {"versioning": True, "type": bool},
+        "vectorize_sequential": {"versioning": True, "type": bool},
+        "pool_temporaries": {"versioning": True, "type": bool},
+    }
     storage_info = {
         "alignment": 1,
         "device": "cpu",
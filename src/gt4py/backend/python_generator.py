@@ -113,17 +113,20 @@ class PythonSourceGenerator(gt_ir.IRNodeVisitor):
 
         return self.sources
 
-    def make_temporary_field(
-        self, name: str, data_type: gt_ir.DataType, extent: gt_definitions.Extent
-    ):
-        source_lines = []
+    def make_temporary_shape(self, extent: gt_definitions.Extent) -> str:
         boundary = extent.to_boundary()
-        shape = ", ".join(
+        return ", ".join(
             "{domain}[{d}]{size}".format(
                 domain=self.domain_arg_name, d=d, size=" {:+d}".format(size) if size > 0 else ""
             )
             for d, size in enumerate(boundary.frame_size)
         )
+
+    def make_temporary_field(
+        self, name: str, data_type: gt_ir.DataType, extent: gt_definitions.Extent
+    ):
+        source_lines = []
+        shape = self.make_temporary_shape(extent)
         source_lines.append(
             "{name} = {np_prefix}.empty(({shape}), dtype={np_prefix}.{dtype})".format(
                 name=name, np_prefix=self.numpy_prefix, shape=shape, dtype=data_type.dtype.name
@@ -16,14 +16,19 @@
 """Caching strategies for stencil generation."""
 
 import abc
+import collections.abc
+import contextlib
 import inspect
+import os
 import pathlib
 import pickle
 import sys
 import types
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import warnings
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, List, Optional, Set, Tuple
 
 import gt4py
+from gt4py.artifact_store import ArtifactStore
 from gt4py.definitions import StencilID
 
 
@@ -59,6 +64,45 @@ class CachingStrategy(abc.ABC):
         """Calculate the file path where caching info for the current process should be stored."""
         raise NotImplementedError
 
+    def build_lock(self) -> ContextManager:
+        """
+        Provide a context within which the stencil is generated and cached.
+
+        Caching strategies sharing cache files between processes can return an
+        inter-process lock, such that only one process generates a given stencil
+        at a time. By default no locking takes place.
+        """
+        return contextlib.nullcontext()
+
+    def restore_artifacts(self) -> bool:
+        """
+        Try to populate the cache entry of the stencil from a shared artifact store.
+
+        Returns
+        -------
+            True if the stencil files have been restored and can be loaded.
+        """
+        return False
+
+    def store_artifacts(self) -> None:
+        """Share the files of a freshly generated stencil through an artifact store."""
+        pass
+
+    def lookup_fast_index(self) -> Optional[StencilID]:
+        """
+        Look up the stencil id of a previously built stencil without fingerprinting it.
+
+        Returns
+        -------
+            The stencil id, if the caching strategy keeps an index of built stencils and
+            the stencil is found in it.
+        """
+        return None
+
+    def update_fast_index(self) -> None:
+        """Record the stencil id of a successfully built stencil in the fast index (if any)."""
+        pass
+
     @abc.abstractmethod
     def generate_cache_info(self) -> Dict[str, Any]:
         """
@@ -156,6 +200,95 @@ class CachingStrategy(abc.ABC):
         return self.builder.options.name
 
 
+_SIMPLE_TYPES = (bool, int, float, complex, str, bytes, type(None))
+
+
+def _code_digest(code: types.CodeType) -> Tuple[Any, ...]:
+    return (
+        code.co_code,
+        code.co_names,
+        tuple(
+            _code_digest(const) if isinstance(const, types.CodeType) else repr(const)
+            for const in code.co_consts
+        ),
+    )
+
+
+def _code_names(code: types.CodeType) -> Set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _fast_digest(value: Any, _seen: Optional[Set[int]] = None) -> Any:
+    """
+    Compute a cheap digest of a stencil definition or external without parsing any source.
+
+    Functions are digested through their bytecode, annotations, defaults, closures and the
+    globals they reference, modules through the modification time and size of their file.
+    Objects of the ``gt4py`` package are only identified by name, since any change to them
+    implies a new ``gt4py`` version. Other objects are represented by their ``repr``, which
+    at worst prevents fast index hits.
+    """
+    if isinstance(value, _SIMPLE_TYPES):
+        return repr(value)
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return "<recursion>"
+    seen.add(id(value))
+
+    module_name = getattr(value, "__module__", None) or ""
+    if module_name.split(".")[0] == "gt4py" and isinstance(value, (type, types.FunctionType)):
+        return f"{module_name}.{value.__qualname__}"
+
+    if isinstance(value, collections.abc.Mapping):
+        # `__builtins__` is added to namespaces (e.g. the externals) used with `eval`
+        return sorted(
+            (
+                (repr(key), _fast_digest(item, seen))
+                for key, item in value.items()
+                if key != "__builtins__"
+            ),
+            key=lambda pair: pair[0],
+        )
+    if isinstance(value, (list, tuple)):
+        return [type(value).__name__, *(_fast_digest(item, seen) for item in value)]
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(_fast_digest(item, seen)) for item in value)
+    if isinstance(value, types.FunctionType):
+        code = value.__code__
+        return [
+            value.__qualname__,
+            _code_digest(code),
+            _fast_digest(value.__defaults__, seen),
+            _fast_digest(value.__kwdefaults__, seen),
+            _fast_digest(value.__annotations__, seen),
+            [_fast_digest(cell.cell_contents, seen) for cell in value.__closure__ or ()],
+            _fast_digest(
+                {
+                    name: value.__globals__[name]
+                    for name in _code_names(code)
+                    if name in value.__globals__
+                },
+                seen,
+            ),
+        ]
+    if isinstance(value, types.ModuleType):
+        file_name = getattr(value, "__file__", None)
+        if not file_name or value.__name__.split(".")[0] == "gt4py":
+            return value.__name__
+        try:
+            stat = os.stat(file_name)
+        except OSError:
+            return value.__name__
+        return [value.__name__, stat.st_mtime_ns, stat.st_size]
+    if isinstance(value, type):
+        return [module_name, value.__qualname__, _fast_digest(sys.modules.get(module_name), seen)]
+    return repr(value)
+
+
 class JITCachingStrategy(CachingStrategy):
     """
     Caching strategy for JIT stencil generation.
@@ -168,6 +301,10 @@ class JITCachingStrategy(CachingStrategy):
     exists in the location corresponding to the current stencil. If it exists, compare it to
     the additional caching information for the current stencil. If the cache is consistent, a
     rebuild can be avoided.
+
+    If enabled in the cache settings, successfully built stencils are also recorded in a fast
+    index, keyed by a digest of the definition and externals that does not require parsing
+    them (see :py:func:`_fast_digest`). Fast index hits are loaded without validation.
     """
 
     name = "jit"
@@ -189,9 +326,8 @@ class JITCachingStrategy(CachingStrategy):
         )
         backend_root = self.root_path / cpython_id / gt4py.utils.slugify(self.builder.backend.name)
         if not backend_root.exists():
-            if not backend_root.parent.exists():
-                backend_root.parent.mkdir(parents=False)
-            backend_root.mkdir(parents=False)
+            # other processes might be creating the same directories
+            backend_root.mkdir(parents=True, exist_ok=True)
         return backend_root
 
     @property
@@ -199,6 +335,78 @@ class JITCachingStrategy(CachingStrategy):
         """Get the cache info file path from the stencil module path."""
         return self.builder.module_path.parent / f"{self.builder.module_path.stem}.cacheinfo"
 
+    @property
+    def lock_path(self) -> pathlib.Path:
+        """Get the path of the file locked while generating the stencil."""
+        return self.builder.module_path.parent / f"{self.builder.module_path.stem}.lock"
+
+    def build_lock(self) -> ContextManager:
+        """
+        Lock the stencil cache entry against concurrent generation by other processes.
+
+        Processes sharing the cache directory (e.g. MPI ranks on a shared file system)
+        wait for the lock to be released before loading or generating the stencil.
+        """
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        return gt4py.utils.file_lock(self.lock_path)
+
+    def restore_artifacts(self) -> bool:
+        """Restore the stencil from the artifact store configured in `cache_settings`."""
+        artifact_store = ArtifactStore.from_settings()
+        if artifact_store is None:
+            return False
+        return artifact_store.restore(self.builder)
+
+    def store_artifacts(self) -> None:
+        """Add the stencil to the artifact store configured in `cache_settings`."""
+        artifact_store = ArtifactStore.from_settings()
+        if artifact_store is None:
+            return
+        try:
+            artifact_store.store(self.builder)
+        except OSError as err:
+            warnings.warn(f"Could not add stencil to the artifact store: {err}", RuntimeWarning)
+
+    def _fast_index_dependencies(self) -> List[Any]:
+        """Collect the objects digested into the fast index key."""
+        return [self.builder.raw_definition, self.builder.externals]
+
+    @property
+    def fast_index_path(self) -> Optional[pathlib.Path]:
+        """Get the fast index file of the stencil, None if the fast index is disabled."""
+        if not gt4py.config.cache_settings.get("fast_index", False):
+            return None
+        key = gt4py.utils.shashed_id(
+            self.builder.options.qualified_name,
+            self.builder.backend.name,
+            self.options_id,
+            gt4py.__version__,
+            _fast_digest(self._fast_index_dependencies()),
+            length=32,
+        )
+        return self.backend_root_path / "_fast_index" / f"{key}.idx"
+
+    def lookup_fast_index(self) -> Optional[StencilID]:
+        index_path = self.fast_index_path
+        if not index_path:
+            return None
+        try:
+            qualified_name, version = pickle.loads(index_path.read_bytes())
+        except (OSError, pickle.UnpicklingError, ValueError):
+            return None
+        # typeignore because attrclass StencilID has generated constructor
+        return StencilID(qualified_name, version)  # type: ignore
+
+    def update_fast_index(self) -> None:
+        index_path = self.fast_index_path
+        if not index_path:
+            return
+        entry = (self.builder.stencil_id.qualified_name, self.builder.stencil_id.version)
+        if self.lookup_fast_index() == StencilID(*entry):  # type: ignore
+            return
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        gt4py.utils.write_file_atomically(index_path, pickle.dumps(entry), binary=True)
+
     def generate_cache_info(self) -> Dict[str, Any]:
         return {
             "backend": self.builder.backend.name,
@@ -213,8 +421,9 @@ class JITCachingStrategy(CachingStrategy):
             return
         cache_info = self.generate_cache_info()
         self.cache_info_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.cache_info_path.open("wb") as cache_info_file:
-            pickle.dump(cache_info, cache_info_file)
+        gt4py.utils.write_file_atomically(
+            self.cache_info_path, pickle.dumps(cache_info), binary=True
+        )
 
     def is_cache_info_available_and_consistent(
         self, *, validate_hash: bool, catch_exceptions: bool = True
@@ -283,6 +492,9 @@ class JITCachingStrategy(CachingStrategy):
 
     @property
     def stencil_id(self) -> StencilID:
+        if self.builder.is_fast_index_hit:
+            return self.builder.stencil_id
+
         fingerprint = {
             "__main__": self.builder.definition._gtscript_["canonical_ast"],
             "docstring": inspect.getdoc(self.builder.definition),
@@ -1,17 +1,20 @@
 # -*- coding: utf-8 -*-
 """Command line interface."""
+import concurrent.futures
 import functools
 import importlib
+import json
 import pathlib
 import sys
 from types import ModuleType
-from typing import Any, Callable, Dict, Generator, KeysView, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Generator, KeysView, List, Optional, Tuple, Type, Union
 
 import click
 import tabulate
 
 import gt4py
-from gt4py import gtscript_imports
+from gt4py import config as gt_config
+from gt4py import gtscript_imports, profiling
 from gt4py.backend.base import CLIBackendMixin
 from gt4py.lazy_stencil import LazyStencil
 
@@ -171,6 +174,14 @@ class GTScriptBuilder:
     silent :
         silence all reporting to stdout if True
 
+    jobs :
+        number of stencils to generate in parallel, each in a separate worker process.
+        Use 0 for as many as `build_settings["parallel_jobs"]`.
+
+    profile :
+        record the compilation phases of each stencil in :attr:`compile_phases`
+        (see :mod:`gt4py.profiling`).
+
     """
 
     def __init__(
@@ -180,11 +191,17 @@ class GTScriptBuilder:
         output_path: Union[str, pathlib.Path],
         backend: Type[CLIBackendMixin],
         silent: bool = False,
+        jobs: int = 1,
+        profile: bool = False,
     ):
         self.reporter = Reporter(silent)
-        self.input_module = self.import_input_module(pathlib.Path(input_path))
+        self.input_path = pathlib.Path(input_path)
+        self.input_module = self.import_input_module(self.input_path)
         self.output_path = pathlib.Path(output_path)
         self.backend_cls = backend
+        self.jobs = jobs or gt_config.build_settings["parallel_jobs"]
+        self.profile = profile
+        self.compile_phases: Dict[str, List[Dict[str, Any]]] = {}
 
     def import_input_module(self, input_path: pathlib.Path) -> ModuleType:
         input_module = None
@@ -194,13 +211,16 @@ class GTScriptBuilder:
             self.reporter.echo(f"input file loaded as module {input_module}")
         return input_module
 
-    def iterate_stencils(self) -> Generator[LazyStencil, None, None]:
+    def iterate_named_stencils(self) -> Generator[Tuple[str, LazyStencil], None, None]:
         return (
-            v
+            (k, v)
             for k, v in self.input_module.__dict__.items()
-            if k.startswith != "_" and isinstance(v, LazyStencil)
+            if not k.startswith("_") and isinstance(v, LazyStencil)
         )
 
+    def iterate_stencils(self) -> Generator[LazyStencil, None, None]:
+        return (v for _, v in self.iterate_named_stencils())
+
     def write_computation_src(
         self, root_path: pathlib.Path, computation_src: Dict[str, Union[str, Dict]]
     ) -> None:
@@ -213,18 +233,71 @@ class GTScriptBuilder:
                 self.reporter.echo(f"Writing source file: {file_path}")
                 file_path.write_text(content)
 
+    def generate_stencil(
+        self,
+        proto_stencil: LazyStencil,
+        build_options: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[pathlib.Path, Dict[str, Union[str, Dict]]]:
+        """Generate the computation source of a stencil, without writing it."""
+        builder = proto_stencil.builder.with_backend(self.backend_cls.name)
+        if build_options:
+            builder.with_changed_options(impl_opts=build_options)
+        if self.profile:
+            builder.with_changed_options(build_info={})
+        builder.with_caching("nocaching", output_path=self.output_path)
+        computation_src = builder.generate_computation()
+        if self.profile:
+            self.compile_phases[builder.options.name] = builder.options.build_info.get(
+                profiling.PHASES_KEY, []
+            )
+        return builder.caching.root_path, computation_src
+
     def generate_stencils(
         self,
         build_options: Optional[Dict[str, Any]] = None,
     ) -> None:
-        for proto_stencil in self.iterate_stencils():
-            self.reporter.echo(f"Building stencil {proto_stencil.builder.options.name}")
-            builder = proto_stencil.builder.with_backend(self.backend_cls.name)
-            if build_options:
-                builder.with_changed_options(impl_opts=build_options)
-            builder.with_caching("nocaching", output_path=self.output_path)
-            computation_src = builder.generate_computation()
-            self.write_computation_src(builder.caching.root_path, computation_src)
+        """
+        Generate and write the computation sources of all stencils in the input module.
+
+        If more than one job is requested, stencils are generated in a pool of worker
+        processes, each one importing the input module on its own. Sources are always
+        written by the calling process.
+        """
+        if self.jobs <= 1:
+            for proto_stencil in self.iterate_stencils():
+                self.reporter.echo(f"Building stencil {proto_stencil.builder.options.name}")
+                root_path, computation_src = self.generate_stencil(proto_stencil, build_options)
+                self.write_computation_src(root_path, computation_src)
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            futures = []
+            for attr_name, proto_stencil in self.iterate_named_stencils():
+                self.reporter.echo(f"Building stencil {proto_stencil.builder.options.name}")
+                futures.append(
+                    executor.submit(
+                        _generate_stencil_in_worker,
+                        str(self.input_path),
+                        str(self.output_path),
+                        self.backend_cls.name,
+                        attr_name,
+                        build_options,
+                        self.profile,
+                    )
+                )
+            for future in futures:
+                root_path, computation_src, compile_phases = future.result()
+                self.write_computation_src(root_path, computation_src)
+                self.compile_phases.update(compile_phases)
+
+    def write_profile(self, path: Union[str, pathlib.Path], profile_format: str = "chrome") -> None:
+        """Write the recorded compilation phases as a Chrome trace or as plain JSON."""
+        if profile_format == "chrome":
+            data: Dict[str, Any] = profiling.to_chrome_trace(self.compile_phases)
+        else:
+            data = self.compile_phases
+        self.reporter.echo(f"Writing compilation profile: {path}")
+        pathlib.Path(path).write_text(json.dumps(data, indent=2))
 
     def report_stencil_names(self) -> None:
         stencils = list(self.iterate_stencils())
@@ -235,6 +308,28 @@ class GTScriptBuilder:
         self.reporter.echo(stencils_msg)
 
 
+def _generate_stencil_in_worker(
+    input_path: str,
+    output_path: str,
+    backend_name: str,
+    stencil_name: str,
+    build_options: Optional[Dict[str, Any]],
+    profile: bool = False,
+) -> Tuple[pathlib.Path, Dict[str, Union[str, Dict]], Dict[str, List[Dict[str, Any]]]]:
+    """Generate the computation source of a single stencil in a worker process."""
+    builder = GTScriptBuilder(
+        input_path,
+        output_path=output_path,
+        backend=gt4py.backend.from_name(backend_name),
+        silent=True,
+        profile=profile,
+    )
+    root_path, computation_src = builder.generate_stencil(
+        getattr(builder.input_module, stencil_name), build_options
+    )
+    return root_path, computation_src, builder.compile_phases
+
+
 @click.group()
 def gtpyc() -> None:
     """
@@ -275,7 +370,27 @@ def list_backends() -> None:
     type=BackendOption(),
     help="Backend option (multiple allowed), format: -O key=value",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    type=click.IntRange(min=0),
+    help="number of stencils to generate in parallel (0: one per CPU).",
+)
 @click.option("--silent", "-s", is_flag=True, help="suppress console output")
+@click.option(
+    "--profile",
+    "profile_path",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="write the timings of the compilation phases to this JSON file.",
+)
+@click.option(
+    "--profile-format",
+    default="chrome",
+    type=click.Choice(["chrome", "json"]),
+    help="format of the --profile file: Chrome trace events or plain JSON.",
+)
 @click.argument(
     "input_path", required=True, type=click.Path(file_okay=True, dir_okay=True, exists=True)
 )
@@ -284,12 +399,20 @@ def gen(
     output_path: str,
     options: Dict[str, Any],
     input_path: str,
+    jobs: int,
     silent: bool,
+    profile_path: Optional[str],
+    profile_format: str,
 ) -> None:
     """Generate stencils from gtscript modules or packages."""
-    GTScriptBuilder(
+    builder = GTScriptBuilder(
         input_path=input_path,
         output_path=output_path,
         backend=backend,
         silent=silent,
-    ).generate_stencils(build_options=dict(options))
+        jobs=jobs,
+        profile=profile_path is not None,
+    )
+    builder.generate_stencils(build_options=dict(options))
+    if profile_path is not None:
+        builder.write_profile(profile_path, profile_format)
@@ -69,6 +69,9 @@ build_settings: Dict[str, Any] = {
 cache_settings: Dict[str, Any] = {
     "dir_name": os.environ.get("GT_CACHE_DIR_NAME", ".gt_cache"),
     "root_path": os.environ.get("GT_CACHE_ROOT", os.path.abspath(".")),
+    "artifact_store_path": os.environ.get("GT_ARTIFACT_STORE", None),
+    "artifact_store_max_size": int(os.environ.get("GT_ARTIFACT_STORE_MAX_SIZE", 10 * 1024 ** 3)),
+    "fast_index": os.environ.get("GT_CACHE_FAST_INDEX", "0").lower() in ("1", "true", "yes"),
 }
 
 code_settings: Dict[str, Any] = {"root_package_name": "_GT_"}
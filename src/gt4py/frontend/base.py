@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import abc
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 from gt4py import utils as gt_utils
 from gt4py.definitions import BuildOptions, StencilID
@@ -53,8 +53,17 @@ class Frontend(abc.ABC):
     @classmethod
     @abc.abstractmethod
     def generate(
-        cls, definition: AnyStencilFunc, externals: Dict[str, Any], options: BuildOptions
+        cls,
+        definition: AnyStencilFunc,
+        externals: Dict[str, Any],
+        options: BuildOptions,
+        *,
+        resolved_externals: Optional[Dict[str, Any]] = None,
     ) -> StencilDefinition:
+        """Generate the definition IR, with the given `resolved_externals` if not ``None``.
+
+        By default, the externals resolved by :py:meth:`prepare_stencil_definition` are used.
+        """
         pass
 
     @classmethod
@@ -1299,7 +1299,7 @@ class GTScriptParser(ast.NodeVisitor):
         gtscript._AxisOffset,
     )
 
-    def __init__(self, definition, *, options, externals=None):
+    def __init__(self, definition, *, options, externals=None, resolved_externals=None):
         assert isinstance(definition, types.FunctionType)
         self.definition = definition
         self.filename = inspect.getfile(definition)
@@ -1310,7 +1310,7 @@ class GTScriptParser(ast.NodeVisitor):
         self.main_name = options.qualified_name
         self.definition_ir = None
         self.external_context = externals or {}
-        self.resolved_externals = {}
+        self.resolved_externals = resolved_externals
         self.block = None
 
     def __str__(self):
@@ -1625,7 +1625,8 @@ class GTScriptParser(ast.NodeVisitor):
         #     self.definition._gtscript_["imported"],
         #     self.external_context,
         # )
-        self.resolved_externals = self.definition._gtscript_["externals"]
+        if self.resolved_externals is None:
+            self.resolved_externals = self.definition._gtscript_["externals"]
         api_signature, fields_decls, parameter_decls = self.extract_arg_descriptors()
 
         # Inline constant values
@@ -1722,8 +1723,10 @@ class GTScriptFrontend(gt_frontend.Frontend):
         return definition
 
     @classmethod
-    def generate(cls, definition, externals, options):
+    def generate(cls, definition, externals, options, *, resolved_externals=None):
         if not hasattr(definition, "_gtscript_"):
             cls.prepare_stencil_definition(definition, externals)
-        translator = GTScriptParser(definition, externals=externals, options=options)
+        translator = GTScriptParser(
+            definition, externals=externals, options=options, resolved_externals=resolved_externals
+        )
         return translator.run()
@@ -77,7 +77,7 @@ builtins = {
     *MATH_BUILTINS,
 }
 
-__all__ = list(builtins) + ["function", "stencil", "lazy_stencil"]
+__all__ = list(builtins) + ["function", "stencil", "lazy_stencil", "stencil_program"]
 
 __externals__ = "Placeholder"
 __gtscript__ = "Placeholder"
@@ -114,6 +114,50 @@ def function(func):
     return func
 
 
+def _make_build_options(
+    *, build_info, externals, format_source, name, rebuild, backend_opts, default_module
+):
+    """Validate the options of the stencil decorators and collect them in `BuildOptions`."""
+    if build_info is not None and not isinstance(build_info, dict):
+        raise ValueError(f"Invalid 'build_info' dictionary ('{build_info}')")
+    if externals is not None and not isinstance(externals, dict):
+        raise ValueError(f"Invalid 'externals' dictionary ('{externals}')")
+    if not isinstance(format_source, bool):
+        raise ValueError(f"Invalid 'format_source' bool value ('{format_source}')")
+    if name is not None and not isinstance(name, str):
+        raise ValueError(f"Invalid 'name' string ('{name}')")
+    if not isinstance(rebuild, bool):
+        raise ValueError(f"Invalid 'rebuild' bool value ('{rebuild}')")
+
+    module = None
+    if name:
+        name_components = name.split(".")
+        name = name_components[-1]
+        module = ".".join(name_components[:-1])
+
+    name = name or ""
+    module = module or default_module
+
+    # Move hidden "_option" keys to _impl_opts
+    backend_opts = dict(backend_opts)
+    _impl_opts = {}
+    for key, value in backend_opts.items():
+        if key.startswith("_"):
+            _impl_opts[key] = value
+    for key in _impl_opts:
+        backend_opts.pop(key)
+
+    return gt_definitions.BuildOptions(
+        name=name,
+        module=module,
+        format_source=format_source,
+        rebuild=rebuild,
+        backend_opts=backend_opts,
+        build_info=build_info,
+        impl_opts=_impl_opts,
+    )
+
+
 # Interface functions
 def stencil(
     backend,
@@ -184,46 +228,16 @@ def stencil(
 
     from gt4py import loader as gt_loader
 
-    if build_info is not None and not isinstance(build_info, dict):
-        raise ValueError(f"Invalid 'build_info' dictionary ('{build_info}')")
     if dtypes is not None and not isinstance(dtypes, dict):
         raise ValueError(f"Invalid 'dtypes' dictionary ('{dtypes}')")
-    if externals is not None and not isinstance(externals, dict):
-        raise ValueError(f"Invalid 'externals' dictionary ('{externals}')")
-    if not isinstance(format_source, bool):
-        raise ValueError(f"Invalid 'format_source' bool value ('{name}')")
-    if name is not None and not isinstance(name, str):
-        raise ValueError(f"Invalid 'name' string ('{name}')")
-    if not isinstance(rebuild, bool):
-        raise ValueError(f"Invalid 'rebuild' bool value ('{rebuild}')")
-
-    module = None
-    if name:
-        name_components = name.split(".")
-        name = name_components[-1]
-        module = ".".join(name_components[:-1])
-
-    name = name or ""
-    module = (
-        module or inspect.currentframe().f_back.f_globals["__name__"]
-    )  # definition_func.__globals__["__name__"] ??,
-
-    # Move hidden "_option" keys to _impl_opts
-    _impl_opts = {}
-    for key, value in kwargs.items():
-        if key.startswith("_"):
-            _impl_opts[key] = value
-    for key in _impl_opts:
-        kwargs.pop(key)
-
-    build_options = gt_definitions.BuildOptions(
-        name=name,
-        module=module,
+    build_options = _make_build_options(
+        build_info=build_info,
+        externals=externals,
         format_source=format_source,
+        name=name,
         rebuild=rebuild,
         backend_opts=kwargs,
-        build_info=build_info,
-        impl_opts=_impl_opts,
+        default_module=inspect.currentframe().f_back.f_globals["__name__"],
     )
 
     def _decorator(definition_func):
@@ -336,6 +350,87 @@ def lazy_stencil(
     return _decorator(definition)
 
 
+def stencil_program(
+    backend,
+    steps,
+    *,
+    build_info=None,
+    externals=None,
+    format_source=True,
+    name=None,
+    rebuild=False,
+    **kwargs,
+):
+    """Generate a single stencil implementing an ordered sequence of stencils.
+
+    The definitions of all the steps are fused into one stencil, executed with a single
+    call (one domain and one origin for all the steps). Arguments of the steps bound
+    to the same program argument are shared, the remaining arguments keep their names.
+    The fused stencil behaves as a stencil containing the computations of all the steps
+    in order, so that compatible stages of consecutive steps can be merged.
+
+    Parameters
+    ----------
+        backend : `str`
+            Name of the implementation backend.
+
+        steps : `Sequence` of stencils or `(stencil, bindings)` pairs
+            Stencil objects or definition functions to be fused, in execution order.
+            The optional `bindings` map argument names of the stencil to argument
+            names of the program.
+
+        build_info : `dict`, optional
+            Dictionary used to store information about the stencil generation.
+            (`None` by default).
+
+        externals: `dict`, optional
+            Specify values for otherwise unbound symbols of the definition functions.
+            Stencil objects use the externals they were built with.
+
+        format_source : `bool`, optional
+            Format generated sources when possible (`True` by default).
+
+        name : `str`, optional
+            The fully qualified name of the generated :class:`StencilObject`.
+            (`'stencil_program'` in the module of the caller by default).
+
+        rebuild : `bool`, optional
+            Force rebuild of the :class:`gt4py.StencilObject` even if it is
+            found in the cache. (`False` by default).
+
+        **kwargs: `dict`, optional
+            Extra backend-specific options. Check the specific backend
+            documentation for further information.
+
+    Returns
+    -------
+        :class:`gridtools.StencilObject`
+            Properly initialized instance of a dynamically-generated
+            subclass of :class:`gt4py.StencilObject`.
+
+    Raises
+    -------
+        ValueError
+            If inconsistent arguments or bindings are specified.
+    """
+
+    from gt4py import loader as gt_loader
+
+    build_options = _make_build_options(
+        build_info=build_info,
+        externals=externals,
+        format_source=format_source,
+        name=name,
+        rebuild=rebuild,
+        backend_opts=kwargs,
+        default_module=inspect.currentframe().f_back.f_globals["__name__"],
+    )
+
+    return gt_loader.gtscript_program_loader(
+        list(steps), backend=backend, build_options=build_options, externals=externals or {}
+    )
+
+
 class _AxisOffset:
     def __init__(self, axis: str, offset: int):
         self.axis = axis
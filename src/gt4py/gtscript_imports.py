@@ -17,6 +17,7 @@ Usage Example
         search_path=[<path1>, <path2>, ...],  # for allowing only in search_path
         generate_path=<mybuildpath>,  # for generating python modules in a specific dir
         in_source=False,  # set True to generate python modules next to gtscfipt files
+        parallel_jobs=4,  # build all lazy stencils of imported modules in 4 worker processes
     )
 
     # scoped usage
@@ -24,7 +25,9 @@ Usage Example
         import ...
 
 """
+import concurrent.futures
 import importlib
+import os
 import pathlib
 import sys
 import tempfile
@@ -40,6 +43,9 @@ GTS_IMPORT = (
     "# This file is automatically generated, changes may be overwritten."
 )
 
+#: Set in the worker processes building lazy stencils to disable nested parallel builds
+_IS_BUILD_WORKER = False
+
 
 def _add_extension(path: pathlib.Path, extension: str) -> pathlib.Path:
     """Add an extension to the filename of a path."""
@@ -64,6 +70,10 @@ class GtsFinder(importlib.abc.MetaPathFinder):
     in_source :
         If True, py modules are built next to the gtscript files
         (generate_path is ignored).
+
+    parallel_jobs :
+        If given, all lazy stencils of an imported module are built right after the import,
+        using this number of worker processes (see :py:func:`build_lazy_stencils`).
     """
 
     def __init__(
@@ -71,6 +81,7 @@ class GtsFinder(importlib.abc.MetaPathFinder):
         search_path: Optional[List[Union[str, pathlib.Path]]] = None,
         generate_path: Optional[Union[str, pathlib.Path]] = None,
         in_source: bool = False,
+        parallel_jobs: Optional[int] = None,
     ):
         if in_source:
             self.generate_path = None
@@ -80,6 +91,7 @@ class GtsFinder(importlib.abc.MetaPathFinder):
             self.generate_path = pathlib.Path(tempfile.gettempdir())
 
         self.search_path = search_path
+        self.parallel_jobs = parallel_jobs
 
     def get_generate_path(self, src_file_path: pathlib.Path) -> pathlib.Path:
         """Find the out-of-source or in-source generate directory."""
@@ -109,7 +121,11 @@ class GtsFinder(importlib.abc.MetaPathFinder):
                 spec = importlib.machinery.ModuleSpec(
                     name=fullname,
                     loader=GtsLoader(
-                        fullname, candidate, generate_at=self.get_generate_path(candidate)
+                        fullname,
+                        candidate,
+                        generate_at=self.get_generate_path(candidate),
+                        search_path=self.search_path,
+                        parallel_jobs=self.parallel_jobs,
                     ),
                     origin=str(candidate),
                     is_package=False,
@@ -140,11 +156,21 @@ class GtsLoader(importlib.machinery.SourceFileLoader):
     Extend :py:class:`importlib.machinery.SourceFileLoader` for GTScript files.
 
     Generate a python module for a GTScript file and use the super class to
-    load that instead.
+    load that instead. If `parallel_jobs` is given, all lazy stencils of the module
+    are built in parallel after executing it.
     """
 
-    def __init__(self, fullname: str, path: pathlib.Path, generate_at: pathlib.Path):
+    def __init__(
+        self,
+        fullname: str,
+        path: pathlib.Path,
+        generate_at: pathlib.Path,
+        search_path: Optional[List[Union[str, pathlib.Path]]] = None,
+        parallel_jobs: Optional[int] = None,
+    ):
         self.module_file = generate_at / (path.stem.split(".")[0] + ".py")
+        self.search_path = search_path
+        self.parallel_jobs = parallel_jobs
         super().__init__(fullname, str(path.absolute()))
 
     @property
@@ -174,7 +200,13 @@ class GtsLoader(importlib.machinery.SourceFileLoader):
             self.module_file.touch()
 
         if self.path_stats(self.path) != self.path_stats(str(self.module_file.absolute())):
-            self.module_file.write_text(self.get_source_code(fullname))
+            # write atomically, the same module might be generated by concurrent processes
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.module_file.parent, prefix=self.module_file.name, suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as tmp_file:
+                tmp_file.write(self.get_source_code(fullname))
+            os.replace(tmp_name, self.module_file)
         return str(self.module_file)
 
     def get_source_code(self, fullname: str) -> str:
@@ -184,23 +216,149 @@ class GtsLoader(importlib.machinery.SourceFileLoader):
         module = ModuleType(name=spec.name)
         return module
 
+    def exec_module(self, module: ModuleType) -> None:
+        super().exec_module(module)
+        if self.parallel_jobs and not _IS_BUILD_WORKER:
+            search_path = [*(self.search_path or []), self.plpath.parent]
+            build_lazy_stencils(
+                module,
+                jobs=self.parallel_jobs,
+                search_path=search_path,
+                generate_path=self.module_file.parent,
+            )
+
+
+def _init_build_worker() -> None:
+    global _IS_BUILD_WORKER
+    _IS_BUILD_WORKER = True
+
+
+def _build_lazy_stencil_in_worker(
+    module_name: str,
+    stencil_name: str,
+    search_path: List[Union[str, pathlib.Path]],
+    generate_path: Optional[Union[str, pathlib.Path]],
+) -> None:
+    """Import a gtscript module and build one of its lazy stencils in a worker process."""
+    with enabled(search_path=search_path, generate_path=generate_path):
+        module = importlib.import_module(module_name)
+        getattr(module, stencil_name).builder.build()
+
+
+def build_lazy_stencils(
+    module: ModuleType,
+    *,
+    jobs: int,
+    search_path: Optional[List[Union[str, pathlib.Path]]] = None,
+    generate_path: Optional[Union[str, pathlib.Path]] = None,
+) -> None:
+    """
+    Build all lazy stencils of a gtscript module using a pool of worker processes.
+
+    Each worker imports the module by name (using the given gtscript import settings)
+    and builds one stencil, filling the stencil cache. The stencils are then loaded
+    from the cache in the calling process. Lazy stencils resolving to the same stencil id
+    are built only once, so that concurrent builds never write to the same cache entry.
+    Stencils with the `rebuild` option are built sequentially in the calling process.
+
+    Parameters
+    ----------
+    module :
+        The imported gtscript module.
+
+    jobs :
+        Maximum number of worker processes.
+
+    search_path :
+        Search path for `gtscript` sources in the worker processes.
+
+    generate_path :
+        Path to generate py modules in, in the worker processes.
+    """
+    from gt4py.lazy_stencil import LazyStencil
+
+    lazy_stencils = {
+        name: value
+        for name, value in module.__dict__.items()
+        if not name.startswith("_") and isinstance(value, LazyStencil)
+    }
+    pending = {}
+    for name, lazy_stencil in lazy_stencils.items():
+        builder = lazy_stencil.builder
+        validate_hash = not builder.options._impl_opts.get("disable-cache-validation", False)
+        if builder.options.rebuild or builder.caching.is_cache_info_available_and_consistent(
+            validate_hash=validate_hash
+        ):
+            continue
+        pending.setdefault(builder.stencil_id, name)
+
+    if pending:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_build_worker
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _build_lazy_stencil_in_worker,
+                    module.__name__,
+                    name,
+                    list(search_path or []),
+                    generate_path,
+                )
+                for name in pending.values()
+            ]
+            for future in futures:
+                future.result()
+
+    for lazy_stencil in lazy_stencils.values():
+        lazy_stencil.implementation
+
 
 def enable(
     *,
     search_path: Optional[List[Union[str, pathlib.Path]]] = None,
     generate_path: Optional[Union[str, pathlib.Path]] = None,
     in_source: bool = False,
+    parallel_jobs: Optional[int] = None,
 ) -> GtsFinder:
     """
     Install GTScript import extensions.
 
     Parameters are passed through to the constructor of :py:class:`GtsFinder`.
     """
-    finder = GtsFinder(search_path=search_path, generate_path=generate_path, in_source=in_source)
+    finder = GtsFinder(
+        search_path=search_path,
+        generate_path=generate_path,
+        in_source=in_source,
+        parallel_jobs=parallel_jobs,
+    )
     finder.install()
     return finder
 
 
+@contextmanager
+def restored_import_system() -> Iterator:
+    """
+    Create a context restoring the import paths, finders and modules on exit.
+
+    The import state is restored in place, since the interpreter keeps using the original
+    objects. Submodules lazily imported by already loaded packages are kept.
+    """
+    backup_import_system: Tuple[
+        List[str], List[importlib.abc.MetaPathFinder], Dict[str, ModuleType]
+    ] = (
+        sys.path.copy(),
+        sys.meta_path.copy(),
+        sys.modules.copy(),
+    )
+    try:
+        yield
+    finally:
+        sys.path[:], sys.meta_path[:] = backup_import_system[:2]
+        for name in set(sys.modules) - set(backup_import_system[2]):
+            if name.split(".")[0] not in backup_import_system[2]:
+                del sys.modules[name]
+
+
 @contextmanager
 def enabled(**kwargs: Any) -> Iterator:
     """
@@ -220,14 +378,5 @@ def enabled(**kwargs: Any) -> Iterator:
         import some_other_stencil  # in the same directory as some_stencil.gt.py
         ## import error
     """
-    backup_import_system: Tuple[
-        List[str], List[importlib.abc.MetaPathFinder], Dict[str, ModuleType]
-    ] = (
-        sys.path.copy(),
-        sys.meta_path.copy(),
-        sys.modules.copy(),
-    )
-    try:
+    with restored_import_system():
         yield enable(**kwargs)
-    finally:
-        sys.path, sys.meta_path, sys.modules = backup_import_system
@@ -21,11 +21,12 @@ a high-level stencil function definition using a specific code generating backen
 """
 
 import types
-from typing import TYPE_CHECKING, Any, Dict, Type
+from typing import TYPE_CHECKING, Any, Dict, Sequence, Type
 
 from gt4py import backend as gt_backend
 from gt4py import frontend as gt_frontend
 from gt4py.stencil_builder import StencilBuilder
+from gt4py.stencil_program import StencilProgramBuilder, StepSpec
 from gt4py.type_hints import StencilFunc
 
 
@@ -72,3 +73,40 @@ def gtscript_loader(
     stencil_class = load_stencil("gtscript", backend, definition_func, externals, build_options)
 
     return stencil_class()
+
+
+def load_stencil_program(
+    frontend_name: str,
+    backend_name: str,
+    steps: Sequence[StepSpec],
+    externals: Dict[str, Any],
+    build_options: "BuildOptions",
+) -> Type["StencilObject"]:
+    """Generate a new class object implementing the fused sequence of stencil definitions."""
+    # Load components
+    backend_cls = gt_backend.from_name(backend_name)
+    if backend_cls is None:
+        raise ValueError("Unknown backend name ({name})".format(name=backend_name))
+
+    frontend = gt_frontend.from_name(frontend_name)
+    if frontend is None:
+        raise ValueError("Invalid frontend specification ({name})".format(name=frontend_name))
+
+    builder = StencilProgramBuilder(
+        steps, options=build_options, backend=backend_cls, frontend=frontend
+    ).with_externals(externals)
+
+    return builder.build()
+
+
+def gtscript_program_loader(
+    steps: Sequence[StepSpec],
+    backend: str,
+    build_options: "BuildOptions",
+    externals: Dict[str, Any],
+) -> "StencilObject":
+    if not build_options.name:
+        build_options.name = "stencil_program"
+    stencil_class = load_stencil_program("gtscript", backend, steps, externals, build_options)
+
+    return stencil_class()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Instrumentation of the compilation phases of stencils.
+
+Phases are only recorded if a `build_info` dictionary is passed in the build options.
+Each phase is appended to ``build_info["compile_phases"]`` as a dictionary with the
+`name` of the phase, its nesting `depth`, the `start` (seconds since the epoch) and
+`wall_time` (seconds), the peak resident set size (bytes) of the process (`peak_rss`)
+and of its finished child processes (`peak_rss_children`) at the end of the phase,
+and the number of IR nodes produced by the phase, if any (`nodes`).
+"""
+
+import contextlib
+import contextvars
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+import eve
+from gt4py import ir as gt_ir
+
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None  # type: ignore
+
+
+PHASES_KEY = "compile_phases"
+
+_depth: contextvars.ContextVar[int] = contextvars.ContextVar("_depth", default=0)
+
+
+class PhaseRecord:
+    """Handle to add information to the record of a phase (no-op if not profiling)."""
+
+    def __init__(self, record: Optional[Dict[str, Any]] = None):
+        self.record = record
+
+    def add_info(self, **info: Any) -> None:
+        if self.record is not None:
+            self.record.update(info)
+
+    def count_nodes(self, tree: Any, key: str = "nodes") -> None:
+        if self.record is not None:
+            self.record[key] = count_nodes(tree)
+
+
+@contextlib.contextmanager
+def phase(build_info: Optional[Dict[str, Any]], name: str) -> Iterator[PhaseRecord]:
+    """Record a compilation phase into `build_info` (if not ``None``)."""
+    if build_info is None:
+        yield PhaseRecord()
+        return
+
+    record: Dict[str, Any] = {"name": name, "depth": _depth.get(), "start": time.time()}
+    build_info.setdefault(PHASES_KEY, []).append(record)
+    token = _depth.set(record["depth"] + 1)
+    start = time.perf_counter()
+    try:
+        yield PhaseRecord(record)
+    finally:
+        record["wall_time"] = time.perf_counter() - start
+        _depth.reset(token)
+        record["peak_rss"] = _peak_rss(False)
+        record["peak_rss_children"] = _peak_rss(True)
+
+
+def _peak_rss(children: bool) -> Optional[int]:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # kilobytes on Linux, bytes on macOS
+    return usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+
+class _NodeCounter(gt_ir.IRNodeVisitor):
+    def __init__(self) -> None:
+        self.count = 0
+
+    def visit_Node(self, node: gt_ir.Node, **kwargs: Any) -> None:
+        self.count += 1
+        self.generic_visit(node, **kwargs)
+
+
+def count_nodes(tree: Any) -> int:
+    """Count the nodes of an Eve (gtc) or gt4py IR tree."""
+    if isinstance(tree, eve.Node):
+        return sum(1 for _ in tree.iter_tree().if_isinstance(eve.Node))
+    counter = _NodeCounter()
+    counter.visit(tree)
+    return counter.count
+
+
+def to_chrome_trace(phases_by_thread: Mapping[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Convert recorded phases to the Chrome trace event format (one thread per key).
+
+    The result can be written as JSON and opened in ``chrome://tracing`` or Perfetto.
+    """
+    starts = [record["start"] for phases in phases_by_thread.values() for record in phases]
+    origin = min(starts, default=0.0)
+    events: List[Dict[str, Any]] = []
+    for tid, (thread_name, phases) in enumerate(phases_by_thread.items()):
+        events.append(
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": tid, "args": {"name": thread_name}}
+        )
+        for record in phases:
+            events.append(
+                {
+                    "name": record["name"],
+                    "cat": "gt4py",
+                    "ph": "X",
+                    "pid": 0,
+                    "tid": tid,
+                    "ts": (record["start"] - origin) * 1e6,
+                    "dur": record.get("wall_time", 0.0) * 1e6,
+                    "args": {
+                        key: value
+                        for key, value in record.items()
+                        if key not in ("name", "start", "wall_time")
+                    },
+                }
+            )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -3,6 +3,7 @@ import pathlib
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
 
 import gt4py
+from gt4py import profiling
 from gt4py.definitions import BuildOptions, StencilID
 from gt4py.type_hints import AnnotatedStencilFunc, StencilFunc
 
@@ -62,16 +63,64 @@ class StencilBuilder:
         self._externals: Dict[str, Any] = {}
 
     def build(self) -> Type["StencilObject"]:
-        """Generate, compile and/or load everything necessary to provide a usable stencil class."""
-        # load or generate
-        stencil_class = None if self.options.rebuild else self.backend.load()
-        if stencil_class is None:
-            stencil_class = self.backend.generate()
-        return stencil_class
+        """
+        Generate, compile and/or load everything necessary to provide a usable stencil class.
+
+        Generation happens under the build lock of the caching strategy: if several processes
+        build the same stencil concurrently, the first one generates it while the others wait
+        and then load it from the cache. Before generating, the stencil is looked up in the
+        artifact store of the caching strategy (if any).
+
+        Stencils found in the fast index of the caching strategy are loaded right away,
+        without fingerprinting and validating them. Their `definition_func` is the
+        definition as given, not prepared by the frontend.
+
+        If the build options contain a `build_info` dictionary, the compilation phases
+        are recorded in it (see :mod:`gt4py.profiling`).
+        """
+        with profiling.phase(self.options.build_info, "build"):
+            if not self.options.rebuild:
+                stencil_class = self._load_from_fast_index()
+                if stencil_class is not None:
+                    return stencil_class
+
+            # load or generate
+            stencil_class = None if self.options.rebuild else self.backend.load()
+            if stencil_class is None:
+                with self.caching.build_lock():
+                    # the stencil might have been generated while waiting for the lock
+                    stencil_class = None if self.options.rebuild else self.backend.load()
+                    if stencil_class is None and not self.options.rebuild:
+                        if self.caching.restore_artifacts():
+                            stencil_class = self.backend.load()
+                    if stencil_class is None:
+                        with profiling.phase(self.options.build_info, "backend.generate"):
+                            stencil_class = self.backend.generate()
+                        self.caching.store_artifacts()
+            self.caching.update_fast_index()
+            return stencil_class
+
+    def _load_from_fast_index(self) -> Optional[Type["StencilObject"]]:
+        stencil_id = self.caching.lookup_fast_index()
+        load = getattr(self.backend, "_load", None)
+        if stencil_id is None or load is None:
+            return None
+
+        build_data = self._build_data.copy()
+        # neither parse the definition nor validate the cached module, the definition is
+        # only prepared if requested later on
+        self._build_data.update(id=stencil_id, fast_index_hit=True)
+        try:
+            return load()
+        except Exception:
+            # stale index entry, fall back to the regular checks
+            self._build_data = build_data
+            return None
 
     def generate_computation(self) -> Dict[str, Union[str, Dict]]:
         """Generate the stencil source code, fail if backend does not support CLI."""
-        return self.cli_backend.generate_computation()
+        with profiling.phase(self.options.build_info, "backend.generate_computation"):
+            return self.cli_backend.generate_computation()
 
     def generate_bindings(self, targe_language: str) -> Dict[str, Union[str, Dict]]:
         """Generate ``target_language`` bindings source, fail if backend does not support CLI."""
@@ -181,10 +230,17 @@ class StencilBuilder:
 
     @property
     def definition(self) -> AnnotatedStencilFunc:
-        return self._build_data.get("prepared_def") or self._build_data.setdefault(
-            "prepared_def",
-            self.frontend.prepare_stencil_definition(self._definition, self.externals),
-        )
+        if not self._build_data.get("prepared_def"):
+            with profiling.phase(self.options.build_info, "frontend.prepare"):
+                self._build_data["prepared_def"] = self.frontend.prepare_stencil_definition(
+                    self._definition, self.externals
+                )
+        return self._build_data["prepared_def"]
+
+    @property
+    def raw_definition(self) -> Union[StencilFunc, AnnotatedStencilFunc]:
+        """Get the definition function as given, without preparing it in the frontend."""
+        return self._definition
 
     @property
     def externals(self) -> Dict[str, Any]:
@@ -212,7 +268,14 @@ class StencilBuilder:
 
     @property
     def stencil_id(self) -> StencilID:
-        return self._build_data.setdefault("id", self.caching.stencil_id)
+        if "id" not in self._build_data:
+            self._build_data["id"] = self.caching.stencil_id
+        return self._build_data["id"]
+
+    @property
+    def is_fast_index_hit(self) -> bool:
+        """Check if the stencil id has been found in the fast index instead of fingerprinting."""
+        return self._build_data.get("fast_index_hit", False)
 
     @property
     def root_pkg_name(self) -> str:
@@ -238,15 +301,23 @@ class StencilBuilder:
 
     @property
     def definition_ir(self) -> "StencilDefinition":
-        return self._build_data.get("ir") or self._build_data.setdefault(
-            "ir", self.frontend.generate(self.definition, self.externals, self.options)
-        )
+        if not self._build_data.get("ir"):
+            definition = self.definition
+            with profiling.phase(self.options.build_info, "frontend") as phase:
+                self._build_data["ir"] = self.frontend.generate(
+                    definition, self.externals, self.options
+                )
+                phase.count_nodes(self._build_data["ir"])
+        return self._build_data["ir"]
 
     @property
     def implementation_ir(self) -> "StencilImplementation":
-        return self._build_data.get("iir") or self._build_data.setdefault(
-            "iir", gt4py.analysis.transform(self.definition_ir, self.options)
-        )
+        if not self._build_data.get("iir"):
+            definition_ir = self.definition_ir
+            with profiling.phase(self.options.build_info, "analysis") as phase:
+                self._build_data["iir"] = gt4py.analysis.transform(definition_ir, self.options)
+                phase.count_nodes(self._build_data["iir"])
+        return self._build_data["iir"]
 
     @property
     def module_name(self) -> str:
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 import abc
+import inspect
 import sys
 import time
 import warnings
-from typing import Tuple
+from typing import Any, Dict, Hashable, Optional, Tuple
 
 import numpy as np
 
@@ -33,11 +34,20 @@ class StencilObject(abc.ABC):
     Instances of this class do not contain any information and thus it is
     implemented as a singleton: only one instance per subclass is actually
     allocated (and it is immutable).
+
+    Preprocessed call arguments (inferred domain and normalized origins) of
+    successfully validated calls are memoized per subclass, keyed on the
+    call signature (see :meth:`_make_call_run_cache_key`), so repeated calls
+    with compatible arguments skip validation and domain inference.
     """
 
+    #: Maximum number of memoized call signatures kept per stencil class
+    CALL_RUN_CACHE_SIZE = 64
+
     def __new__(cls, *args, **kwargs):
         if getattr(cls, "_instance", None) is None:
             cls._instance = object.__new__(cls)
+            cls._call_run_cache_ = {}
         return cls._instance
 
     def __setattr__(self, key, value):
@@ -77,6 +87,10 @@ class StencilObject(abc.ABC):
     #
     #   _gt_id_ (stencil_id.version)
     #   definition_func
+    #
+    # and this one at instantiation time:
+    #
+    #   _call_run_cache_ (signature -> (domain, origin))
 
     @property
     @abc.abstractmethod
@@ -121,6 +135,39 @@ class StencilObject(abc.ABC):
     def __call__(self, *args, **kwargs):
         pass
 
+    def bind(self, *args, domain=None, origin=None, validate_args=True, **kwargs) -> "StencilCall":
+        """Preprocess the call arguments once and return a callable running the stencil with them.
+
+        The arguments are interpreted as in a regular stencil call. Domain inference,
+        origin normalization and (optionally) argument validation are only carried out
+        here, so that repeated calls with the same fields become a direct dispatch
+        to :meth:`run`.
+
+        Returns
+        -------
+            `StencilCall`: the stencil call bound to the provided arguments.
+
+        Raises
+        -------
+            ValueError
+                If invalid data or inconsistent options are specified.
+
+            TypeError
+                If an incorrect field or parameter data type is passed.
+        """
+        bound_args = inspect.signature(self.__call__).bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        field_args = {name: bound_args.arguments[name] for name in self.field_info.keys()}
+        parameter_args = {name: bound_args.arguments[name] for name in self.parameter_info.keys()}
+
+        domain, origin = self._preprocess_call_args(
+            field_args, parameter_args, domain, origin, validate_args=validate_args
+        )
+
+        return StencilCall(
+            self, field_args, parameter_args, domain, origin, validate_args=validate_args
+        )
+
     def _get_field_mask(self, field_name: str) -> Tuple[bool]:
         field_axes = self.field_info[field_name].axes
         return tuple(axis in field_axes for axis in CartesianSpace.names)
@@ -242,6 +289,67 @@ class StencilObject(abc.ABC):
                     f"Shape of field {name} is {field.shape} but must be at least {min_shape} for given domain and origin."
                 )
 
+    def _make_call_run_cache_key(
+        self, field_args, parameter_args, domain, origin
+    ) -> Optional[Hashable]:
+        """Build the memoization key of a call to :meth:`_call_run`.
+
+        The key captures every property of the arguments inspected by the
+        argument validation and the domain and origin inference: type, shape,
+        strides, dtype, mask, default origin and view state of the used fields,
+        types of the used parameters and the (unnormalized) `domain` and `origin`.
+
+        Returns
+        -------
+            `Hashable` or `None`: the key, or `None` if the arguments can not be
+            memoized (e.g. unhashable `origin` or `domain` values).
+        """
+        try:
+            field_key = []
+            for name, field_info in self.field_info.items():
+                if field_info is None:
+                    continue
+                field = field_args.get(name, None)
+                if field is None:
+                    field_key.append((name, None))
+                    continue
+                mask = getattr(field, "mask", None)
+                field_key.append(
+                    (
+                        name,
+                        type(field),
+                        field.shape,
+                        field.strides,
+                        field.dtype,
+                        tuple(mask) if mask is not None else None,
+                        getattr(field, "default_origin", None),
+                        getattr(field, "is_stencil_view", None),
+                    )
+                )
+
+            param_key = tuple(
+                (name, type(parameter_args.get(name, None)))
+                for name, param_info in self.parameter_info.items()
+                if param_info is not None
+            )
+
+            if isinstance(origin, dict):
+                origin_key: Any = tuple(
+                    sorted((name, tuple(value)) for name, value in origin.items())
+                )
+            elif origin is not None:
+                origin_key = tuple(origin)
+            else:
+                origin_key = None
+            domain_key = tuple(domain) if domain is not None else None
+
+            key = (tuple(field_key), param_key, domain_key, origin_key)
+            hash(key)
+        except TypeError:
+            key = None
+
+        return key
+
     def _call_run(
         self, field_args, parameter_args, domain, origin, *, validate_args=True, exec_info=None
     ):
@@ -281,7 +389,8 @@ class StencilObject(abc.ABC):
 
             exec_info : `dict`, optional
                 Dictionary used to store information about the stencil execution.
-                (`None` by default).
+                (`None` by default). The key `'call_run_cache_hit'` tells whether
+                the memoized preprocessed arguments of a previous call were reused.
 
         Returns
         -------
@@ -296,6 +405,41 @@ class StencilObject(abc.ABC):
         if exec_info is not None:
             exec_info["call_run_start_time"] = time.perf_counter()
 
+        cache_key = self._make_call_run_cache_key(field_args, parameter_args, domain, origin)
+        cached_args = self._call_run_cache_.get(cache_key, None) if cache_key is not None else None
+
+        if cached_args is not None:
+            domain, origin = cached_args
+            origin = dict(origin)
+        else:
+            domain, origin = self._preprocess_call_args(
+                field_args, parameter_args, domain, origin, validate_args=validate_args
+            )
+            if validate_args and cache_key is not None:
+                if len(self._call_run_cache_) >= self.CALL_RUN_CACHE_SIZE:
+                    del self._call_run_cache_[next(iter(self._call_run_cache_))]
+                self._call_run_cache_[cache_key] = (domain, dict(origin))
+
+        if exec_info is not None:
+            exec_info["call_run_cache_hit"] = cached_args is not None
+
+        self.run(
+            _domain_=domain, _origin_=origin, exec_info=exec_info, **field_args, **parameter_args
+        )
+
+        if exec_info is not None:
+            exec_info["call_run_end_time"] = time.perf_counter()
+
+    def _preprocess_call_args(
+        self, field_args, parameter_args, domain, origin, *, validate_args=True
+    ) -> Tuple[Shape, Dict[str, Index]]:
+        """Infer the domain and normalize the origins of a call, validating if requested.
+
+        Returns
+        -------
+            `(domain, origin)`: the computation domain and the origin of each used field.
+        """
+
         # Collect used arguments and parameters
         used_field_args = {
             name: field
@@ -347,9 +491,97 @@ class StencilObject(abc.ABC):
         if validate_args:
             self._validate_args(used_field_args, used_param_args, domain, origin)
 
-        self.run(
-            _domain_=domain, _origin_=origin, exec_info=exec_info, **field_args, **parameter_args
-        )
+        return domain, origin
+
+
+class StencilCall:
+    """Stencil call with preprocessed arguments, created by :meth:`StencilObject.bind`.
+
+    Calling it runs the stencil on the bound fields, domain and origin without
+    any further argument processing. Scalar parameters can be updated
+    in between calls.
+    """
+
+    def __init__(
+        self,
+        stencil_object: StencilObject,
+        field_args: Dict[str, Any],
+        parameter_args: Dict[str, Any],
+        domain: Shape,
+        origin: Dict[str, Index],
+        *,
+        validate_args: bool = True,
+    ):
+        self.stencil_object = stencil_object
+        self.domain = domain
+        self.origin = origin
+        self.validate_args = validate_args
+        self._run = stencil_object.run
+        self._run_args = {**field_args, **parameter_args}
+
+        # Fields living on the device are synchronized as in the regular stencil call
+        self._device_fields: Tuple[Any, ...] = ()
+        self._device_output_fields: Tuple[Any, ...] = ()
+        if gt_backend.from_name(stencil_object.backend).storage_info["device"] == "gpu":
+            used_fields = {
+                name: field_args[name]
+                for name, info in stencil_object.field_info.items()
+                if info is not None
+            }
+            self._device_fields = tuple(used_fields.values())
+            self._device_output_fields = tuple(
+                field
+                for name, field in used_fields.items()
+                if stencil_object.field_info[name].access == AccessKind.READ_WRITE
+            )
+
+    @property
+    def field_args(self) -> Dict[str, Any]:
+        return {name: self._run_args[name] for name in self.stencil_object.field_info.keys()}
+
+    @property
+    def parameter_args(self) -> Dict[str, Any]:
+        return {name: self._run_args[name] for name in self.stencil_object.parameter_info.keys()}
+
+    def update_parameters(self, **parameter_args: Any) -> None:
+        """Replace the values of some of the bound scalar parameters.
 
+        Raises
+        -------
+            ValueError
+                If a parameter is unknown or `None`.
+
+            TypeError
+                If an incorrect parameter data type is passed.
+        """
+        parameter_info = self.stencil_object.parameter_info
+        for name, value in parameter_args.items():
+            if name not in parameter_info:
+                raise ValueError(f"Unknown parameter '{name}'.")
+            if parameter_info[name] is not None:
+                if value is None:
+                    raise ValueError(f"Parameter '{name}' is None.")
+                if self.validate_args and not type(value) == parameter_info[name].dtype:
+                    raise TypeError(
+                        f"The type of parameter '{name}' is '{type(value)}' instead of '{parameter_info[name].dtype}'"
+                    )
+        self._run_args.update(parameter_args)
+
+    def __call__(self, *, exec_info=None, **parameter_args):
+        """Run the stencil with the bound arguments, updating the given parameters first."""
         if exec_info is not None:
-            exec_info["call_run_end_time"] = time.perf_counter()
+            exec_info["call_start_time"] = time.perf_counter()
+
+        if parameter_args:
+            self.update_parameters(**parameter_args)
+
+        for field in self._device_fields:
+            field.host_to_device()
+
+        self._run(_domain_=self.domain, _origin_=self.origin, exec_info=exec_info, **self._run_args)
+
+        for field in self._device_output_fields:
+            field._set_device_modified()
+
+        if exec_info is not None:
+            exec_info["call_end_time"] = time.perf_counter()
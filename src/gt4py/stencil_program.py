@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Fusion of ordered sequences of stencils into a single stencil program.
+
+A stencil program is built from the definitions of its steps: the definition IRs of all
+steps are merged into a single :class:`gt4py.ir.StencilDefinition`, which then goes
+through the regular analysis (including block merging) and code generation pipelines
+of the chosen backend, resulting in a single :class:`gt4py.StencilObject`.
+"""
+
+import copy
+import inspect
+import types
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from gt4py import ir as gt_ir
+from gt4py import utils as gt_utils
+from gt4py.caching import JITCachingStrategy
+from gt4py.definitions import BuildOptions, StencilID
+from gt4py.stencil_builder import StencilBuilder
+from gt4py.type_hints import StencilFunc
+
+
+if TYPE_CHECKING:
+    from gt4py.backend.base import Backend as BackendType
+    from gt4py.frontend.base import Frontend as FrontendType
+
+
+#: A program step: a stencil object or definition, optionally with its argument bindings
+StepSpec = Union[Any, Tuple[Any, Mapping[str, str]]]
+
+
+class _RenameSymbols(gt_ir.IRNodeMapper):
+    @classmethod
+    def apply(cls, node: gt_ir.Node, names: Mapping[str, str]) -> gt_ir.Node:
+        return cls(names).visit(node)
+
+    def __init__(self, names: Mapping[str, str]):
+        self.names = names
+
+    def _rename(self, path: tuple, node_name: str, node: gt_ir.Node):
+        node.name = self.names.get(node.name, node.name)
+        return self.generic_visit(path, node_name, node)
+
+    def visit_FieldDecl(self, path: tuple, node_name: str, node: gt_ir.FieldDecl):
+        if node.is_api:
+            node.layout_id = self.names.get(node.layout_id, node.layout_id)
+        return self._rename(path, node_name, node)
+
+    visit_VarDecl = _rename
+    visit_FieldRef = _rename
+    visit_VarRef = _rename
+    visit_ArgumentInfo = _rename
+
+
+class _CollectLocalSymbols(gt_ir.IRNodeVisitor):
+    @classmethod
+    def apply(cls, node: gt_ir.Node) -> List[str]:
+        collector = cls()
+        collector.visit(node)
+        return collector.names
+
+    def __init__(self):
+        self.names: List[str] = []
+
+    def visit_FieldDecl(self, node: gt_ir.FieldDecl):
+        if not node.is_api:
+            self.names.append(node.name)
+
+    def visit_VarDecl(self, node: gt_ir.VarDecl):
+        if not node.is_api:
+            self.names.append(node.name)
+
+
+def _validate_bindings(
+    definitions: Sequence[gt_ir.StencilDefinition], bindings: Sequence[Mapping[str, str]]
+) -> Set[str]:
+    """Check the bindings of all definitions and return the program argument names."""
+    api_names: Set[str] = set()
+    for definition, step_bindings in zip(definitions, bindings):
+        arg_names = [arg.name for arg in definition.api_signature]
+        unknown_names = set(step_bindings.keys()) - set(arg_names)
+        if unknown_names:
+            raise ValueError(
+                f"Invalid bindings for '{definition.name}': unknown arguments {sorted(unknown_names)}"
+            )
+        api_names |= {step_bindings.get(arg_name, arg_name) for arg_name in arg_names}
+
+    return api_names
+
+
+def _rename_step_symbols(
+    definition: gt_ir.StencilDefinition,
+    step_bindings: Mapping[str, str],
+    index: int,
+    used_names: Set[str],
+) -> gt_ir.StencilDefinition:
+    """Return a copy of the definition with bound arguments and unique local symbols."""
+    names = {arg.name: step_bindings.get(arg.name, arg.name) for arg in definition.api_signature}
+    for local_name in _CollectLocalSymbols.apply(definition.computations):
+        if local_name not in names:
+            unique_name = f"{local_name}__{index}"
+            while unique_name in used_names:
+                unique_name = "_" + unique_name
+            names[local_name] = unique_name
+            used_names.add(unique_name)
+
+    return _RenameSymbols.apply(copy.deepcopy(definition), names)
+
+
+def _merge_signature(
+    definition: gt_ir.StencilDefinition,
+    fields: Dict[str, gt_ir.FieldDecl],
+    parameters: Dict[str, gt_ir.VarDecl],
+    defaults: Dict[str, Any],
+) -> None:
+    """Add the (renamed) API arguments of the definition to the program arguments."""
+    for field_decl in definition.api_fields:
+        if field_decl.name in parameters:
+            raise ValueError(f"Argument '{field_decl.name}' is bound to a field and a parameter")
+        other_decl = fields.setdefault(field_decl.name, field_decl)
+        if other_decl.data_type != field_decl.data_type or other_decl.axes != field_decl.axes:
+            raise ValueError(
+                f"Incompatible declarations for field '{field_decl.name}' in '{definition.name}'"
+            )
+
+    for param_decl in definition.parameters:
+        if param_decl.name in fields:
+            raise ValueError(f"Argument '{param_decl.name}' is bound to a field and a parameter")
+        other_decl = parameters.setdefault(param_decl.name, param_decl)
+        if other_decl.data_type != param_decl.data_type:
+            raise ValueError(
+                f"Incompatible declarations for parameter '{param_decl.name}' in '{definition.name}'"
+            )
+
+    for arg in definition.api_signature:
+        if arg.name in parameters and arg.default is not gt_ir.Empty:
+            defaults.setdefault(arg.name, arg.default)
+
+
+def merge_stencil_definitions(
+    name: str,
+    definitions: Sequence[gt_ir.StencilDefinition],
+    bindings: Sequence[Mapping[str, str]],
+) -> gt_ir.StencilDefinition:
+    """Merge the definition IRs of several stencils into the definition of a single stencil.
+
+    The computations of the merged stencil are the computations of all definitions, in order.
+    API arguments of each definition are renamed to the program argument names given in
+    the corresponding `bindings` mapping (unbound arguments keep their names), such that
+    arguments bound to the same name are shared. Local symbols (temporaries) are made
+    unique per definition.
+
+    Raises
+    -------
+        ValueError
+            If a binding refers to an unknown argument or the declarations of a shared
+            argument are incompatible.
+    """
+    assert len(definitions) == len(bindings)
+    if not definitions:
+        raise ValueError("Stencil programs must contain at least one stencil")
+
+    domain = definitions[0].domain
+    fields: Dict[str, gt_ir.FieldDecl] = {}
+    parameters: Dict[str, gt_ir.VarDecl] = {}
+    defaults: Dict[str, Any] = {}
+    computations: List[gt_ir.ComputationBlock] = []
+    externals: Dict[str, Any] = {}
+    sources: Dict[str, str] = {}
+    docstrings: List[str] = []
+
+    used_names = _validate_bindings(definitions, bindings)
+    for i, (definition, step_bindings) in enumerate(zip(definitions, bindings)):
+        if definition.domain != domain:
+            raise ValueError(
+                f"Domain of '{definition.name}' ({definition.domain}) does not match the program domain ({domain})"
+            )
+        definition = _rename_step_symbols(definition, step_bindings, i, used_names)
+        _merge_signature(definition, fields, parameters, defaults)
+
+        computations.extend(definition.computations)
+        externals.update(definition.externals or {})
+        sources.update(definition.sources or {})
+        if definition.docstring:
+            docstrings.append(definition.docstring)
+
+    api_signature = [
+        gt_ir.ArgumentInfo(name=name, is_keyword=False, default=gt_ir.Empty) for name in fields
+    ] + [
+        gt_ir.ArgumentInfo(name=name, is_keyword=True, default=defaults.get(name, gt_ir.Empty))
+        for name in parameters
+    ]
+
+    return gt_ir.StencilDefinition(
+        name=name,
+        domain=domain,
+        api_signature=api_signature,
+        api_fields=list(fields.values()),
+        parameters=list(parameters.values()),
+        computations=computations,
+        externals=externals,
+        sources=sources,
+        docstring="\n\n".join(docstrings),
+    )
+
+
+class ProgramJITCachingStrategy(JITCachingStrategy):
+    """
+    JIT caching strategy for stencil programs.
+
+    The fingerprint combines the fingerprints of the definitions of all steps
+    with their argument bindings.
+    """
+
+    name = "jit_program"
+
+    def _fast_index_dependencies(self) -> List[Any]:
+        return [self.builder._steps, self.builder.externals]
+
+    @property
+    def stencil_id(self) -> StencilID:
+        if self.builder.is_fast_index_hit:
+            return self.builder.stencil_id
+
+        fingerprint = []
+        for definition, externals, bindings in self.builder.steps:
+            step_fingerprint = {
+                "__main__": definition._gtscript_["canonical_ast"],
+                "docstring": inspect.getdoc(definition),
+                "api_annotations": "[{}]".format(
+                    ", ".join(str(item) for item in definition._gtscript_["api_annotations"])
+                ),
+                **{
+                    name: value._gtscript_["canonical_ast"]
+                    if hasattr(value, "_gtscript_")
+                    else value
+                    for name, value in externals.items()
+                },
+            }
+            fingerprint.append(
+                (gt_utils.shashed_id(step_fingerprint), gt_utils.shashed_id(dict(bindings)))
+            )
+
+        # typeignore because attrclass StencilID has generated constructor
+        return StencilID(  # type: ignore
+            self.builder.options.qualified_name,
+            gt_utils.shashed_id(gt_utils.shashed_id(fingerprint), self.options_id),
+        )
+
+
+class StencilProgramBuilder(StencilBuilder):
+    """
+    Orchestrates code generation and compilation of a stencil program.
+
+    Parameters
+    ----------
+    steps:
+        Ordered sequence of stencil objects or definition functions, each one
+        optionally paired with a mapping from its argument names to program
+        argument names.
+
+    backend:
+        Backend class to be instanciated for this build
+
+    options:
+        Build options, the program has no default name
+
+    frontend:
+        Frontend class to be used
+
+    Notes
+    -----
+    Stencil objects are fused using the externals they were last built with,
+    definition functions (and stencil objects loaded through the fast cache index)
+    with the externals set through :py:meth:`with_externals`.
+    """
+
+    def __init__(
+        self,
+        steps: Sequence[StepSpec],
+        *,
+        backend: Optional[Type["BackendType"]] = None,
+        options: BuildOptions,
+        frontend: Optional["FrontendType"] = None,
+    ):
+        self._steps = [self._normalize_step(step) for step in steps]
+        super().__init__(None, backend=backend, options=options, frontend=frontend)
+        self.caching = ProgramJITCachingStrategy(self)
+
+    @staticmethod
+    def _normalize_step(
+        step: StepSpec,
+    ) -> Tuple[StencilFunc, Optional[Dict[str, Any]], Dict[str, str]]:
+        bindings: Mapping[str, str] = {}
+        if isinstance(step, tuple):
+            step, bindings = step
+        externals = None
+        if not isinstance(step, types.FunctionType):
+            if hasattr(step, "definition_func"):  # StencilObject
+                step = step.definition_func
+                # definitions of stencils loaded through the fast cache index are not prepared
+                if hasattr(step, "_gtscript_"):
+                    externals = dict(step._gtscript_["externals"])
+            else:
+                raise ValueError(f"Invalid stencil program step ({step})")
+        return step, externals, dict(bindings)
+
+    def with_caching(
+        self: "StencilProgramBuilder", caching_strategy_name: str, *args: Any, **kwargs: Any
+    ) -> "StencilProgramBuilder":
+        super().with_caching(caching_strategy_name, *args, **kwargs)
+        if caching_strategy_name == "jit":
+            self.caching = ProgramJITCachingStrategy(self, *args, **kwargs)
+        return self
+
+    @property
+    def steps(self) -> List[Tuple[StencilFunc, Dict[str, Any], Dict[str, str]]]:
+        """Prepared definitions of the steps with their resolved externals and bindings."""
+        if "steps" not in self._build_data:
+            steps = []
+            for definition, externals, bindings in self._steps:
+                if externals is None:
+                    self.frontend.prepare_stencil_definition(definition, self.externals)
+                    externals = definition._gtscript_["externals"]
+                steps.append((definition, externals, bindings))
+            self._build_data["steps"] = steps
+        return self._build_data["steps"]
+
+    @property
+    def definition(self) -> None:
+        """Stencil programs are not defined by a single definition function."""
+        return None
+
+    @property
+    def definition_ir(self) -> gt_ir.StencilDefinition:
+        if "ir" not in self._build_data:
+            definition_irs = []
+            for definition, externals, _ in self.steps:
+                # definition functions may be shared by steps resolved with different externals,
+                # the copy keeps the fingerprinted externals untouched by the parser evaluations
+                definition_irs.append(
+                    self.frontend.generate(
+                        definition, dict(externals), self.options, resolved_externals=externals
+                    )
+                )
+            self._build_data["ir"] = merge_stencil_definitions(
+                self.options.qualified_name,
+                definition_irs,
+                [bindings for _, _, bindings in self.steps],
+            )
+        return self._build_data["ir"]
@@ -17,7 +17,9 @@
 """GridTools storages classes."""
 
 
-from .storage import Storage, empty, from_array, ones, zeros
+from .halo import HaloUpdater, local_exchange
+from .pool import StoragePool
+from .storage import Storage, allocate_many, empty, from_array, from_file, load, ones, zeros
 
 
 _numpy_patch = None
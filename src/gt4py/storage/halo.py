@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Packing and unpacking of storage halos for halo exchanges.
+
+The halo regions of a storage are copied into (and from) contiguous send and receive
+buffers. The regions of every direction are computed once per (shape, halo, directions)
+and the corresponding array views are created once per storage, so packing and unpacking
+are plain block copies without any slicing of the storage.
+
+.. code-block: python
+
+    updater = gt4py.storage.HaloUpdater(field, halo=(3, 3))
+    updater.pack()
+    comm.Sendrecv(updater.send_buffers[(1, 0)], ..., updater.recv_buffers[(-1, 0)], ...)
+    updater.unpack()
+"""
+
+import functools
+import itertools
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+#: Position of a neighbor along the halo axes, e.g. (-1, 0) for the lower I neighbor
+Direction = Tuple[int, ...]
+
+
+class HaloPlan(NamedTuple):
+    #: Regions sent to the neighbors, for every direction
+    send_slices: Dict[Direction, Tuple[slice, ...]]
+    #: Halo regions received from the neighbors, for every direction
+    recv_slices: Dict[Direction, Tuple[slice, ...]]
+    #: Start and stop of every direction in the concatenated buffers
+    bounds: Dict[Direction, Tuple[int, int]]
+
+
+def _region_slices(
+    shape: Sequence[int], halo: Sequence[int], direction: Direction, *, send: bool
+) -> Tuple[slice, ...]:
+    slices = []
+    for size, width, side in itertools.zip_longest(shape, halo, direction, fillvalue=0):
+        if width == 0:
+            slices.append(slice(0, size))
+        elif side == 0:
+            slices.append(slice(width, size - width))
+        elif side < 0:
+            slices.append(slice(width, 2 * width) if send else slice(0, width))
+        else:
+            slices.append(
+                slice(size - 2 * width, size - width) if send else slice(size - width, size)
+            )
+    return tuple(slices)
+
+
+@functools.lru_cache(maxsize=None)
+def make_halo_plan(
+    shape: Tuple[int, ...], halo: Tuple[int, ...], directions: Tuple[Direction, ...]
+) -> HaloPlan:
+    """Compute the regions exchanged with the neighbors of a field.
+
+    The region sent in `direction` is the strip of the interior next to that side, the
+    region received from `direction` is the halo on that side.
+    """
+    if len(halo) > len(shape) or any(2 * width > size for size, width in zip(shape, halo)):
+        raise ValueError("Halo {} does not fit in shape {}.".format(halo, shape))
+
+    send_slices = {}
+    recv_slices = {}
+    bounds = {}
+    start = 0
+    for direction in directions:
+        send_slices[direction] = _region_slices(shape, halo, direction, send=True)
+        recv_slices[direction] = _region_slices(shape, halo, direction, send=False)
+        size = int(np.prod([s.stop - s.start for s in send_slices[direction]]))
+        bounds[direction] = (start, start + size)
+        start += size
+
+    return HaloPlan(send_slices, recv_slices, bounds)
+
+
+class HaloUpdater:
+    """
+    Contiguous send and receive buffers of the halos of a CPU storage.
+
+    The buffers of all directions are views of a single send and a single receive buffer.
+    :meth:`pack` and :meth:`unpack` copy between them and views of the storage created at
+    construction, the storage must therefore not be reallocated in the meantime.
+
+    Parameters
+    ----------
+    storage :
+        Storage (or NumPy array) with the halo regions.
+
+    halo :
+        Halo width along the leading axes (e.g. I and J), the other axes are sent whole.
+
+    directions :
+        Neighbors exchanging halos, all of them (including corners) by default.
+    """
+
+    def __init__(
+        self,
+        storage: np.ndarray,
+        halo: Sequence[int],
+        directions: Optional[Sequence[Direction]] = None,
+    ):
+        halo = tuple(halo)
+        if directions is None:
+            directions = [
+                direction
+                for direction in itertools.product((-1, 0, 1), repeat=len(halo))
+                if any(direction)
+            ]
+        self.storage = storage
+        self.halo = halo
+        self.directions = tuple(tuple(direction) for direction in directions)
+        self.plan = make_halo_plan(storage.shape, halo, self.directions)
+
+        size = max((stop for _, stop in self.plan.bounds.values()), default=0)
+        self.send_buffer = np.empty(size, dtype=storage.dtype)
+        self.recv_buffer = np.empty(size, dtype=storage.dtype)
+
+        # plain ndarray views skip the storage view finalization on every exchange
+        array = storage.view(np.ndarray)
+        self._send_pairs: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._recv_pairs: Dict[Direction, Tuple[np.ndarray, np.ndarray]] = {}
+        for direction in self.directions:
+            start, stop = self.plan.bounds[direction]
+            send_region = array[self.plan.send_slices[direction]]
+            recv_region = array[self.plan.recv_slices[direction]]
+            self._send_pairs.append(
+                (self.send_buffer[start:stop].reshape(send_region.shape), send_region)
+            )
+            self._recv_pairs[direction] = (
+                recv_region,
+                self.recv_buffer[start:stop].reshape(recv_region.shape),
+            )
+
+    @property
+    def send_buffers(self) -> Dict[Direction, np.ndarray]:
+        """Views of the send buffer of each direction."""
+        return {
+            direction: self.send_buffer[start:stop]
+            for direction, (start, stop) in self.plan.bounds.items()
+        }
+
+    @property
+    def recv_buffers(self) -> Dict[Direction, np.ndarray]:
+        """Views of the receive buffer of each direction."""
+        return {
+            direction: self.recv_buffer[start:stop]
+            for direction, (start, stop) in self.plan.bounds.items()
+        }
+
+    def pack(self) -> np.ndarray:
+        """Copy the regions sent to all neighbors into the send buffer."""
+        for buffer, region in self._send_pairs:
+            np.copyto(buffer, region)
+        return self.send_buffer
+
+    def unpack(self, directions: Optional[Sequence[Direction]] = None) -> None:
+        """Copy the receive buffer into the halo regions (of the given directions only)."""
+        for direction in self.directions if directions is None else directions:
+            region, buffer = self._recv_pairs[tuple(direction)]
+            np.copyto(region, buffer)
+
+
+def local_exchange(
+    updaters: Mapping[Tuple[int, ...], HaloUpdater], *, periodic: bool = True
+) -> None:
+    """
+    Exchange halos between subdomains of the same process, as a stand-in for MPI.
+
+    Parameters
+    ----------
+    updaters :
+        Halo updaters of the subdomains by their coordinates in the process grid.
+
+    periodic :
+        Whether the process grid is periodic, otherwise boundary halos are left untouched.
+    """
+    grid_shape = tuple(max(coords) + 1 for coords in zip(*updaters.keys()))
+    for updater in updaters.values():
+        updater.pack()
+
+    received = {}
+    for coords, updater in updaters.items():
+        recv_buffers = updater.recv_buffers
+        received[coords] = []
+        for direction in updater.directions:
+            neighbor = tuple(c + d for c, d in zip(coords, direction))
+            if periodic:
+                neighbor = tuple(n % size for n, size in zip(neighbor, grid_shape))
+            if neighbor not in updaters:
+                continue
+            # the halo on one side is the region the neighbor sends in the opposite direction
+            opposite = tuple(-d for d in direction)
+            recv_buffers[direction][...] = updaters[neighbor].send_buffers[opposite]
+            received[coords].append(direction)
+
+    for coords, updater in updaters.items():
+        updater.unpack(received[coords])
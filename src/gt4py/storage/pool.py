@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Recycling of the raw buffers of CPU storages.
+
+Storages allocated while a :class:`StoragePool` is active take their raw buffers from
+the pool, and give them back when they are garbage-collected (i.e. when the storage
+and all views of it are gone) or explicitly released.
+
+.. code-block: python
+
+    with gt4py.storage.StoragePool() as pool:
+        for step in range(n_steps):
+            tmp = gt4py.storage.empty(backend, default_origin, shape, dtype)
+            ...
+    print(pool.stats)
+"""
+
+import threading
+import weakref
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from . import utils as storage_utils
+
+
+class PoolStats(NamedTuple):
+    #: Size of the buffers in use by storages
+    bytes_live: int
+    #: Size of the buffers available for reuse
+    bytes_pooled: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the allocations served with recycled buffers."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class _BufferLease:
+    """Owner of a pooled buffer while it is used by storages.
+
+    Arrays created from the lease keep it as their base, and numpy never collapses the
+    base of derived views past non-ndarray objects, so the lease lives exactly as long
+    as the last array using the buffer.
+    """
+
+    def __init__(self, block: np.ndarray):
+        self.__array_interface__ = block.__array_interface__
+        self.block = block
+
+
+class StoragePool:
+    """
+    Pool of raw storage buffers, reused between storages with the same memory layout.
+
+    Buffers are binned by (backend, dtype, padded shape, layout map, alignment). Only the
+    storages allocated while the pool is active are pooled, and buffers are only recycled
+    while it is active: buffers of storages outliving the pool are freed as usual.
+
+    Activation is per thread: a pool only serves the allocations of the threads it has
+    been activated in, but it can be shared by several threads.
+
+    Parameters
+    ----------
+    max_pooled_bytes :
+        Upper bound of the size of the buffers kept for reuse, unbounded if None.
+    """
+
+    def __init__(self, *, max_pooled_bytes: Optional[int] = None):
+        self.max_pooled_bytes = max_pooled_bytes
+        self._free_blocks: Dict[Hashable, List[np.ndarray]] = {}
+        self._finalizers: Dict[int, weakref.finalize] = {}
+        # finalizers may run when the garbage collector is triggered inside the pool
+        self._lock = threading.RLock()
+        self._activations = 0
+        self._bytes_live = 0
+        self._bytes_pooled = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> PoolStats:
+        return PoolStats(self._bytes_live, self._bytes_pooled, self._hits, self._misses)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the pool is active in any thread."""
+        return self._activations > 0
+
+    def activate(self) -> "StoragePool":
+        """Allocate new CPU storages of the calling thread from this pool until deactivated."""
+        _active_pools().append(self)
+        with self._lock:
+            self._activations += 1
+        return self
+
+    def deactivate(self) -> None:
+        _active_pools().remove(self)
+        with self._lock:
+            self._activations -= 1
+            if not self.is_active:
+                self.clear()
+
+    def __enter__(self) -> "StoragePool":
+        return self.activate()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.deactivate()
+
+    def clear(self) -> None:
+        """Free the buffers available for reuse."""
+        with self._lock:
+            self._free_blocks.clear()
+            self._bytes_pooled = 0
+
+    def allocate(
+        self, backend, default_origin, shape, layout_map, dtype, alignment_bytes
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Allocate the buffers of a storage, see :func:`gt4py.storage.utils.allocate`."""
+        dtype = np.dtype(dtype)
+        order_idx = storage_utils.idx_from_order([i for i in layout_map if i is not None])
+        padded_shape = storage_utils.compute_padded_shape(
+            shape, alignment_bytes // dtype.itemsize, order_idx
+        )
+        key = (backend, dtype, tuple(padded_shape), tuple(layout_map), alignment_bytes)
+
+        def allocate_f(size, dtype):
+            with self._lock:
+                free_blocks = self._free_blocks.get(key, None)
+                if free_blocks:
+                    block = free_blocks.pop()
+                    self._bytes_pooled -= block.nbytes
+                    self._hits += 1
+                else:
+                    block = np.empty(size, dtype)
+                    self._misses += 1
+                self._bytes_live += block.nbytes
+                lease = _BufferLease(block)
+                self._finalizers[id(lease)] = weakref.finalize(
+                    lease, self._recycle, key, block, id(lease)
+                )
+
+            raw_buffer = np.asarray(lease)
+            return raw_buffer, raw_buffer
+
+        return storage_utils.allocate(
+            default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f
+        )
+
+    def release(self, storage) -> None:
+        """
+        Give the buffer of a storage back to the pool before it is garbage-collected.
+
+        The storage and its views must not be used afterwards.
+
+        Raises
+        -------
+            ValueError
+                If the storage has not been allocated from this pool or is already released.
+        """
+        lease = getattr(getattr(storage, "_raw_buffer", None), "base", None)
+        finalizer = self._finalizers.get(id(lease), None)
+        if finalizer is None or not finalizer.alive:
+            raise ValueError("Storage has not been allocated from this pool")
+        finalizer()
+
+    def _recycle(self, key: Hashable, block: np.ndarray, lease_id: int) -> None:
+        with self._lock:
+            self._finalizers.pop(lease_id, None)
+            self._bytes_live -= block.nbytes
+            if not self.is_active or (
+                self.max_pooled_bytes is not None
+                and self._bytes_pooled + block.nbytes > self.max_pooled_bytes
+            ):
+                return
+            self._free_blocks.setdefault(key, []).append(block)
+            self._bytes_pooled += block.nbytes
+
+
+#: Per-thread stacks of the activated pools, the last one is used
+_thread_state = threading.local()
+
+
+def _active_pools() -> List[StoragePool]:
+    if not hasattr(_thread_state, "pools"):
+        _thread_state.pools = []
+    return _thread_state.pools
+
+
+def active_pool() -> Optional[StoragePool]:
+    """Return the pool used for new CPU storages of the calling thread, if any."""
+    pools = _active_pools()
+    return pools[-1] if pools else None
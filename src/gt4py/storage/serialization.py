@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""File format of saved storages.
+
+A file starts with a magic string, the format version and the size of a JSON header
+describing the storage (backend, dtype, mask, shape, default origin, layout map,
+alignment, padded shape and strides). The raw padded buffer of the storage follows at
+`data_offset`, which is chosen such that the default origin of the field has the same
+alignment in a memory mapping of the file as in the saved storage.
+"""
+
+import json
+import struct
+from typing import Any, Dict
+
+import numpy as np
+
+
+MAGIC = b"\x93GT4PY-STORAGE"
+VERSION = 1
+_PREAMBLE = struct.Struct("<BI")
+
+
+def write(path, header: Dict[str, Any], block: np.ndarray, lead_bytes: int) -> None:
+    """
+    Write a storage file.
+
+    Parameters
+    ----------
+    header :
+        Description of the storage, with `dtype` as :class:`numpy.dtype` and the alignment
+        of the storage (`alignment_bytes`). `data_offset` is added.
+
+    block :
+        One-dimensional contiguous raw padded buffer of the storage (of any dtype).
+
+    lead_bytes :
+        Offset of the buffer modulo the alignment of the storage.
+    """
+    alignment_bytes = header["alignment_bytes"]
+    header = dict(header, dtype=np.lib.format.dtype_to_descr(header["dtype"]), data_offset=0)
+    # the offset is part of the header, leave enough space for its digits
+    header_size = len(MAGIC) + _PREAMBLE.size + len(json.dumps(header).encode()) + 20
+    header["data_offset"] = (
+        -(-header_size // alignment_bytes) * alignment_bytes + lead_bytes % alignment_bytes
+    )
+    encoded = json.dumps(header).encode()
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_PREAMBLE.pack(VERSION, len(encoded)))
+        f.write(encoded)
+        f.write(b"\0" * (header["data_offset"] - f.tell()))
+        block.tofile(f)
+
+
+def read_header(path) -> Dict[str, Any]:
+    """Read the header of a storage file, with `dtype` as :class:`numpy.dtype`."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError("'{}' is not a storage file.".format(path))
+        version, size = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if version != VERSION:
+            raise ValueError("Unsupported storage file version {}.".format(version))
+        header = json.loads(f.read(size).decode())
+
+    header["dtype"] = np.lib.format.descr_to_dtype(_as_tuples(header["dtype"]))
+    for key in ("shape", "default_origin", "padded_shape", "strides"):
+        header[key] = tuple(header[key])
+    return header
+
+
+def _as_tuples(descr):
+    """Restore the tuples of structured dtype descriptions, which JSON turns into lists."""
+    if not isinstance(descr, list):
+        return descr
+    fields = []
+    for name, field_descr, *shape in descr:
+        name = tuple(name) if isinstance(name, list) else name
+        fields.append((name, _as_tuples(field_descr), *(tuple(s) for s in shape)))
+    return fields
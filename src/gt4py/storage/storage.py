@@ -14,6 +14,11 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import functools
+import numbers
+import os
+from typing import NamedTuple, Optional, Tuple
+
 import numpy as np
 
 
@@ -24,24 +29,62 @@ except ImportError:
 
 from gt4py import backend as gt_backend
 
+from . import pool as storage_pool
+from . import serialization as storage_serialization
+from . import sync as storage_sync
 from . import utils as storage_utils
 
 
-def empty(backend, default_origin, shape, dtype, mask=None, *, managed_memory=False):
+def empty(
+    backend,
+    default_origin,
+    shape,
+    dtype,
+    mask=None,
+    *,
+    managed_memory=False,
+    mmap_path=None,
+    device=None,
+    first_touch=False,
+):
     if gt_backend.from_name(backend).storage_info["device"] == "gpu":
+        if mmap_path is not None:
+            raise ValueError("File-backed storages are only supported by CPU backends.")
+        if first_touch:
+            raise ValueError("Parallel first touch is only supported by CPU backends.")
         if managed_memory:
             storage_t = GPUStorage
         else:
             storage_t = ExplicitlySyncedGPUStorage
     else:
         storage_t = CPUStorage
+    if device is not None and storage_t is not ExplicitlySyncedGPUStorage:
+        raise ValueError("Devices can only be set for explicitly synchronized GPU storages.")
 
     return storage_t(
-        shape=shape, dtype=dtype, backend=backend, default_origin=default_origin, mask=mask
+        shape=shape,
+        dtype=dtype,
+        backend=backend,
+        default_origin=default_origin,
+        mask=mask,
+        mmap_path=mmap_path,
+        device=device,
+        first_touch=first_touch,
     )
 
 
-def ones(backend, default_origin, shape, dtype, mask=None, *, managed_memory=False):
+def ones(
+    backend,
+    default_origin,
+    shape,
+    dtype,
+    mask=None,
+    *,
+    managed_memory=False,
+    mmap_path=None,
+    device=None,
+    first_touch=False,
+):
     storage = empty(
         shape=shape,
         dtype=dtype,
@@ -49,12 +92,26 @@ def ones(backend, default_origin, shape, dtype, mask=None, *, managed_memory=Fal
         default_origin=default_origin,
         mask=mask,
         managed_memory=managed_memory,
+        mmap_path=mmap_path,
+        device=device,
+        first_touch=first_touch,
     )
     storage[...] = 1
     return storage
 
 
-def zeros(backend, default_origin, shape, dtype, mask=None, *, managed_memory=False):
+def zeros(
+    backend,
+    default_origin,
+    shape,
+    dtype,
+    mask=None,
+    *,
+    managed_memory=False,
+    mmap_path=None,
+    device=None,
+    first_touch=False,
+):
     storage = empty(
         shape=shape,
         dtype=dtype,
@@ -62,15 +119,59 @@ def zeros(backend, default_origin, shape, dtype, mask=None, *, managed_memory=Fa
         default_origin=default_origin,
         mask=mask,
         managed_memory=managed_memory,
+        mmap_path=mmap_path,
+        device=device,
+        first_touch=first_touch,
     )
     storage[...] = 0
     return storage
 
 
+def from_file(path, backend, default_origin, shape, dtype, mask=None, *, mode="r+"):
+    """Open a file-backed storage created with the same arguments and `mmap_path=path`.
+
+    The data is not copied, `mode` is the :class:`numpy.memmap` file access mode
+    ("r+", "r" or "c").
+    """
+    if gt_backend.from_name(backend).storage_info["device"] == "gpu":
+        raise ValueError("File-backed storages are only supported by CPU backends.")
+    if mode not in ("r+", "r", "c"):
+        raise ValueError("Invalid file access mode '{}'.".format(mode))
+
+    return CPUStorage(
+        shape=shape,
+        dtype=dtype,
+        backend=backend,
+        default_origin=default_origin,
+        mask=mask,
+        mmap_path=path,
+        mmap_mode=mode,
+    )
+
+
 def from_array(
-    data, backend, default_origin, shape=None, dtype=None, mask=None, *, managed_memory=False
+    data,
+    backend,
+    default_origin,
+    shape=None,
+    dtype=None,
+    mask=None,
+    *,
+    managed_memory=False,
+    copy=True,
 ):
+    """Create a storage with the contents of `data`.
+
+    With `copy=False`, the storage is a view of `data`, which must be a NumPy array with the
+    `shape`, `dtype`, layout and alignment (at `default_origin`) of the backend storages,
+    otherwise a ValueError is raised.
+    """
     is_cupy_array = cp is not None and isinstance(data, cp.ndarray)
+    if not copy:
+        if is_cupy_array or gt_backend.from_name(backend).storage_info["device"] == "gpu":
+            raise ValueError("Zero-copy storages can only be created from NumPy arrays on CPU.")
+        return CPUStorage._from_buffer(data, backend, default_origin, shape, dtype, mask)
+
     xp = cp if is_cupy_array else np
     if shape is None:
         shape = xp.asarray(data).shape
@@ -96,6 +197,157 @@ def from_array(
     return storage
 
 
+def allocate_many(specs, *, backend, soa=False):
+    """Allocate several CPU storages in a single contiguous buffer.
+
+    Parameters
+    ----------
+    specs: mapping
+        names of the storages to their `default_origin`, `shape`, `dtype` and (optional)
+        `mask`, as keyword arguments of :func:`empty`.
+
+    backend: string, backend identifier
+
+    soa: bool
+        if True, the storages with the same specification are interleaved ("structure of
+        arrays"): each row along the innermost dimension of the backend layout is followed
+        by the same row of the next storage.
+
+    Returns
+    -------
+    A dictionary of storages with the keys of `specs`, sharing the same memory arena.
+    """
+    storage_info = gt_backend.from_name(backend).storage_info
+    if storage_info["device"] == "gpu":
+        raise ValueError("Batched allocation is only supported by CPU backends.")
+
+    normalized_specs = {}
+    for name, spec in specs.items():
+        mask = spec.get("mask", None)
+        if mask is None:
+            mask = [True] * len(spec["shape"])
+        dtype = np.dtype(spec["dtype"])
+        normalized_specs[name] = (
+            tuple(storage_utils.normalize_default_origin(spec["default_origin"], mask)),
+            tuple(storage_utils.normalize_shape(spec["shape"], mask)),
+            storage_info["layout_map"](mask),
+            dtype,
+            storage_info["alignment"] * dtype.itemsize,
+            mask,
+        )
+
+    raw_buffer, fields = storage_utils.allocate_arena(
+        [spec[:5] for spec in normalized_specs.values()], soa=soa
+    )
+
+    return {
+        name: CPUStorage._wrap(field, raw_buffer, backend, spec[0], spec[5])
+        for (name, spec), field in zip(normalized_specs.items(), fields)
+    }
+
+
+def load(path, backend=None, *, mode="r+"):
+    """Load a storage saved with :meth:`Storage.save`.
+
+    If the storage layout of `backend` (by default the backend of the saved storage) matches
+    the one of the file, the storage is a memory mapping of the file opened with `mode` (the
+    :class:`numpy.memmap` file access mode "r+", "r" or "c"). Otherwise, or if `mode` is
+    None, the data is copied into a new storage.
+    """
+    if mode not in ("r+", "r", "c", None):
+        raise ValueError("Invalid file access mode '{}'.".format(mode))
+    header = storage_serialization.read_header(path)
+    if backend is None:
+        backend = header["backend"]
+    dtype = header["dtype"]
+    shape = header["shape"]
+    default_origin = header["default_origin"]
+    mask = header["mask"]
+    size = int(np.prod(header["padded_shape"]))
+
+    layout = _padded_layout(backend, default_origin, shape, dtype, mask)
+    if (
+        mode is not None
+        and gt_backend.from_name(backend).storage_info["device"] == "cpu"
+        and layout.padded_shape == header["padded_shape"]
+        and layout.strides == header["strides"]
+        and (header["data_offset"] - layout.halo_offset * dtype.itemsize) % layout.alignment_bytes
+        == 0
+    ):
+        raw_buffer = np.memmap(
+            path, dtype=dtype, mode=mode, offset=header["data_offset"], shape=(size,)
+        )
+        field = np.reshape(raw_buffer, layout.padded_shape)
+        if field.ndim > 0:
+            field.strides = layout.strides
+            field = field[tuple(slice(0, s, None) for s in shape)]
+        return CPUStorage._wrap(field, raw_buffer, backend, default_origin, mask)
+
+    data = np.lib.stride_tricks.as_strided(
+        np.memmap(path, dtype=dtype, mode="r", offset=header["data_offset"], shape=(size,)),
+        shape=shape,
+        strides=header["strides"],
+    )
+    storage = empty(
+        backend=backend, default_origin=default_origin, shape=shape, dtype=dtype, mask=mask
+    )
+    storage[...] = data
+    return storage
+
+
+class _PaddedLayout(NamedTuple):
+    layout_map: Tuple[Optional[int], ...]
+    alignment_bytes: int
+    padded_shape: Tuple[int, ...]
+    strides: Tuple[int, ...]
+    #: Number of items from the start of the field to the first aligned item
+    halo_offset: int
+
+
+def _padded_layout(backend, default_origin, shape, dtype, mask):
+    """Memory layout of the fields of storages, see :func:`gt4py.storage.utils.allocate`."""
+    storage_info = gt_backend.from_name(backend).storage_info
+    layout_map = tuple(storage_info["layout_map"](mask))
+    items_per_alignment = storage_info["alignment"]
+    order_idx = storage_utils.idx_from_order([i for i in layout_map if i is not None])
+    padded_shape = storage_utils.compute_padded_shape(shape, items_per_alignment, order_idx)
+    return _PaddedLayout(
+        layout_map,
+        items_per_alignment * dtype.itemsize,
+        tuple(int(s) for s in padded_shape),
+        tuple(
+            int(s)
+            for s in storage_utils.strides_from_padded_shape(
+                padded_shape, order_idx, dtype.itemsize
+            )
+        ),
+        storage_utils.compute_halo_offset(default_origin, items_per_alignment, order_idx),
+    )
+
+
+def _padded_block(array, raw_buffer, layout):
+    """Bytes of the padded field `array` in `raw_buffer`, or None if not stored there."""
+    size = int(np.prod(layout.padded_shape)) * array.itemsize
+    if not isinstance(raw_buffer, np.ndarray) or array.strides != layout.strides:
+        return None
+    raw_bytes = raw_buffer.reshape(-1).view(np.uint8)
+    start = array.ctypes.data - raw_bytes.ctypes.data
+    if start < 0 or start + size > raw_bytes.size:
+        return None
+    return raw_bytes[start : start + size]
+
+
+@functools.lru_cache(maxsize=None)
+def _layout_checks(backend, mask):
+    """Number of dimensions of the layout map, dimensions by increasing stride and alignment
+    of consistent storages of a backend."""
+    storage_info = gt_backend.from_name(backend).storage_info
+    layout_map = storage_info["layout_map"](mask)
+    unmasked_layout_map = [i for i in layout_map if i is not None]
+    stride_order = tuple(int(dim) for dim in reversed(np.argsort(unmasked_layout_map)))
+    return len(layout_map), stride_order, storage_info["alignment"]
+
+
 class Storage(np.ndarray):
     """
     Storage class based on a numpy (CPU) or cupy (GPU) array, taking care of proper memory alignment, with additional
@@ -104,7 +356,19 @@ class Storage(np.ndarray):
 
     __array_subok__ = True
 
-    def __new__(cls, shape, dtype, backend, default_origin, mask=None):
+    def __new__(
+        cls,
+        shape,
+        dtype,
+        backend,
+        default_origin,
+        mask=None,
+        *,
+        mmap_path=None,
+        mmap_mode="w+",
+        device=None,
+        first_touch=False,
+    ):
         """
         Parameters
         ----------
@@ -127,6 +391,21 @@ class Storage(np.ndarray):
         mask: list of booleans
             False entries indicate that the corresponding dimension is masked, i.e. the storage
             has reduced dimension and reading and writing from offsets along this axis acces the same element.
+
+        mmap_path: path-like, optional
+            if given, the storage memory is a memory-mapped file (CPU storages only).
+
+        mmap_mode: string
+            the :class:`numpy.memmap` file access mode, "w+" creates or overwrites the file.
+
+        device: :class:`gt4py.storage.sync.Device`, optional
+            device memory interface of explicitly synchronized GPU storages (CuPy by default).
+
+        first_touch: bool or int
+            if set, the memory of newly allocated CPU storages is initialized to zero in
+            parallel, by that many threads (`True` for one per CPU), such that its pages are
+            placed on the NUMA nodes of the threads computing on them (see
+            :func:`gt4py.storage.utils.first_touch`).
         """
 
         if mask is None:
@@ -140,7 +419,22 @@ class Storage(np.ndarray):
         alignment = gt_backend.from_name(backend).storage_info["alignment"]
         layout_map = gt_backend.from_name(backend).storage_info["layout_map"](mask)
 
-        obj = cls._construct(backend, np.dtype(dtype), default_origin, shape, alignment, layout_map)
+        construct_kwargs = {}
+        if mmap_path is not None:
+            construct_kwargs.update(mmap_path=mmap_path, mmap_mode=mmap_mode)
+        if device is not None:
+            construct_kwargs.update(device=device)
+        if first_touch:
+            construct_kwargs.update(first_touch=first_touch)
+        obj = cls._construct(
+            backend,
+            np.dtype(dtype),
+            default_origin,
+            shape,
+            alignment,
+            layout_map,
+            **construct_kwargs,
+        )
         obj._backend = backend
         obj.is_stencil_view = True
         obj._mask = mask
@@ -174,6 +468,105 @@ class Storage(np.ndarray):
             res.is_stencil_view = False
         return res
 
+    def save(self, path):
+        """
+        Save the storage to a file, which can be loaded with :func:`gt4py.storage.load`.
+
+        The file contains a header describing the storage and its raw padded buffer in the
+        layout of the backend.
+        """
+        self.synchronize()
+        array = self.view(np.ndarray)
+        layout = _padded_layout(
+            self.backend, self.default_origin, self.shape, self.dtype, self.mask
+        )
+        block = _padded_block(array, getattr(self, "_raw_buffer", None), layout)
+        if block is None:
+            # views and storages in other memory (e.g. on GPUs) are copied first
+            raw_buffer, field = storage_utils.allocate_cpu(
+                self.default_origin,
+                self.shape,
+                layout.layout_map,
+                self.dtype,
+                layout.alignment_bytes,
+            )
+            field[...] = array
+            block = _padded_block(field, raw_buffer, layout)
+
+        header = dict(
+            backend=self.backend,
+            dtype=self.dtype,
+            shape=[int(s) for s in self.shape],
+            mask=[bool(m) for m in self.mask],
+            default_origin=[int(o) for o in self.default_origin],
+            layout_map=list(layout.layout_map),
+            alignment_bytes=layout.alignment_bytes,
+            padded_shape=list(layout.padded_shape),
+            strides=list(layout.strides),
+        )
+        storage_serialization.write(path, header, block, layout.halo_offset * self.itemsize)
+
+    def to_backend(self, backend, *, inplace=False):
+        """
+        Copy the storage into a new storage of `backend`, in the layout of that backend.
+
+        Between CPU backends, the data is copied with the cache-blocked transposition of
+        :func:`gt4py.storage.utils.blocked_copy`. With `inplace=True`, the raw buffer of a
+        CPU storage is reused for the new storage if it is large enough (staging the data
+        in a temporary copy), and the original storage must not be used anymore.
+        """
+        devices = {
+            gt_backend.from_name(name).storage_info["device"] for name in (self.backend, backend)
+        }
+        storage_args = dict(
+            default_origin=self.default_origin, shape=self.shape, dtype=self.dtype, mask=self.mask
+        )
+        if devices != {"cpu"}:
+            self.synchronize()
+            res = empty(backend=backend, **storage_args)
+            res[...] = self.view(np.ndarray)
+            return res
+
+        layout = _padded_layout(backend, self.default_origin, self.shape, self.dtype, self.mask)
+        array = self.view(np.ndarray)
+        raw_buffer = getattr(self, "_raw_buffer", None)
+        if inplace and self._can_relayout(layout):
+            array = array.copy(order="K")
+
+            def allocate_f(size, dtype):
+                return raw_buffer[:size], raw_buffer
+
+            _, field = storage_utils.allocate(
+                self.default_origin,
+                self.shape,
+                layout.layout_map,
+                self.dtype,
+                layout.alignment_bytes,
+                allocate_f,
+            )
+            storage_utils.blocked_copy(field, array)
+            return CPUStorage._wrap(field, raw_buffer, backend, self.default_origin, self.mask)
+
+        res = empty(backend=backend, **storage_args)
+        storage_utils.blocked_copy(res.view(np.ndarray), array)
+        return res
+
+    def _can_relayout(self, layout):
+        """Whether the raw buffer only holds this storage and fits the padded `layout`."""
+        raw_buffer = getattr(self, "_raw_buffer", None)
+        if not isinstance(raw_buffer, np.ndarray) or raw_buffer.dtype != self.dtype:
+            return False
+        own_layout = _padded_layout(
+            self.backend, self.default_origin, self.shape, self.dtype, self.mask
+        )
+        own_items = int(np.prod(own_layout.padded_shape))
+        items_per_alignment = layout.alignment_bytes // self.itemsize
+        return (
+            _padded_block(self.view(np.ndarray), raw_buffer, own_layout) is not None
+            and raw_buffer.size == own_items + own_layout.alignment_bytes // self.itemsize - 1
+            and raw_buffer.size >= int(np.prod(layout.padded_shape)) + items_per_alignment - 1
+        )
+
     def __deepcopy__(self, memo={}):
         return self.copy()
 
@@ -189,6 +582,26 @@ class Storage(np.ndarray):
         res.is_stencil_view = self.is_stencil_view
         return res
 
+    @property
+    def is_stencil_view(self):
+        """
+        Whether the storage is consistent with its layout and can be passed to stencils.
+
+        The consistency of views with the array they were created from is only checked the
+        first time this is accessed (e.g. when the view is passed to a stencil), until then
+        the view keeps a reference to that array.
+        """
+        parent = self.__dict__.get("_view_parent", None)
+        if parent is not None:
+            self._view_parent = None
+            self._is_stencil_view = self._is_consistent_view_of(parent)
+        return self._is_stencil_view
+
+    @is_stencil_view.setter
+    def is_stencil_view(self, value):
+        self._view_parent = None
+        self._is_stencil_view = value
+
     def __array_finalize__(self, obj):
         if obj is None:
             # constructor called previously
@@ -205,29 +618,35 @@ class Storage(np.ndarray):
                         "Meta information can not be inferred when creating Storage views from other classes than Storage."
                     )
                 self.__dict__ = {**obj.__dict__, **self.__dict__}
-                self.is_stencil_view = False
-                if not hasattr(obj, "default_origin"):
-                    self.is_stencil_view = True
-                elif self._is_consistent(obj):
-                    self.is_stencil_view = obj.is_stencil_view
+                if self.base is obj or self.base is obj.base:
+                    # views share the memory of obj: defer the check, see is_stencil_view
+                    self._view_parent = obj
+                else:
+                    self.is_stencil_view = self._is_consistent_view_of(obj)
                 self._finalize_view(obj)
 
+    def _is_consistent_view_of(self, obj):
+        if not hasattr(obj, "default_origin"):
+            return True
+        return self._is_consistent(obj) and obj.is_stencil_view
+
     def _is_consistent(self, obj):
         if not self.shape == obj.shape:
             return False
+        ndim, stride_order, alignment = _layout_checks(self.backend, tuple(self.mask))
         # check strides
-        stride = 0
-        if len(self.strides) < len(self.layout_map):
+        strides = self.strides
+        if len(strides) < ndim:
             return False
-        for dim in reversed(np.argsort(self.layout_map)):
-            if self.strides[dim] < stride:
+        stride = 0
+        for dim in stride_order:
+            if strides[dim] < stride:
                 return False
-            stride = self.strides[dim]
+            stride = strides[dim]
 
         # check alignment
-        if (
-            self.ctypes.data + np.sum([o * s for o, s in zip(self.default_origin, self.strides)])
-        ) % gt_backend.from_name(self.backend).storage_info["alignment"]:
+        offset = sum(o * s for o, s in zip(self.default_origin, strides))
+        if (self.__array_interface__["data"][0] + offset) % alignment:
             return False
 
         return True
@@ -324,16 +743,102 @@ class CPUStorage(Storage):
         return self._ndarray.ctypes.data
 
     @classmethod
-    def _construct(cls, backend, dtype, default_origin, shape, alignment, layout_map):
-        (raw_buffer, field) = storage_utils.allocate_cpu(
-            default_origin, shape, layout_map, dtype, alignment * dtype.itemsize
-        )
+    def _construct(
+        cls,
+        backend,
+        dtype,
+        default_origin,
+        shape,
+        alignment,
+        layout_map,
+        *,
+        mmap_path=None,
+        mmap_mode="w+",
+        first_touch=False,
+    ):
+        pool = storage_pool.active_pool()
+        if mmap_path is not None:
+            (raw_buffer, field) = storage_utils.allocate_mmap(
+                default_origin,
+                shape,
+                layout_map,
+                dtype,
+                alignment * dtype.itemsize,
+                mmap_path,
+                mmap_mode,
+            )
+        elif pool is not None:
+            (raw_buffer, field) = pool.allocate(
+                backend, default_origin, shape, layout_map, dtype, alignment * dtype.itemsize
+            )
+        else:
+            (raw_buffer, field) = storage_utils.allocate_cpu(
+                default_origin, shape, layout_map, dtype, alignment * dtype.itemsize
+            )
+            # recycled and file-backed buffers are already placed
+            if first_touch:
+                n_threads = os.cpu_count() if first_touch is True else int(first_touch)
+                storage_utils.first_touch(raw_buffer, field, n_threads)
         obj = field.view(_ViewableNdarray)
         obj = obj.view(CPUStorage)
         obj._raw_buffer = raw_buffer
         obj.default_origin = default_origin
         return obj
 
+    @classmethod
+    def _from_buffer(cls, data, backend, default_origin, shape, dtype, mask):
+        if not isinstance(data, np.ndarray):
+            raise ValueError("Zero-copy storages can only be created from NumPy arrays.")
+        data = data.view(np.ndarray)
+        if mask is None:
+            mask = [True] * data.ndim
+        default_origin = tuple(storage_utils.normalize_default_origin(default_origin, mask))
+        if shape is not None and tuple(storage_utils.normalize_shape(shape, mask)) != data.shape:
+            raise ValueError("Shape {} of the data does not match {}.".format(data.shape, shape))
+        if dtype is not None and np.dtype(dtype) != data.dtype:
+            raise ValueError("Dtype {} of the data does not match {}.".format(data.dtype, dtype))
+        if data.ndim != sum(mask) or len(default_origin) != data.ndim:
+            raise ValueError("Dimensions of the data do not match the mask.")
+
+        storage_info = gt_backend.from_name(backend).storage_info
+        layout_map = [i for i in storage_info["layout_map"](mask) if i is not None]
+        # strides must grow in the layout order, padding is allowed
+        min_stride = data.itemsize
+        for dim in reversed(np.argsort(layout_map)):
+            if data.shape[dim] > 1:
+                if data.strides[dim] < min_stride:
+                    raise ValueError(
+                        "Strides {} of the data do not match the '{}' layout {}.".format(
+                            data.strides, backend, tuple(layout_map)
+                        )
+                    )
+                min_stride = data.strides[dim] * data.shape[dim]
+        origin_ptr = data.ctypes.data + sum(o * s for o, s in zip(default_origin, data.strides))
+        if origin_ptr % (storage_info["alignment"] * data.itemsize):
+            raise ValueError(
+                "Data at the default origin is not aligned to {} elements.".format(
+                    storage_info["alignment"]
+                )
+            )
+
+        obj = cls._wrap(data, data, backend, default_origin, mask)
+        if not storage_info["is_compatible_layout"](obj):
+            raise ValueError("Data layout is not compatible with the '{}' backend.".format(backend))
+
+        return obj
+
+    @classmethod
+    def _wrap(cls, field, raw_buffer, backend, default_origin, mask):
+        obj = field.view(_ViewableNdarray)
+        obj = obj.view(cls)
+        obj._raw_buffer = raw_buffer
+        obj.default_origin = default_origin
+        obj._backend = backend
+        obj.is_stencil_view = True
+        obj._mask = mask
+        obj._check_data()
+        return obj
+
     def _check_data(self):
         # check that memory of field is within raw_buffer and that field is a view of raw_buffer
         if (
@@ -348,6 +853,15 @@ class CPUStorage(Storage):
     def data(self):
         return self.view(np.ndarray)
 
+    @property
+    def is_file_backed(self):
+        return isinstance(self._raw_buffer, np.memmap)
+
+    def flush(self):
+        """Write the changes of a file-backed storage to disk."""
+        if self.is_file_backed:
+            self._raw_buffer.flush()
+
     def copy(self):
         res = super().copy()
         res[...] = self
@@ -355,41 +869,64 @@ class CPUStorage(Storage):
 
 
 class ExplicitlySyncedGPUStorage(Storage):
-    class SyncState:
-        SYNC_CLEAN = 0
-        SYNC_HOST_DIRTY = 1
-        SYNC_DEVICE_DIRTY = 2
+    """
+    Storage with separate host and device buffers, synchronized on demand.
 
-        def __init__(self):
-            self.state = self.SYNC_CLEAN
+    The synchronization state is tracked per block of :attr:`SYNC_BLOCK_BYTES` bytes of the
+    raw buffers (shared by all views of a storage), and each view only transfers the
+    modified blocks it spans.
+    """
 
-    def __init__(self, *args, **kwargs):
-        self._sync_state = self.SyncState()
+    #: Granularity of the synchronization state
+    SYNC_BLOCK_BYTES = 1 << 16
 
     def copy(self):
-        res = super().copy()
-        res._sync_state = self.SyncState()
-        res._sync_state.state = self._sync_state.state
-        res[...] = self
+        self.synchronize()
+        res = empty(
+            shape=self.shape,
+            dtype=self.dtype,
+            backend=self.backend,
+            default_origin=self.default_origin,
+            mask=self.mask,
+            device=self._device,
+        )
+        res.is_stencil_view = self.is_stencil_view
+        # both buffers are up to date, copy them without marking anything as modified
+        res.view(_ViewableNdarray).view(np.ndarray)[...] = self.view(_ViewableNdarray)
         res._device_field[...] = self._device_field
         return res
 
     @classmethod
-    def _construct(cls, backend, dtype, default_origin, shape, alignment, layout_map):
-
+    def _construct(
+        cls, backend, dtype, default_origin, shape, alignment, layout_map, *, device=None
+    ):
+        if device is None:
+            device = storage_sync.CupyDevice()
         (
             raw_buffer,
             field,
             device_raw_buffer,
             device_field,
         ) = storage_utils.allocate_gpu_unmanaged(
-            default_origin, shape, layout_map, dtype, alignment * dtype.itemsize
+            default_origin, shape, layout_map, dtype, alignment * dtype.itemsize, device
         )
         obj = field.view(_ViewableNdarray)
         obj = obj.view(ExplicitlySyncedGPUStorage)
         obj._raw_buffer = raw_buffer
+        obj._device = device
         obj._device_field = device_field
         obj._device_raw_buffer = device_raw_buffer
+        # the host and device fields may have different offsets in their raw buffers
+        extent = sum((n - 1) * stride for n, stride in zip(field.shape, field.strides))
+        size = extent // dtype.itemsize + 1 if field.size else 0
+        host_offset = (field.ctypes.data - raw_buffer.ctypes.data) // dtype.itemsize
+        device_offset = (device.ptr(device_field) - device.ptr(device_raw_buffer)) // dtype.itemsize
+        obj._sync_state = storage_sync.BlockSyncState(
+            raw_buffer[host_offset : host_offset + size],
+            device_raw_buffer[device_offset : device_offset + size],
+            device,
+            max(cls.SYNC_BLOCK_BYTES // dtype.itemsize, 1),
+        )
         obj.default_origin = default_origin
 
         return obj
@@ -398,88 +935,89 @@ class ExplicitlySyncedGPUStorage(Storage):
     def data(self):
         return self._device_field
 
+    def _span(self, array=None):
+        """Range of the synchronized buffer items spanned by `array` (a view of this storage)."""
+        if array is None:
+            array = self.view(np.ndarray)
+        start = (array.ctypes.data - self._sync_state.host_buffer.ctypes.data) // self.itemsize
+        if array.size == 0:
+            return start, start
+        lower = sum((n - 1) * s for n, s in zip(array.shape, array.strides) if s < 0)
+        upper = sum((n - 1) * s for n, s in zip(array.shape, array.strides) if s > 0)
+        return start + lower // self.itemsize, start + upper // self.itemsize + 1
+
+    def _key_span(self, key):
+        """Range of the items accessed with `key`, the whole storage for advanced indexing."""
+        key = key if isinstance(key, tuple) else (key,)
+        if any(
+            not (isinstance(k, (slice, numbers.Integral)) or k is Ellipsis or k is None)
+            for k in key
+        ):
+            return self._span()
+        if Ellipsis not in key:
+            key = key + (Ellipsis,)
+        return self._span(self.view(np.ndarray)[key])
+
     def synchronize(self):
-        if self._is_host_modified:
-            self.host_to_device()
-        elif self._is_device_modified:
-            self.device_to_host()
-        self._set_clean()
+        self.host_to_device()
+        self.device_to_host()
 
     def host_to_device(self, force=False):
-        if force or self._is_host_modified:
-            self._set_clean()
-            self._device_raw_buffer.set(self._raw_buffer)
+        self._sync_state.to_device(*self._span(), force=force)
 
     def device_to_host(self, force=False):
-        if force or self._is_device_modified:
-            self._set_clean()
-            self._device_raw_buffer.get(out=self._raw_buffer)
+        self._sync_state.to_host(*self._span(), force=force)
 
     def __getitem__(self, item):
-        if self._is_device_modified:
-            self.device_to_host()
+        self._sync_state.to_host(*self._key_span(item))
         return super().__getitem__(item)
 
     @property
     def _is_clean(self):
-        return self._sync_state.state == self.SyncState.SYNC_CLEAN
+        return not (self._is_host_modified or self._is_device_modified)
 
     @property
     def _is_host_modified(self):
-        return self._sync_state.state == self.SyncState.SYNC_HOST_DIRTY
+        return self._sync_state.is_host_dirty(*self._span())
 
     @property
     def _is_device_modified(self):
-        return self._sync_state.state == self.SyncState.SYNC_DEVICE_DIRTY
+        return self._sync_state.is_device_dirty(*self._span())
 
     def _set_clean(self):
-        self._sync_state.state = self.SyncState.SYNC_CLEAN
+        self._sync_state.mark_clean(*self._span())
 
     def _set_host_modified(self):
-        self._sync_state.state = self.SyncState.SYNC_HOST_DIRTY
+        self._sync_state.mark_host_dirty(*self._span())
 
     def _set_device_modified(self):
-        self._sync_state.state = self.SyncState.SYNC_DEVICE_DIRTY
+        self._sync_state.mark_device_dirty(*self._span())
 
     def __setitem__(self, key, value):
+        span = self._key_span(key)
         if isinstance(value, ExplicitlySyncedGPUStorage):
-            if (self._is_clean or self._is_device_modified) and (
-                value._is_clean or value._is_device_modified
-            ):
-                self._set_device_modified()
+            if not self._sync_state.is_host_dirty(*span) and not value._is_host_modified:
+                self._sync_state.mark_device_dirty(*span)
                 self._device_field[key] = value._device_field
                 return value
-            elif (self._is_clean or self._is_host_modified) and (
-                value._is_clean or value._is_host_modified
-            ):
-                self._set_host_modified()
+            elif not self._sync_state.is_device_dirty(*span) and not value._is_device_modified:
+                self._sync_state.mark_host_dirty(*span)
                 return self.view(_ViewableNdarray).view(np.ndarray).__setitem__(key, value)
             else:
-                if self._is_host_modified:
-                    self.host_to_device()
-                else:
-                    value.host_to_device()
-                self._set_device_modified()
+                value.host_to_device()
+                self._sync_state.mark_device_dirty(*span)
                 self._device_field.__setitem__(key, value._device_field)
                 return value
         elif hasattr(value, "__cuda_array_interface__"):
-            if self._is_host_modified:
-                self.host_to_device()
-            self._set_device_modified()
+            self._sync_state.mark_device_dirty(*span)
             return self._device_field.__setitem__(key, value)
         else:
-            if self._is_device_modified:
-                self.device_to_host()
-            self._set_host_modified()
+            self._sync_state.mark_host_dirty(*span)
             return super().__setitem__(key, value)
 
-    # @property
-    # def sync_state(self):
-    #     return self._sync_state.state
-
     @property
     def _ptr(self):
-        return self.data.ptr
+        return self._device.ptr(self.data)
 
     def _check_data(self):
 
@@ -493,16 +1031,18 @@ class ExplicitlySyncedGPUStorage(Storage):
             raise Exception("The buffers are in an inconsistent state.")
 
         # check that memory of field is within raw_buffer
+        device_ptr = self._device.ptr(self._device_field)
+        device_raw_ptr = self._device.ptr(self._device_raw_buffer)
+        device_raw_end_ptr = self._device.ptr(self._device_raw_buffer[-1:])
         if (
-            not self._device_field.data.ptr >= self._device_raw_buffer.data.ptr
-            and self._device_field.data.ptr + self.itemsize * (self.size - 1)
-            <= self._device_raw_buffer[-1:].data.ptr
+            not device_ptr >= device_raw_ptr
+            and device_ptr + self.itemsize * (self.size - 1) <= device_raw_end_ptr
         ):
             raise Exception("The buffers are in an inconsistent state.")
 
     def transpose(self, *axes):
         res = super().transpose(*axes)
-        res._device_field = cp.lib.stride_tricks.as_strided(
+        res._device_field = self._device.as_strided(
             res._device_raw_buffer, shape=res.shape, strides=res.strides
         )
         return res
@@ -511,12 +1051,12 @@ class ExplicitlySyncedGPUStorage(Storage):
 
         if self.shape != base.shape or self.strides != base.strides:
             offset = (base.ctypes.data - self.ctypes.data) + (
-                self._device_field.data.ptr - self._device_raw_buffer.data.ptr
+                self._device.ptr(self._device_field) - self._device.ptr(self._device_raw_buffer)
             )
             assert not offset % self.dtype.itemsize
             offset = int(offset / self.dtype.itemsize)
             raw_with_offset = self._device_raw_buffer[offset:]
-            self._device_field = cp.lib.stride_tricks.as_strided(
+            self._device_field = self._device.as_strided(
                 raw_with_offset, shape=self.shape, strides=self.strides
             )
 
@@ -528,36 +1068,26 @@ class ExplicitlySyncedGPUStorage(Storage):
         return res
 
     def _call_inplace(self, fname, other):
+        span = self._span()
         if isinstance(other, ExplicitlySyncedGPUStorage):
-            if (self._is_clean or self._is_device_modified) and (
-                other._is_clean or other._is_device_modified
-            ):
-                self._set_device_modified()
+            if not self._is_host_modified and not other._is_host_modified:
+                self._sync_state.mark_device_dirty(*span)
                 getattr(self._device_field, fname)(other)
                 return self
-            elif (self._is_clean or self._is_host_modified) and (
-                other._is_clean or other._is_host_modified
-            ):
-                self._set_host_modified()
+            elif not self._is_device_modified and not other._is_device_modified:
+                self._sync_state.mark_host_dirty(*span)
                 return getattr(super(), fname)(other)
             else:
-                if self._is_host_modified:
-                    self.host_to_device()
-                else:
-                    other.host_to_device()
-                self._set_device_modified()
+                other.host_to_device()
+                self._sync_state.mark_device_dirty(*span)
                 getattr(self._device_field, fname)(other)
                 return self
         elif hasattr(other, "__cuda_array_interface__"):
-            if self._is_host_modified:
-                self.host_to_device()
-            self._set_device_modified()
+            self._sync_state.mark_device_dirty(*span)
             getattr(self._device_field, fname)(other)
             return self
         else:
-            if self._is_device_modified:
-                self.device_to_host()
-            self._set_host_modified()
+            self._sync_state.mark_host_dirty(*span)
             return getattr(super(), fname)(other)
 
     def __iadd__(self, other):
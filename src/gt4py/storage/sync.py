@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Host/device synchronization of explicitly synchronized GPU storages.
+
+Device memory is accessed through a :class:`Device` interface: :class:`CupyDevice` for
+GPUs and :class:`NumpyDevice`, a fake device in host memory counting the transfers, to
+develop and test the synchronization logic on CPU-only machines.
+
+The synchronization state is tracked per block of the raw buffers, such that only the
+modified blocks are transferred.
+"""
+
+import abc
+from typing import Any, Tuple
+
+import numpy as np
+
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+
+class Device(abc.ABC):
+    """Interface of the device memory used by explicitly synchronized storages.
+
+    Buffers are one-dimensional, transfers copy the [start, stop) range of items between
+    a host buffer and a device buffer of the same size.
+    """
+
+    @abc.abstractmethod
+    def empty(self, size: int, dtype: np.dtype) -> Any:
+        """Allocate a device buffer."""
+        pass
+
+    @abc.abstractmethod
+    def empty_host(self, size: int, dtype: np.dtype) -> np.ndarray:
+        """Allocate a host buffer suitable for transfers."""
+        pass
+
+    @abc.abstractmethod
+    def ptr(self, array: Any) -> int:
+        """Address of the first item of a device array."""
+        pass
+
+    @abc.abstractmethod
+    def as_strided(self, array: Any, shape: Tuple[int, ...], strides: Tuple[int, ...]) -> Any:
+        pass
+
+    @abc.abstractmethod
+    def to_device(self, device_buffer: Any, host_buffer: np.ndarray, start: int, stop: int):
+        pass
+
+    @abc.abstractmethod
+    def to_host(self, host_buffer: np.ndarray, device_buffer: Any, start: int, stop: int):
+        pass
+
+
+class CupyDevice(Device):
+    """CUDA device memory managed by CuPy, with page-locked host buffers."""
+
+    def empty(self, size, dtype):
+        return cp.empty((size,), dtype=dtype)
+
+    def empty_host(self, size, dtype):
+        dtype = np.dtype(dtype)
+        return np.frombuffer(cp.cuda.alloc_pinned_memory(size * dtype.itemsize), dtype, size)
+
+    def ptr(self, array):
+        return array.data.ptr
+
+    def as_strided(self, array, shape, strides):
+        return cp.lib.stride_tricks.as_strided(array, shape=shape, strides=strides)
+
+    def to_device(self, device_buffer, host_buffer, start, stop):
+        device_buffer[start:stop].set(host_buffer[start:stop])
+
+    def to_host(self, host_buffer, device_buffer, start, stop):
+        device_buffer[start:stop].get(out=host_buffer[start:stop])
+
+
+class NumpyDevice(Device):
+    """Fake device keeping the "device" memory in NumPy arrays and counting the transfers."""
+
+    def __init__(self):
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.n_transfers = 0
+        self.bytes_to_device = 0
+        self.bytes_to_host = 0
+
+    def empty(self, size, dtype):
+        return np.empty((size,), dtype=dtype)
+
+    def empty_host(self, size, dtype):
+        return np.empty((size,), dtype=dtype)
+
+    def ptr(self, array):
+        return array.ctypes.data
+
+    def as_strided(self, array, shape, strides):
+        return np.lib.stride_tricks.as_strided(array, shape=shape, strides=strides)
+
+    def to_device(self, device_buffer, host_buffer, start, stop):
+        device_buffer[start:stop] = host_buffer[start:stop]
+        self.n_transfers += 1
+        self.bytes_to_device += (stop - start) * host_buffer.itemsize
+
+    def to_host(self, host_buffer, device_buffer, start, stop):
+        host_buffer[start:stop] = device_buffer[start:stop]
+        self.n_transfers += 1
+        self.bytes_to_host += (stop - start) * host_buffer.itemsize
+
+
+def _runs(flags: np.ndarray):
+    """Yield the (start, stop) indices of the runs of True values."""
+    padded = np.concatenate(([False], flags, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return zip(edges[::2], edges[1::2])
+
+
+class BlockSyncState:
+    """
+    Synchronization state of a pair of host and device buffers, per block of items.
+
+    Blocks are either clean, modified on the host or modified on the device. Marking a
+    range as modified on one side first transfers the blocks of the range modified on the
+    other side, so that transfers of whole blocks never overwrite newer data.
+
+    Parameters
+    ----------
+    host_buffer, device_buffer :
+        Raw buffers of the storage (and all its views).
+
+    device :
+        Device interface of the device buffer.
+
+    block_size :
+        Number of items per block.
+    """
+
+    def __init__(self, host_buffer, device_buffer, device: Device, block_size: int):
+        self.host_buffer = host_buffer
+        self.device_buffer = device_buffer
+        self.device = device
+        self.block_size = max(int(block_size), 1)
+        n_blocks = -(-host_buffer.size // self.block_size)
+        self.host_dirty = np.zeros(n_blocks, dtype=bool)
+        self.device_dirty = np.zeros(n_blocks, dtype=bool)
+
+    def _blocks(self, start: int, stop: int) -> slice:
+        if stop <= start:
+            return slice(0, 0)
+        return slice(start // self.block_size, -(-stop // self.block_size))
+
+    def is_host_dirty(self, start: int, stop: int) -> bool:
+        return bool(self.host_dirty[self._blocks(start, stop)].any())
+
+    def is_device_dirty(self, start: int, stop: int) -> bool:
+        return bool(self.device_dirty[self._blocks(start, stop)].any())
+
+    def mark_host_dirty(self, start: int, stop: int) -> None:
+        self.to_host(start, stop)
+        self.host_dirty[self._blocks(start, stop)] = True
+
+    def mark_device_dirty(self, start: int, stop: int) -> None:
+        self.to_device(start, stop)
+        self.device_dirty[self._blocks(start, stop)] = True
+
+    def mark_clean(self, start: int, stop: int) -> None:
+        blocks = self._blocks(start, stop)
+        self.host_dirty[blocks] = False
+        self.device_dirty[blocks] = False
+
+    def to_device(self, start: int, stop: int, *, force: bool = False) -> None:
+        """Transfer the blocks of the range modified on the host (or the whole range)."""
+        self._transfer(self.host_dirty, self.device.to_device, start, stop, force)
+
+    def to_host(self, start: int, stop: int, *, force: bool = False) -> None:
+        """Transfer the blocks of the range modified on the device (or the whole range)."""
+        self._transfer(self.device_dirty, self.device.to_host, start, stop, force)
+
+    def _transfer(self, dirty, transfer, start, stop, force):
+        blocks = self._blocks(start, stop)
+        if force:
+            dirty[blocks] = True
+        if dirty is self.host_dirty:
+            dst, src = self.device_buffer, self.host_buffer
+        else:
+            dst, src = self.host_buffer, self.device_buffer
+        for run_start, run_stop in _runs(dirty[blocks]):
+            item_start = (blocks.start + run_start) * self.block_size
+            item_stop = min((blocks.start + run_stop) * self.block_size, self.host_buffer.size)
+            transfer(dst, src, item_start, item_stop)
+        if force:
+            self.mark_clean(start, stop)
+        else:
+            dirty[blocks] = False
@@ -14,8 +14,11 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import concurrent.futures
+import itertools
 import math
 import numbers
+import os
 from typing import Optional, Sequence
 
 import numpy as np
@@ -23,10 +26,11 @@ import numpy as np
 import gt4py.utils as gt_util
 from gt4py.definitions import Index, Shape
 
+from .sync import CupyDevice
+
 
 try:
     import cupy as cp
-    from cupy.lib.stride_tricks import as_strided
 except ImportError:
     pass
 
@@ -114,6 +118,17 @@ def strides_from_padded_shape(padded_size, order_idx, itemsize):
     return list(strides)
 
 
+def compute_halo_offset(default_origin, items_per_alignment, order_idx):
+    """Number of items before the start of the field such that default_origin is aligned."""
+    if len(order_idx) > 0:
+        return (
+            int(math.ceil(default_origin[order_idx[-1]] / items_per_alignment))
+            * items_per_alignment
+            - default_origin[order_idx[-1]]
+        )
+    return 0
+
+
 def allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f):
     dtype = np.dtype(dtype)
     assert (
@@ -126,14 +141,7 @@ def allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate
     padded_shape = compute_padded_shape(shape, items_per_alignment, order_idx)
 
     strides = strides_from_padded_shape(padded_shape, order_idx, itemsize)
-    if len(order_idx) > 0:
-        halo_offset = (
-            int(math.ceil(default_origin[order_idx[-1]] / items_per_alignment))
-            * items_per_alignment
-            - default_origin[order_idx[-1]]
-        )
-    else:
-        halo_offset = 0
+    halo_offset = compute_halo_offset(default_origin, items_per_alignment, order_idx)
 
     padded_size = int(np.prod(padded_shape))
     buffer_size = padded_size + items_per_alignment - 1
@@ -150,7 +158,121 @@ def allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate
     return raw_buffer, field
 
 
-def allocate_gpu_unmanaged(default_origin, shape, layout_map, dtype, alignment_bytes):
+def allocate_arena(specs, soa=False):
+    """Allocate the fields of several CPU storages in a single buffer.
+
+    Parameters
+    ----------
+    specs: sequence of tuples
+        (default_origin, shape, layout_map, dtype, alignment_bytes) of each field.
+
+    soa: bool
+        if True, the fields with the same specification are interleaved: each row of
+        the innermost dimension of a field is followed by the same row of the next one.
+
+    Returns
+    -------
+    The raw buffer (of bytes) and the list of the fields.
+    """
+    # group the fields sharing their specification (each one alone without soa)
+    groups = {}
+    for n, (default_origin, shape, layout_map, dtype, alignment_bytes) in enumerate(specs):
+        key = (
+            (
+                tuple(default_origin),
+                tuple(shape),
+                tuple(layout_map),
+                np.dtype(dtype),
+                alignment_bytes,
+            )
+            if soa
+            else n
+        )
+        groups.setdefault(key, []).append(n)
+
+    # byte offsets in an arena aligned to all alignments
+    arena_alignment = int(np.lcm.reduce([spec[4] for spec in specs], initial=1))
+    layouts = []
+    arena_size = 0
+    for indices in groups.values():
+        default_origin, shape, layout_map, dtype, alignment_bytes = specs[indices[0]]
+        dtype = np.dtype(dtype)
+        assert (
+            alignment_bytes % dtype.itemsize
+        ) == 0, "Alignment must be a multiple of byte-width of dtype."
+        items_per_alignment = alignment_bytes // dtype.itemsize
+        order_idx = idx_from_order([i for i in layout_map if i is not None])
+        padded_shape = compute_padded_shape(shape, items_per_alignment, order_idx)
+        strides = strides_from_padded_shape(padded_shape, order_idx, dtype.itemsize)
+        n_fields = len(indices)
+        row_size = dtype.itemsize
+        if len(order_idx) > 0:
+            row_size *= padded_shape[order_idx[-1]]
+            # the outer strides span the rows of all interleaved fields
+            strides = [s if d == order_idx[-1] else s * n_fields for d, s in enumerate(strides)]
+        halo_bytes = compute_halo_offset(default_origin, items_per_alignment, order_idx) * (
+            dtype.itemsize
+        )
+        start = arena_size + (halo_bytes - arena_size) % alignment_bytes
+        for i, n in enumerate(indices):
+            layouts.append((n, padded_shape, strides, dtype, start + i * row_size))
+        arena_size = start + n_fields * int(np.prod(padded_shape)) * dtype.itemsize
+
+    raw_buffer = np.empty(arena_size + arena_alignment - 1, dtype=np.uint8)
+    base_offset = (-raw_buffer.ctypes.data) % arena_alignment
+
+    fields = [None] * len(specs)
+    for n, padded_shape, strides, dtype, offset in layouts:
+        field = np.ndarray(
+            padded_shape,
+            dtype=dtype,
+            buffer=raw_buffer,
+            offset=base_offset + offset,
+            strides=strides,
+        )
+        if field.ndim > 0:
+            field = field[tuple(slice(0, s, None) for s in specs[n][1])]
+        fields[n] = field
+
+    return raw_buffer, fields
+
+
+def blocked_copy(dst, src, *, tile=64, block_bytes=1 << 18):
+    """Copy `src` into `dst` (NumPy arrays of the same shape) tile by tile.
+
+    If the innermost (smallest stride) dimensions of the two arrays differ, the copy is a
+    transposition and the arrays are traversed in blocks of about `block_bytes` bytes,
+    `tile` items wide along both innermost dimensions, such that both the reads and the
+    writes of a block stay in cache.
+    """
+    if dst.shape != src.shape:
+        raise ValueError("Shapes {} and {} do not match.".format(dst.shape, src.shape))
+
+    def innermost(array):
+        axes = [i for i in range(array.ndim) if array.shape[i] > 1]
+        return min(axes, key=lambda i: abs(array.strides[i]), default=None)
+
+    src_axis, dst_axis = innermost(src), innermost(dst)
+    if src_axis == dst_axis:
+        np.copyto(dst, src)
+        return
+
+    steps = [1] * dst.ndim
+    steps[src_axis] = steps[dst_axis] = tile
+    remaining = max(block_bytes // (tile * tile * dst.itemsize), 1)
+    for axis in sorted(range(dst.ndim), key=lambda i: abs(dst.strides[i])):
+        if axis not in (src_axis, dst_axis):
+            steps[axis] = min(remaining, dst.shape[axis])
+            remaining = max(remaining // steps[axis], 1)
+
+    for start in itertools.product(*(range(0, n, step) for n, step in zip(dst.shape, steps))):
+        block = tuple(slice(i, i + step) for i, step in zip(start, steps))
+        np.copyto(dst[block], src[block])
+
+
+def allocate_gpu_unmanaged(default_origin, shape, layout_map, dtype, alignment_bytes, device=None):
+    if device is None:
+        device = CupyDevice()
     dtype = np.dtype(dtype)
     assert (
         alignment_bytes % dtype.itemsize
@@ -174,9 +296,8 @@ def allocate_gpu_unmanaged(default_origin, shape, layout_map, dtype, alignment_b
     padded_size = int(np.prod(padded_shape))
     buffer_size = padded_size + items_per_alignment - 1
 
-    ptr = cp.cuda.alloc_pinned_memory(buffer_size * itemsize)
-    raw_buffer = np.frombuffer(ptr, dtype, buffer_size)
-    device_raw_buffer = cp.empty((buffer_size,), dtype=dtype)
+    raw_buffer = device.empty_host(buffer_size, dtype)
+    device_raw_buffer = device.empty(buffer_size, dtype)
 
     allocation_mismatch = int((raw_buffer.ctypes.data % alignment_bytes) / itemsize)
     alignment_offset = (halo_offset - allocation_mismatch) % items_per_alignment
@@ -185,10 +306,10 @@ def allocate_gpu_unmanaged(default_origin, shape, layout_map, dtype, alignment_b
         field.strides = strides
         field = field[tuple(slice(0, s, None) for s in shape)]
 
-    allocation_mismatch = int((device_raw_buffer.data.ptr % alignment_bytes) / itemsize)
+    allocation_mismatch = int((device.ptr(device_raw_buffer) % alignment_bytes) / itemsize)
     alignment_offset = (halo_offset - allocation_mismatch) % items_per_alignment
 
-    device_field = as_strided(
+    device_field = device.as_strided(
         device_raw_buffer[alignment_offset : alignment_offset + padded_size],
         shape=padded_shape,
         strides=strides,
@@ -207,6 +328,55 @@ def allocate_cpu(default_origin, shape, layout_map, dtype, alignment_bytes):
     return allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f)
 
 
+def first_touch(raw_buffer, field, n_threads):
+    """Initialize a CPU storage buffer to zero from `n_threads` threads.
+
+    Operating systems place memory pages on the NUMA node of the thread writing them first.
+    The field is split along its outermost dimension in memory in one contiguous range of
+    rows per thread, like the static OpenMP schedule over the blocks of that dimension
+    (J blocks for the `gtmc` layout, whose I blocks of a row share the same pages). The
+    parts of `raw_buffer` before and after the field go to the first and last thread.
+    """
+    if n_threads <= 1 or field.ndim == 0 or field.size == 0:
+        raw_buffer[...] = 0
+        return
+
+    outer = max(range(field.ndim), key=lambda i: field.strides[i])
+    start = (field.ctypes.data - raw_buffer.ctypes.data) // raw_buffer.itemsize
+    row_size = field.strides[outer] // raw_buffer.itemsize
+    n_rows = field.shape[outer]
+    n_threads = min(n_threads, n_rows)
+    bounds = [start + row_size * (n_rows * t // n_threads) for t in range(n_threads + 1)]
+    bounds[0], bounds[-1] = 0, raw_buffer.size
+
+    def touch(t):
+        # NumPy releases the GIL for the assignment
+        raw_buffer[bounds[t] : bounds[t + 1]] = 0
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n_threads) as executor:
+        list(executor.map(touch, range(n_threads)))
+
+
+def allocate_mmap(default_origin, shape, layout_map, dtype, alignment_bytes, path, mode="w+"):
+    """Allocate a CPU storage buffer in a memory-mapped file.
+
+    The file contains the whole raw buffer, so it can be mapped again with the same
+    arguments. Since mappings are page-aligned, the field is found at the same offset.
+    """
+
+    def allocate_f(size, dtype):
+        if mode != "w+" and os.path.getsize(path) != size * dtype.itemsize:
+            raise ValueError(
+                "Size of file '{}' ({} bytes) does not match the storage size ({} bytes).".format(
+                    path, os.path.getsize(path), size * dtype.itemsize
+                )
+            )
+        raw_buffer = np.memmap(path, dtype=dtype, mode=mode, shape=(size,))
+        return raw_buffer, raw_buffer
+
+    return allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f)
+
+
 def allocate_gpu(default_origin, shape, layout_map, dtype, alignment_bytes):
     def allocate_f(size, dtype):
         cp.cuda.set_allocator(cp.cuda.malloc_managed)
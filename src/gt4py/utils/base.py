@@ -20,6 +20,7 @@ Basic utilities for Python programming.
 """
 
 import collections.abc
+import contextlib
 import functools
 import hashlib
 import importlib.util
@@ -28,10 +29,17 @@ import json
 import os
 import string
 import sys
+import tempfile
 import types
 from typing import Any, Sequence, Tuple
 
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
 NOTHING = object()
 
 
@@ -279,6 +287,47 @@ a477f597d28d172789f06886806bc55
     return dir_name
 
 
+def write_file_atomically(file_path, content, *, binary=False):
+    """Write a file such that concurrent readers never see a partially written file.
+
+    The content is written to a temporary file in the same directory, which is
+    then renamed into place.
+    """
+    file_path = os.path.abspath(file_path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(file_path), prefix=os.path.basename(file_path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb" if binary else "w") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(lock_path):
+    """Hold an exclusive inter-process lock on `lock_path` during the context.
+
+    The lock file is created if necessary and left in place afterwards. Processes waiting
+    for the lock are blocked until it is released. POSIX record locks are used, which are
+    also supported by most network file systems. Without :mod:`fcntl` (e.g. on Windows)
+    no locking takes place.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(lock_path, "a") as lock_file:
+        fcntl.lockf(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.lockf(lock_file, fcntl.LOCK_UN)
+
+
 def make_module_from_file(qualified_name, file_path, *, public_import=False):
     """Import module from file.
 
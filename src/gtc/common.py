@@ -32,6 +32,7 @@ from eve import (
     SymbolTableTrait,
 )
 from eve import exceptions as eve_exceptions
+from eve import validation_check
 from eve.type_definitions import SymbolRef
 from eve.typingx import RootValidatorType, RootValidatorValuesType
 from gtc.utils import flatten_list
@@ -338,6 +339,7 @@ class AssignStmt(GenericNode, Generic[TargetT, ExprT]):
 
 
 def assign_stmt_dtype_validation(*, strict: bool) -> RootValidatorType:
+    @validation_check
     def _impl(
         cls: Type[pydantic.BaseModel], values: RootValidatorValuesType
     ) -> RootValidatorValuesType:
@@ -368,6 +370,7 @@ class UnaryOp(GenericNode, Generic[ExprT]):
         return values
 
     @root_validator(skip_on_failure=True)
+    @validation_check
     def op_to_dtype_check(cls, values: RootValidatorValuesType) -> RootValidatorValuesType:
         if values["expr"].dtype:
             if values["op"] == UnaryOperator.NOT:
@@ -483,6 +486,7 @@ class NativeFuncCall(GenericNode, Generic[ExprT]):
     args: List[ExprT]
 
     @root_validator(skip_on_failure=True)
+    @validation_check
     def arity_check(cls, values: RootValidatorValuesType) -> RootValidatorValuesType:
         if values["func"].arity != len(values["args"]):
             raise ValueError(
@@ -512,6 +516,7 @@ def native_func_call_dtype_propagation(*, strict: bool = True) -> RootValidatorT
 
 
 def validate_dtype_is_set() -> RootValidatorType:
+    @validation_check
     def _impl(
         cls: Type[pydantic.BaseModel], values: RootValidatorValuesType
     ) -> RootValidatorValuesType:
@@ -535,6 +540,7 @@ def validate_dtype_is_set() -> RootValidatorType:
 def validate_symbol_refs() -> RootValidatorType:
     """Works only, if only the root node has a symbol table."""
 
+    @validation_check
     def _impl(
         cls: Type[pydantic.BaseModel], values: RootValidatorValuesType
     ) -> RootValidatorValuesType:
@@ -210,11 +210,13 @@ class GTCppCodegen(codegen.TemplatedGenerator):
     )
 
     @classmethod
-    def apply(cls, root: LeafNode, **kwargs: Any) -> str:
+    def apply(cls, root: LeafNode, *, format_source: bool = True, **kwargs: Any) -> str:
         if not isinstance(root, gtcpp.Program):
             raise ValueError("apply() requires gtcpp.Progam root node")
         if "gt_backend_t" not in kwargs:
             raise TypeError("apply() missing 1 required keyword-only argument: 'gt_backend_t'")
         generated_code = super().apply(root, offset_limit=_offset_limit(root), **kwargs)
+        if not format_source:
+            return generated_code
         formatted_code = codegen.format_source("cpp", generated_code, style="LLVM")
         return formatted_code
@@ -32,7 +32,7 @@ from typing import Any, Dict, Generator, List, Set
 from pydantic import validator
 from pydantic.class_validators import root_validator
 
-from eve import Node, Str, SymbolName, SymbolTableTrait, utils
+from eve import Node, Str, SymbolName, SymbolTableTrait, utils, validation_check
 from eve.iterators import TreeIterationItem
 from eve.typingx import RootValidatorValuesType
 from gtc import common
@@ -100,6 +100,7 @@ class ParAssignStmt(common.AssignStmt[FieldAccess, Expr], Stmt):
         return v
 
     @root_validator(skip_on_failure=True)
+    @validation_check
     def no_write_and_read_with_offset_of_same_field(
         cls, values: RootValidatorValuesType
     ) -> RootValidatorValuesType:
@@ -212,6 +213,7 @@ class VerticalLoop(LocNode):
     body: List[Stmt]
 
     @root_validator(skip_on_failure=True)
+    @validation_check
     def no_write_and_read_with_horizontal_offset(
         cls, values: RootValidatorValuesType
     ) -> RootValidatorValuesType:
@@ -25,7 +25,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import root_validator, validator
 
-from eve import Str, SymbolName, SymbolRef, SymbolTableTrait
+from eve import Str, SymbolName, SymbolRef, SymbolTableTrait, validation_check
 from gtc import common
 from gtc.common import AxisBound, LocNode
 
@@ -146,6 +146,7 @@ class Interval(LocNode):
     end: AxisBound
 
     @root_validator
+    @validation_check
     def check(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         start, end = values["start"], values["end"]
         if start.level == common.LevelMarker.END and end.level == common.LevelMarker.START:
@@ -187,6 +188,7 @@ class VerticalLoop(LocNode):
         return v
 
     @root_validator
+    @validation_check
     def valid_section_intervals(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         loop_order, sections = values["loop_order"], values["sections"]
         starts, ends = zip(*((s.interval.start, s.interval.end) for s in sections))
@@ -31,25 +31,39 @@ class _GTIRResolveAuto(NodeTranslator):
     Postcondition: All dtypes are concrete (no AUTO)
     """
 
+    reuse_unchanged_nodes = True
+
     class _GTIRUpdateAutoDecl(NodeTranslator):
         """Updates FieldDecls with resolved types."""
 
+        reuse_unchanged_nodes = True
+
         def visit_FieldDecl(
-            self, node: gtir.FieldDecl, new_symbols: Dict[str, Any], **kwargs: Any
+            self, node: gtir.FieldDecl, resolved_dtypes: Dict[str, DataType], **kwargs: Any
         ) -> gtir.FieldDecl:
             if node.dtype == DataType.AUTO:
-                dtype = new_symbols[node.name].dtype
+                dtype = resolved_dtypes[node.name]
                 return gtir.FieldDecl(name=node.name, dtype=dtype)
             else:
                 return node
 
     def visit_FieldAccess(
-        self, node: gtir.FieldAccess, *, symtable: Dict[str, Any], **kwargs: Any
+        self,
+        node: gtir.FieldAccess,
+        *,
+        symtable: Dict[str, Any],
+        resolved_dtypes: Dict[str, DataType],
+        **kwargs: Any,
     ) -> gtir.FieldAccess:
-        if symtable[node.name].dtype == DataType.AUTO:
-            assert "new_dtype" in kwargs
-            symtable[node.name].dtype = kwargs["new_dtype"]
-        return gtir.FieldAccess(name=node.name, offset=node.offset, dtype=symtable[node.name].dtype)
+        dtype = symtable[node.name].dtype
+        if dtype == DataType.AUTO:
+            if node.name not in resolved_dtypes:
+                assert "new_dtype" in kwargs
+                resolved_dtypes[node.name] = kwargs["new_dtype"]
+            dtype = resolved_dtypes[node.name]
+        if node.dtype == dtype:
+            return node
+        return gtir.FieldAccess(name=node.name, offset=node.offset, dtype=dtype)
 
     def visit_ParAssignStmt(self, node: gtir.ParAssignStmt, **kwargs: Any) -> gtir.ParAssignStmt:
         right = self.visit(node.right, **kwargs)
@@ -57,9 +71,9 @@ class _GTIRResolveAuto(NodeTranslator):
         return gtir.ParAssignStmt(left=left, right=right)
 
     def visit_Stencil(self, node: gtir.Stencil, **kwargs: Any) -> gtir.Stencil:
-        symtable = node.symtable_
-        result = self.generic_visit(node, symtable=symtable)
-        result = self._GTIRUpdateAutoDecl().visit(result, new_symbols=symtable)
+        resolved_dtypes: Dict[str, DataType] = {}
+        result = self.generic_visit(node, symtable=node.symtable_, resolved_dtypes=resolved_dtypes)
+        result = self._GTIRUpdateAutoDecl().visit(result, resolved_dtypes=resolved_dtypes)
 
         if not all(
             result.iter_tree()
@@ -80,14 +94,20 @@ class _GTIRPropagateDtypeToAccess(NodeTranslator):
     Postcondition: All dtypes of Access are not None
     """
 
+    reuse_unchanged_nodes = True
+
     def visit_FieldAccess(
         self, node: gtir.FieldAccess, *, symtable: Dict[str, Any], **kwargs: Any
     ) -> gtir.FieldAccess:
+        if node.dtype == symtable[node.name].dtype:
+            return node
         return gtir.FieldAccess(name=node.name, offset=node.offset, dtype=symtable[node.name].dtype)
 
     def visit_ScalarAccess(
         self, node: gtir.ScalarAccess, *, symtable: Dict[str, Any], **kwargs: Any
     ) -> gtir.ScalarAccess:
+        if node.dtype == symtable[node.name].dtype:
+            return node
         return gtir.ScalarAccess(name=node.name, dtype=symtable[node.name].dtype)
 
     def visit_Stencil(self, node: gtir.Stencil, **kwargs: Any) -> gtir.Stencil:
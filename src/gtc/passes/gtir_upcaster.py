@@ -34,10 +34,17 @@ def _upcast_nodes(*exprs: Expr) -> Iterator[Expr]:
     return map(lambda e: _upcast_node(target_dtype, e), exprs)
 
 
+def _is_updated(old_child: TreeNode, new_child: TreeNode) -> bool:
+    if isinstance(old_child, list):
+        return len(old_child) != len(new_child) or any(
+            new is not old for new, old in zip(new_child, old_child)  # type: ignore
+        )
+    return new_child is not old_child
+
+
 def _update_node(node: Node, updated_children: Dict[str, TreeNode]) -> Expr:
     # create new node only if children changed
-    old_children = node.dict(include={*updated_children.keys()})
-    if any([old_children[k] != updated_children[k] for k in updated_children.keys()]):
+    if any(_is_updated(getattr(node, k), v) for k, v in updated_children.items()):
         return node.copy(update=updated_children)
     else:
         return node
@@ -51,6 +58,8 @@ class _GTIRUpcasting(NodeTranslator):
     Postcondition: all dtype transitions are explicit via a `Cast` node
     """
 
+    reuse_unchanged_nodes = True
+
     def visit_BinaryOp(self, node: gtir.BinaryOp, **kwargs: Any) -> gtir.BinaryOp:
         left, right = _upcast_nodes(self.visit(node.left), self.visit(node.right))
         return _update_node(node, {"left": left, "right": right})
@@ -29,6 +29,8 @@ class GreedyMerging(NodeTranslator):
     Postcondition: The number of horizontal executions is equal or smaller than before.
     """
 
+    reuse_unchanged_nodes = True
+
     class AccessCollector(NodeVisitor):
         """Collects all field accesses inside a horizontal execution with corresponding offsets."""
 
@@ -85,7 +87,9 @@ class GreedyMerging(NodeTranslator):
                 and any(o[:2] != (0, 0) for o in offsets ^ previous_reads[field])
             }
             if not conflicting and horizontal_execution.mask == horizontal_executions[-1].mask:
-                horizontal_executions[-1].body += horizontal_execution.body
+                horizontal_executions[-1] = horizontal_executions[-1].copy(
+                    update={"body": horizontal_executions[-1].body + horizontal_execution.body}
+                )
                 for field, writes in current_writes.items():
                     previous_writes[field] |= writes
                 for field, reads in current_reads.items():
@@ -94,7 +98,7 @@ class GreedyMerging(NodeTranslator):
                 horizontal_executions.append(horizontal_execution)
                 previous_writes = current_writes
                 previous_reads = current_reads
-        result.horizontal_executions = horizontal_executions
+        result = result.copy(update={"horizontal_executions": horizontal_executions})
         if len(result.horizontal_executions) > len(node.horizontal_executions):
             raise GTCPostconditionError(
                 expected="the number of horizontal executions is equal or smaller than before"
@@ -30,6 +30,8 @@ class TemporariesToScalars(NodeTranslator):
     4. Add matching temporaries to HorizontalExecution declarations.
     """
 
+    reuse_unchanged_nodes = True
+
     def visit_FieldAccess(
         self, node: oir.FieldAccess, *, local_tmps: Set[str], **kwargs: Any
     ) -> Union[oir.FieldAccess, oir.ScalarAccess]:
@@ -15,9 +15,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 
+from typing import Optional
+
 import pydantic
 import pytest
 
+import eve
+
 from .. import definitions
 
 
@@ -99,3 +103,64 @@ class TestNode:
             and isinstance(metadata["definition"], pydantic.fields.ModelField)
             for metadata in sample_node.__node_children__.values()
         )
+
+
+class NodeWithValidators(eve.Node):
+    int_value: eve.Int
+    doubled: Optional[eve.Int]
+
+    @pydantic.root_validator(skip_on_failure=True)
+    def derive_doubled(cls, values):
+        values["doubled"] = 2 * values["int_value"]
+        return values
+
+    @pydantic.root_validator(skip_on_failure=True)
+    @eve.validation_check
+    def check_positive(cls, values):
+        if values["int_value"] <= 0:
+            raise ValueError("int_value must be positive")
+        return values
+
+
+class TestTrustedConstruction:
+    def test_skips_checks(self):
+        with pytest.raises(pydantic.ValidationError):
+            NodeWithValidators(int_value=-1)
+        with pytest.raises(pydantic.ValidationError):
+            NodeWithValidators(int_value="not an int")
+
+        with eve.trusted_construction():
+            node = NodeWithValidators(int_value=-1)
+            with eve.trusted_construction(False), pytest.raises(pydantic.ValidationError):
+                NodeWithValidators(int_value=-1)
+
+        assert node.int_value == -1
+        assert node.doubled == -2
+        assert node.id_.startswith(NodeWithValidators.__qualname__)
+        assert node.__fields_set__ == {"int_value"}
+
+    def test_defaults_and_symbols(self):
+        reference = definitions.make_node_with_symbol_table()
+        with eve.trusted_construction():
+            node = eve.NodeTranslator().visit(reference)
+            default_name_node = definitions.SimpleNodeWithDefaultSymbolName(int_value=1)
+
+        assert node == reference
+        assert node.symtable_.keys() == reference.symtable_.keys()
+        assert default_name_node.name == "symbol_name"
+
+    def test_validate_tree(self):
+        with eve.trusted_construction():
+            node = definitions.CompoundNode(
+                int_value=1,
+                location=definitions.make_location_node(),
+                simple=definitions.make_simple_node(),
+                simple_loc=definitions.make_simple_node_with_loc(),
+                simple_opt=definitions.make_simple_node_with_optionals(),
+                other_simple_opt=None,
+            )
+            assert eve.validate_tree(node) == node
+
+            node.simple.int_value = "not an int"
+            with pytest.raises(pydantic.ValidationError):
+                eve.validate_tree(node)
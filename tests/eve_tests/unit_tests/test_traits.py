@@ -17,6 +17,8 @@
 
 from __future__ import annotations
 
+import copy
+
 import pytest
 
 import eve
@@ -69,3 +71,41 @@ class TestSymbolTable:
             collected_symtable[symbol_name] is symbol_node
             for symbol_name, symbol_node in expected_symbols.items()
         )
+
+    def test_symbol_table_reuses_subtrees(self, symtable_node_and_expected_symbols):
+        node, expected_symbols = symtable_node_and_expected_symbols
+        with eve.trusted_construction():
+            new_node = definitions.NodeWithSymbolTable(
+                node_with_name=definitions.SimpleNodeWithSymbolName(int_value=1, name="new_name"),
+                list_with_name=node.list_with_name,
+                node_with_default_name=node.node_with_default_name,
+                compound_with_name=node.compound_with_name,
+            )
+
+        expected_symbols.pop(node.node_with_name.name)
+        expected_symbols["new_name"] = new_node.node_with_name
+        assert new_node.symtable_ == expected_symbols
+        assert new_node.symtable_["new_name"] is new_node.node_with_name
+        assert node.compound_with_name._symbols_cache_ is not None
+
+    def test_symbol_table_copies(self, symtable_node_and_expected_symbols):
+        node, _ = symtable_node_and_expected_symbols
+        compound = node.compound_with_name
+        for copied in (compound.copy(), compound.copy(deep=True), copy.deepcopy(compound)):
+            with eve.trusted_construction():
+                new_node = definitions.NodeWithSymbolTable(
+                    node_with_name=node.node_with_name,
+                    list_with_name=node.list_with_name,
+                    node_with_default_name=node.node_with_default_name,
+                    compound_with_name=copied,
+                )
+            name = copied.node_with_name.name
+            assert new_node.symtable_[name] is copied.node_with_name
+
+    def test_symbol_table_update(self, symtable_node_and_expected_symbols):
+        node, _ = symtable_node_and_expected_symbols
+        node.compound_with_name.node_with_name.name = "renamed"
+        assert "renamed" not in node.symtable_
+
+        node.collect_symbols()
+        assert node.symtable_["renamed"] is node.compound_with_name.node_with_name
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2020, CSCS - Swiss National Supercomputing Center, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import annotations
+
+import eve
+
+from .. import definitions
+
+
+class SpecialSimpleNode(definitions.SimpleNode):
+    pass
+
+
+class KindCollector(eve.NodeVisitor):
+    def __init__(self):
+        self.visited = []
+
+    def visit_SimpleNode(self, node, **kwargs):
+        self.visited.append("SimpleNode")
+
+    def visit_Node(self, node, **kwargs):
+        self.visited.append("Node")
+        self.generic_visit(node, **kwargs)
+
+
+class SpecialKindCollector(KindCollector):
+    def visit_SpecialSimpleNode(self, node, **kwargs):
+        self.visited.append("SpecialSimpleNode")
+
+
+def test_visitor_dispatch():
+    simple = definitions.make_simple_node()
+    empty = definitions.make_empty_node()
+    special = SpecialSimpleNode(**definitions.make_simple_node().dict())
+
+    for _ in range(2):
+        collector = KindCollector()
+        collector.visit([simple, empty, special])
+        assert collector.visited == ["SimpleNode", "Node", "SimpleNode"]
+
+        collector = SpecialKindCollector()
+        collector.visit([simple, empty, special])
+        assert collector.visited == ["SimpleNode", "Node", "SpecialSimpleNode"]
+
+    # the visitor functions are resolved once per visitor and node class
+    assert KindCollector._dispatch_table_[SpecialSimpleNode] == "visit_SimpleNode"
+    assert SpecialKindCollector._dispatch_table_[SpecialSimpleNode] == "visit_SpecialSimpleNode"
+    assert KindCollector._dispatch_table_[list] == "generic_visit"
+
+
+class SharingIntTranslator(eve.NodeTranslator):
+    reuse_unchanged_nodes = True
+
+    def visit_SimpleNodeWithOptionals(self, node, **kwargs):
+        if node.int_value < 0:
+            return node.copy(update={"int_value": -node.int_value})
+        return node
+
+
+def test_translator_reuse_unchanged_nodes():
+    compound = definitions.make_compound_node()
+    compound.simple_opt.int_value = abs(compound.simple_opt.int_value)
+
+    assert SharingIntTranslator().visit(compound) is compound
+    assert eve.NodeTranslator().visit(compound) is not compound
+
+    compound.simple_opt.int_value = -1
+    with eve.trusted_construction():
+        # full validation copies the children of new nodes
+        translated = SharingIntTranslator().visit(compound)
+    assert translated is not compound
+    assert translated.simple_opt.int_value == 1
+    assert translated.simple is compound.simple
+    assert translated.location is compound.location
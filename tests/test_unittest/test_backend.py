@@ -16,10 +16,13 @@
 
 import inspect
 
+import numpy as np
 import pytest
 
+from gt4py import gtscript
+from gt4py import storage as gt_storage
 from gt4py.backend import REGISTRY as backend_registry
-from gt4py.gtscript import __INLINED, PARALLEL, Field, computation, interval
+from gt4py.gtscript import __INLINED, BACKWARD, FORWARD, PARALLEL, Field, computation, interval
 from gt4py.stencil_builder import StencilBuilder
 
 from ..definitions import ALL_BACKENDS, CPU_BACKENDS, DAWN_CPU_BACKENDS
@@ -127,5 +130,121 @@ def test_generate_post_run(backend_name, mode):
         assert source == "out._set_device_modified()"
 
 
+def _compare_with_debug(definition, backend, backend_opts, *, shape, calls, exact=True):
+    """Check that the stencil gives the same results as with the debug backend."""
+    stencils = [
+        gtscript.stencil(backend="debug", definition=definition),
+        gtscript.stencil(backend=backend, definition=definition, **backend_opts),
+    ]
+    results = []
+    for stencil in stencils:
+        data = np.random.RandomState(0).randn(len(stencil.field_info), *shape)
+        fields = [
+            gt_storage.from_array(
+                array, backend=stencil.backend, default_origin=(0, 0, 0), dtype=np.float64
+            )
+            for array in data
+        ]
+        for call_kwargs in calls:
+            stencil(*fields, **call_kwargs)
+        results.append([np.asarray(field) for field in fields])
+
+    assert_func = np.testing.assert_array_equal if exact else np.testing.assert_allclose
+    for expected, result in zip(*results):
+        assert_func(result, expected)
+
+
+def sequential_def(
+    a: Field[np.float64],  # type: ignore
+    b: Field[np.float64],  # type: ignore
+    c: Field[np.float64],  # type: ignore
+    d: Field[np.float64],  # type: ignore
+):
+    with computation(FORWARD):
+        with interval(0, 1):
+            c = a  # type: ignore  # noqa
+        with interval(1, None):
+            tmp = 2.0 * a  # type: ignore
+            c = c[0, 0, -1] + tmp  # type: ignore  # noqa
+            d = max(b, d[0, 0, -1])  # type: ignore  # noqa
+    with computation(BACKWARD):
+        with interval(-1, None):
+            b = a  # type: ignore  # noqa
+        with interval(0, -1):
+            b = a[0, 0, 1] - b[0, 0, 1] / 3.0  # type: ignore  # noqa
+            a = b * 0.5  # type: ignore  # noqa
+
+
+@pytest.mark.parametrize("vectorize_sequential", [True, False])
+def test_numpy_sequential_vectorization(vectorize_sequential):
+    builder = StencilBuilder(sequential_def, backend=backend_registry["numpy"]).with_options(
+        name="sequential_def",
+        module=__name__,
+        backend_opts={"vectorize_sequential": vectorize_sequential},
+    )
+    source = builder.generate_computation()[builder.module_path.name]
+    assert ("np.add.accumulate" in source) is vectorize_sequential
+    assert ("np.maximum.accumulate" in source) is vectorize_sequential
+    # loop-carried dependencies on other fields are evaluated level by level
+    assert "for K in range(" in source
+
+    _compare_with_debug(
+        sequential_def,
+        "numpy",
+        {"vectorize_sequential": vectorize_sequential},
+        shape=(8, 6, 10),
+        calls=[dict(origin=(1, 1, 0), domain=(5, 4, 10))],
+    )
+
+
+def temporaries_def(
+    a: Field[np.float64], b: Field[np.float64], c: Field[np.float64], *, w: float  # type: ignore
+):
+    with computation(PARALLEL), interval(...):
+        t1 = a[1, 0, 0] + a[-1, 0, 0]  # type: ignore
+        b = t1[1, 0, 0] * w - t1[-1, 0, 0]  # type: ignore  # noqa
+    with computation(PARALLEL), interval(...):
+        t2 = b[0, 1, 0] * b[0, -1, 0]  # type: ignore
+        c = t2[0, -1, 0] - t2[0, 1, 0]  # type: ignore  # noqa
+
+
+@pytest.mark.parametrize("pool_temporaries", [True, False])
+def test_numpy_temporary_buffers(pool_temporaries):
+    builder = StencilBuilder(temporaries_def, backend=backend_registry["numpy"]).with_options(
+        name="temporaries_def",
+        module=__name__,
+        backend_opts={"pool_temporaries": pool_temporaries},
+    )
+    source = builder.generate_computation()[builder.module_path.name]
+    # the live ranges of the temporaries are disjoint
+    assert ("TemporaryBufferPool()" in source) is pool_temporaries
+    assert source.count("__temporary_buffer_0") == (2 if pool_temporaries else 0)
+    assert "out=b[" in source
+
+    _compare_with_debug(
+        temporaries_def,
+        "numpy",
+        {"pool_temporaries": pool_temporaries},
+        shape=(10, 10, 4),
+        calls=[dict(w=2.0, origin=(2, 2, 0), domain=domain) for domain in [(4, 4, 4), (6, 6, 4)]],
+    )
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+@pytest.mark.parametrize("definition", [sequential_def, temporaries_def])
+def test_numba_backend(definition, parallel):
+    pytest.importorskip("numba")
+    kwargs = {"w": 2.0} if definition is temporaries_def else {}
+    _compare_with_debug(
+        definition,
+        "numba",
+        # the test session later forks processes (concurrent builds)
+        {"parallel": parallel, "threading_layer": "workqueue"},
+        shape=(10, 10, 6),
+        calls=[dict(**kwargs, origin=(2, 2, 0), domain=(6, 5, 6))],
+        exact=False,
+    )
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -14,9 +14,14 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import multiprocessing
+import pickle
+import time
+
 import pytest
 
 import gt4py
+from gt4py.artifact_store import ArtifactStore
 from gt4py.gtscript import PARALLEL, Field, computation, interval
 from gt4py.stencil_builder import StencilBuilder
 
@@ -164,3 +169,139 @@ def test_nocaching_generate(builder, tmp_path):
     builder_g.backend.generate()
 
     assert_nocaching_gtcpp_source_file_tree_conforms_to_expectations(tmp_path / "foo_g", "foo")
+
+
+def test_jit_update_cache_info_is_atomic(builder):
+    builder = builder(simple_stencil).with_caching("jit")
+    builder.backend.generate()
+    cache_info_path = builder.caching.cache_info_path
+
+    # no temporary files are left behind
+    assert [path.name for path in cache_info_path.parent.glob(f"{cache_info_path.name}*")] == [
+        cache_info_path.name
+    ]
+    assert pickle.loads(cache_info_path.read_bytes()) == builder.caching.generate_cache_info()
+
+
+def test_jit_concurrent_build(builder, tmp_path, monkeypatch):
+    """Only the first of several processes building the same stencil generates it."""
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path))
+    generate_log = tmp_path / "generate.log"
+    debug_backend_cls = gt4py.backend.from_name("debug")
+    original_generate = debug_backend_cls.generate
+
+    def logging_generate(self):
+        with generate_log.open("a") as log_file:
+            log_file.write("generate\n")
+        time.sleep(0.5)
+        return original_generate(self)
+
+    monkeypatch.setattr(debug_backend_cls, "generate", logging_generate)
+
+    def build():
+        builder(simple_stencil).build()
+
+    # the patched backend is only inherited by forked processes
+    mp_context = multiprocessing.get_context("fork")
+    processes = [mp_context.Process(target=build) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert generate_log.read_text().splitlines() == ["generate"]
+    assert could_load_stencil_from_cache(builder(simple_stencil))
+
+
+@pytest.fixture
+def artifact_store_settings(tmp_path, monkeypatch):
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path / "project_a"))
+    monkeypatch.setitem(gt4py.config.cache_settings, "artifact_store_path", str(tmp_path / "store"))
+    monkeypatch.setitem(gt4py.config.cache_settings, "artifact_store_max_size", None)
+    yield gt4py.config.cache_settings
+
+
+def test_artifact_store_restore(builder, tmp_path, monkeypatch, artifact_store_settings):
+    original = builder(simple_stencil)
+    original.build()
+    store = ArtifactStore.from_settings()
+    assert [manifest["key"] for _, manifest, _ in store.entries()] == [store.make_key(original)]
+
+    # the same stencil in a different project directory is restored from the store
+    monkeypatch.setitem(artifact_store_settings, "root_path", str(tmp_path / "project_b"))
+
+    def fail_generate(self):
+        raise AssertionError("The stencil should have been restored from the artifact store")
+
+    monkeypatch.setattr(gt4py.backend.from_name("debug"), "generate", fail_generate)
+    restored = builder(simple_stencil)
+    assert not restored.caching.is_cache_info_available_and_consistent(validate_hash=True)
+    stencil_class = restored.build()
+
+    assert restored.module_path.exists()
+    assert str(tmp_path / "project_a") not in restored.module_path.read_text()
+    assert could_load_stencil_from_cache(restored)
+    assert stencil_class._file_name == str(restored.module_path)
+
+
+def test_artifact_store_eviction(builder, artifact_store_settings):
+    store = ArtifactStore.from_settings()
+    first = builder(simple_stencil)
+    first.build()
+    second = builder(simple_stencil_with_doc)
+    second.build()
+    assert len(store.entries()) == 2
+
+    store.max_size = store.size - 1
+    assert store.evict() == 1
+    assert [manifest["key"] for _, manifest, _ in store.entries()] == [store.make_key(second)]
+    assert not store.restore(first)
+    assert store.restore(second)
+
+
+def stencil_with_external(field: Field[float]):  # type: ignore
+    from __externals__ import INCREMENT
+
+    with computation(PARALLEL), interval(...):  # type: ignore
+        field += INCREMENT  # type: ignore
+
+
+def test_jit_fast_index(builder, tmp_path, monkeypatch):
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path))
+    monkeypatch.setitem(gt4py.config.cache_settings, "fast_index", True)
+
+    original = builder(stencil_with_external).with_externals({"INCREMENT": 1.0})
+    original_class = original.build()
+    assert original.caching.lookup_fast_index() == original.stencil_id
+
+    # warm builds neither fingerprint the definition nor validate the cache
+    def fail(*args, **kwargs):
+        raise AssertionError("The stencil should have been found in the fast index")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(gt4py.frontend.from_name("gtscript"), "prepare_stencil_definition", fail)
+        patch.setattr(
+            gt4py.caching.JITCachingStrategy, "is_cache_info_available_and_consistent", fail
+        )
+        warm = builder(stencil_with_external).with_externals({"INCREMENT": 1.0})
+        warm_class = warm.build()
+    assert warm_class._gt_id_ == original_class._gt_id_
+    assert warm_class._file_name == original_class._file_name
+
+    # other externals are not found in the index
+    changed = builder(stencil_with_external).with_externals({"INCREMENT": 2.0})
+    assert changed.caching.lookup_fast_index() is None
+    assert changed.build()._gt_id_ != original_class._gt_id_
+
+    # the definition of warm builds is still prepared on request
+    warm = builder(stencil_with_external).with_externals({"INCREMENT": 1.0})
+    warm.build()
+    assert warm.is_fast_index_hit
+    assert warm.definition._gtscript_["externals"]["INCREMENT"] == 1.0
+
+    # stale entries fall back to the regular checks
+    original.module_path.unlink()
+    stale = builder(stencil_with_external).with_externals({"INCREMENT": 1.0})
+    assert stale.build()._gt_id_ == original_class._gt_id_
+    assert stale.module_path.exists()
@@ -340,6 +340,96 @@ def test_ndarray_warning():
     assert len(record) == 0
 
 
+def test_call_run_cache():
+    """test that validated call arguments are memoized and only reused for compatible calls."""
+    backend = "numpy"
+    stencil = gtscript.stencil(definition=avg_stencil, backend=backend)
+    type(stencil)._call_run_cache_.clear()
+
+    in_field = gt_storage.ones(
+        backend=backend, shape=(23, 23, 10), default_origin=(1, 1, 0), dtype=np.float64
+    )
+    out_field = gt_storage.zeros(
+        backend=backend, shape=(23, 23, 10), default_origin=(1, 1, 0), dtype=np.float64
+    )
+    exec_info = {}
+    stencil(in_field=in_field, out_field=out_field, exec_info=exec_info)
+    assert not exec_info["call_run_cache_hit"]
+    assert exec_info["domain"] == (21, 21, 10)
+
+    out_field[...] = 0
+    stencil(in_field=in_field, out_field=out_field, exec_info=exec_info)
+    assert exec_info["call_run_cache_hit"]
+    assert exec_info["domain"] == (21, 21, 10)
+    assert (out_field[1:-1, 1:-1, :] == 1).all()
+
+    # calls with different arguments are validated again
+    small_field = gt_storage.zeros(
+        backend=backend, shape=(12, 12, 10), default_origin=(1, 1, 0), dtype=np.float64
+    )
+    with pytest.raises(ValueError):
+        stencil(in_field=in_field, out_field=small_field, domain=(21, 21, 10))
+    with pytest.raises(ValueError):
+        stencil(in_field=in_field, out_field=out_field, origin=(0, 0, 0), exec_info=exec_info)
+
+    # calls without validation do not populate the cache
+    stencil(
+        in_field=in_field,
+        out_field=out_field,
+        origin=(2, 2, 0),
+        validate_args=False,
+        exec_info=exec_info,
+    )
+    assert not exec_info["call_run_cache_hit"]
+    stencil(in_field=in_field, out_field=out_field, origin=(2, 2, 0), exec_info=exec_info)
+    assert not exec_info["call_run_cache_hit"]
+
+
+@pytest.mark.parametrize("backend", INTERNAL_CPU_BACKENDS)
+def test_bind(backend):
+    stencil = gtscript.stencil(
+        backend=backend, definition=a_stencil, externals={"BRANCH": False}, rebuild=True
+    )
+
+    arg1 = gt_storage.zeros(
+        backend=backend, dtype=np.float64, shape=(3, 3, 3), default_origin=(0, 0, 0)
+    )
+    arg2 = gt_storage.ones(
+        backend=backend, dtype=np.float64, shape=(3, 3, 3), default_origin=(0, 0, 0)
+    )
+    arg3 = gt_storage.ones(
+        backend=backend, dtype=np.float64, shape=(3, 3, 3), default_origin=(0, 0, 0)
+    )
+
+    bound_stencil = stencil.bind(arg1, arg2, arg3, par1=2.0, par3=1.0, origin=(1, 1, 0))
+    assert bound_stencil.domain == (2, 2, 3)
+    assert bound_stencil.origin["arg1"] == (1, 1, 0)
+
+    exec_info = {}
+    bound_stencil(exec_info=exec_info)
+    assert exec_info["domain"] == (2, 2, 3)
+    np.testing.assert_equal(arg1[1:, 1:, :], 15 * np.ones((2, 2, 3)))
+    np.testing.assert_equal(arg1[0, :, :], np.zeros((3, 3)))
+
+    bound_stencil(par1=1.0)
+    np.testing.assert_equal(arg1[1:, 1:, :], 8 * np.ones((2, 2, 3)))
+    bound_stencil.update_parameters(par2=1.0, par3=3.0)
+    bound_stencil()
+    np.testing.assert_equal(arg1[1:, 1:, :], 4 * np.ones((2, 2, 3)))
+    assert bound_stencil.parameter_args == {"par1": 1.0, "par2": 1.0, "par3": 3.0}
+
+    with pytest.raises(TypeError):
+        bound_stencil.update_parameters(par1=1)
+    with pytest.raises(ValueError):
+        bound_stencil.update_parameters(par3=None)
+    with pytest.raises(ValueError):
+        bound_stencil.update_parameters(par4=1.0)
+    with pytest.raises(ValueError):
+        stencil.bind(arg1, arg2, par1=2.0, par3=1.0)
+    with pytest.raises(ValueError):
+        stencil.bind(arg1, arg2, arg3, par1=2.0, par3=1.0, domain=(3, 3, 4))
+
+
 @pytest.mark.parametrize("backend", ["debug", "numpy", "gtx86"])
 def test_exec_info(backend):
     """test that proper warnings are raised depending on field type."""
@@ -16,13 +16,13 @@
 
 """Unit tests for the command line interface (CLI)."""
 
+import json
 import re
-import sys
 
 import pytest
 from click.testing import CliRunner
 
-from gt4py import backend, cli
+from gt4py import backend, cli, gtscript_imports
 from gt4py.backend.base import CLIBackendMixin
 
 
@@ -52,9 +52,8 @@ def backend_name(request, nocli_backend):
 
 @pytest.fixture
 def clean_imports():
-    impdata = [sys.path.copy(), sys.meta_path.copy(), sys.modules.copy()]
-    yield
-    sys.path, sys.meta_path, sys.modules = impdata
+    with gtscript_imports.restored_import_system():
+        yield
 
 
 @pytest.fixture
@@ -98,6 +97,7 @@ def nocli_backend(scope="module"):
 BACKEND_ROW_PATTERN_BY_NAME = {
     "debug": r"^\s*debug\s*python\s*Yes",
     "numpy": r"^\s*numpy\s*python\s*Yes",
+    "numba": r"^\s*numba\s*python\s*Yes",
     "gtx86": r"^\s*gtx86\s*c\+\+\s*python\s*Yes",
     "gtmc": r"^\s*gtmc\s*c\+\+\s*python\s*Yes",
     "gtcuda": r"^\s*gtcuda\s*cuda\s*python\s*Yes",
@@ -276,3 +276,68 @@ def test_write_computation_src(tmp_path, simple_stencil):
     assert src.exists() and src.is_dir()
     assert header.exists() and header.read_text() == test_src[toplevel]["include"]["header.hpp"]
     assert main.exists() and main.read_text() == test_src[toplevel]["src"]["main.cpp"]
+
+
+def test_gen_parallel(clirunner, simple_stencil, tmp_path):
+    """Generate stencils in worker processes, the output must match the sequential one."""
+    with simple_stencil.open("a") as module_file:
+        module_file.write(
+            "\n"
+            "\n"
+            "@lazy_stencil()\n"
+            "def init_2(input_field: Field[float]):\n"
+            "    with computation(PARALLEL), interval(...):\n"
+            "        input_field = 2\n"
+        )
+
+    def generate(jobs):
+        output_path = tmp_path / f"jobs_{jobs}"
+        result = clirunner.invoke(
+            cli.gtpyc,
+            [
+                "gen",
+                f"--output-path={output_path}",
+                "--backend=numpy",
+                f"--jobs={jobs}",
+                str(simple_stencil),
+            ],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0, result.output
+        return {
+            path.relative_to(output_path): path.read_text()
+            for path in output_path.rglob("*")
+            if path.is_file()
+        }
+
+    sequential_output = generate(1)
+    assert len(sequential_output) == 2
+    assert generate(2) == sequential_output
+
+
+@pytest.mark.parametrize("profile_format", ["chrome", "json"])
+def test_gen_profile(clirunner, simple_stencil, tmp_path, profile_format):
+    """Test the --profile option writing the compilation phases of each stencil."""
+    profile_path = tmp_path / "profile.json"
+    result = clirunner.invoke(
+        cli.gtpyc,
+        [
+            "gen",
+            "--backend=numpy",
+            f"--output-path={tmp_path / 'test_gen_profile'}",
+            f"--profile={profile_path}",
+            f"--profile-format={profile_format}",
+            str(simple_stencil),
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0, result.output
+
+    profile = json.loads(profile_path.read_text())
+    if profile_format == "json":
+        assert list(profile) == ["init_1"]
+        assert "frontend" in [record["name"] for record in profile["init_1"]]
+    else:
+        events = [event for event in profile["traceEvents"] if event["ph"] == "X"]
+        assert "frontend" in [event["name"] for event in events]
+        assert all(event["ts"] >= 0 and event["dur"] >= 0 for event in events)
@@ -146,6 +146,11 @@ class TestExecInfo:
     def subtest_stencil_info(self, exec_info, stencil_info, last_called_stencil=False):
         assert "ncalls" in stencil_info
         assert stencil_info["ncalls"] == self.nt
+        assert (
+            stencil_info.get("call_run_cache_hits", 0)
+            + stencil_info.get("call_run_cache_misses", 0)
+            == self.nt
+        )
 
         assert "call_start_time" in stencil_info
         assert "call_end_time" in stencil_info
@@ -54,6 +54,9 @@ def test_zero_extent_merging(merger):
     assert transformed.horizontal_executions[0].body == sum(
         (he.body for he in testee.horizontal_executions), []
     )
+    # the input is not modified
+    assert len(testee.horizontal_executions) == 4
+    assert all(len(he.body) == 1 for he in testee.horizontal_executions)
 
 
 def test_mixed_merging(merger):
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import warnings
+
+import numpy as np
+
+import eve
+from gt4py.backend import REGISTRY as backend_registry
+from gt4py.backend.gtc_backend.gtcpp.backend import GTCGTExtGenerator
+from gt4py.gtscript import PARALLEL, Field, computation, interval
+from gt4py.stencil_builder import StencilBuilder
+from gtc.gtcpp import gtcpp_codegen
+
+
+def many_args_def(
+    in1: Field[np.float64],  # type: ignore
+    in2: Field[np.float64],  # type: ignore
+    in3: Field[np.float64],  # type: ignore
+    in4: Field[np.float64],  # type: ignore
+    in5: Field[np.float64],  # type: ignore
+    out: Field[np.float64],  # type: ignore
+    *,
+    weight: float,
+):
+    with computation(PARALLEL), interval(...):
+        tmp = in1[1, 0, 0] + in2[0, -1, 0] * in3  # type: ignore
+        out = weight * tmp[-1, 0, 0] - in4 / in5  # type: ignore  # noqa
+
+
+def test_trusted_lowering_matches_validated(monkeypatch):
+    builder = StencilBuilder(many_args_def, backend=backend_registry["gtc:gt:cpu_ifirst"])
+    generator = GTCGTExtGenerator("cls", "module", "cpu_ifirst", builder.options)
+
+    # node ids are part of the generated names: use the same ids in both runs
+    start_id = int(eve.utils.UIDGenerator.sequential_id()) + 1
+
+    def generate_code():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            eve.utils.UIDGenerator.reset_sequence(start_id)
+        return gtcpp_codegen.GTCppCodegen.apply(
+            generator._lower(builder.definition_ir), gt_backend_t="cpu_ifirst", format_source=False
+        )
+
+    trusted_code = generate_code()
+    monkeypatch.setattr(eve.concepts, "FULL_VALIDATION", True)
+    validated_code = generate_code()
+
+    assert trusted_code == validated_code
@@ -322,3 +322,38 @@ def test_pkg_import(make_package):
     assert pkg_simple.ms
     assert pkg_simple.sf1
     assert pkg_simple.sss
+
+
+def test_parallel_build(tmp_path, extension, reset_importsys):
+    """Test building all lazy stencils of a module in worker processes on import."""
+    gts_file = tmp_path / f"par_build{extension}"
+    gts_file.write_text(
+        (
+            "# [GT] using-dsl: gtscript\n"
+            "\n"
+            "\n"
+            "@lazy_stencil()\n"
+            "def set_one(a: Field[float]):\n"
+            "    with computation(PARALLEL), interval(...):\n"
+            "        a = 1.\n"
+            "\n"
+            "\n"
+            "@lazy_stencil()\n"
+            "def set_two(a: Field[float]):\n"
+            "    with computation(PARALLEL), interval(...):\n"
+            "        a = 2.\n"
+            "\n"
+            "\n"
+            "set_two_again = set_two\n"
+        )
+    )
+    gtscript_imports.enable(search_path=[gts_file.parent], parallel_jobs=2)
+
+    import par_build
+
+    for lazy_stencil in (par_build.set_one, par_build.set_two):
+        # built on import and loaded from the cache
+        assert "implementation" in lazy_stencil.__dict__
+        assert lazy_stencil.builder.caching.is_cache_info_available_and_consistent(
+            validate_hash=True
+        )
@@ -124,3 +124,24 @@ def test_regression_run_analysis_twice(tmp_path):
     ir = builder.implementation_ir
     # this raises an error if the analysis pipeline is reevaluated:
     assert ir is builder.implementation_ir
+
+
+def test_compile_phases(tmp_path):
+    build_info = {}
+    builder = (
+        StencilBuilder(simple_stencil)
+        .with_backend("numpy")
+        .with_externals({"a": 1.0})
+        .with_caching("nocaching", output_path=tmp_path)
+        .with_options(name="simple_stencil", module="", rebuild=True, build_info=build_info)
+    )
+    builder.build()
+
+    phases = {record["name"]: record for record in build_info["compile_phases"]}
+    assert {"build", "frontend", "analysis", "backend.generate"} <= set(phases)
+    assert any(name.startswith("analysis.") for name in phases)
+    assert phases["build"]["depth"] == 0
+    assert phases["frontend"]["depth"] > 0 and phases["analysis"]["depth"] > 0
+    assert phases["frontend"]["nodes"] > 0 and phases["analysis"]["nodes"] > 0
+    assert all(record["wall_time"] >= 0.0 for record in phases.values())
+    assert phases["frontend"]["wall_time"] <= phases["build"]["wall_time"]
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Test the fusion of stencil sequences into stencil programs."""
+
+import numpy as np
+import pytest
+
+import gt4py
+from gt4py import gtscript
+from gt4py import storage as gt_storage
+from gt4py.definitions import BuildOptions
+from gt4py.gtscript import PARALLEL, Field, computation, interval
+from gt4py.stencil_program import StencilProgramBuilder
+
+from ..definitions import CPU_BACKENDS, INTERNAL_BACKENDS
+
+
+INTERNAL_CPU_BACKENDS = list(set(CPU_BACKENDS) & set(INTERNAL_BACKENDS))
+
+
+def scale_definition(in_f: Field[np.float64], out_f: Field[np.float64], *, alpha: float):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        tmp = alpha * in_f  # type: ignore
+        out_f = tmp  # type: ignore # noqa
+
+
+def laplacian_definition(in_f: Field[np.float64], out_f: Field[np.float64]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        tmp = in_f[1, 0, 0] + in_f[-1, 0, 0] + in_f[0, 1, 0] + in_f[0, -1, 0] - 4.0 * in_f  # type: ignore
+        out_f = tmp  # type: ignore # noqa
+
+
+def float32_definition(in_f: Field[np.float32], out_f: Field[np.float32]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        out_f = in_f  # type: ignore # noqa
+
+
+def factor_definition(in_f: Field[np.float64], out_f: Field[np.float64]):  # type: ignore
+    from __externals__ import FACTOR
+
+    with computation(PARALLEL), interval(...):  # type: ignore
+        out_f = FACTOR * in_f  # type: ignore # noqa
+
+
+def make_builder(steps, backend_name="numpy"):
+    return StencilProgramBuilder(
+        steps,
+        backend=gt4py.backend.from_name(backend_name),
+        options=BuildOptions(name="program", module=__name__),
+    )
+
+
+def test_merged_definition():
+    definition_ir = make_builder(
+        [
+            (scale_definition, {"in_f": "phi", "out_f": "scaled"}),
+            (laplacian_definition, {"in_f": "scaled", "out_f": "lap"}),
+        ]
+    ).definition_ir
+
+    assert definition_ir.name == f"{__name__}.program"
+    assert [arg.name for arg in definition_ir.api_signature] == ["phi", "scaled", "lap", "alpha"]
+    assert [arg.is_keyword for arg in definition_ir.api_signature] == [False, False, False, True]
+    assert [field.name for field in definition_ir.api_fields] == ["phi", "scaled", "lap"]
+    assert len(definition_ir.computations) == 2
+
+    temporaries = [
+        stmt.name
+        for computation in definition_ir.computations
+        for stmt in computation.body.stmts
+        if isinstance(stmt, gt4py.ir.FieldDecl)
+    ]
+    assert len(set(temporaries)) == 2
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [(scale_definition, {"unknown": "phi"})],
+        [(scale_definition, {"in_f": "alpha"})],
+        [(scale_definition, {}), (float32_definition, {})],
+        [],
+    ],
+)
+def test_invalid_bindings(steps):
+    with pytest.raises(ValueError):
+        make_builder(steps).definition_ir
+
+
+def test_stencil_id():
+    steps = [(scale_definition, {"out_f": "tmp_f"}), (laplacian_definition, {"in_f": "tmp_f"})]
+    other_steps = [(scale_definition, {"out_f": "tmp_f"}), (laplacian_definition, {})]
+
+    assert make_builder(steps).stencil_id == make_builder(steps).stencil_id
+    assert make_builder(steps).stencil_id.version != make_builder(other_steps).stencil_id.version
+
+
+def test_step_externals_do_not_leak():
+    doubled = gtscript.stencil(
+        backend="numpy", definition=factor_definition, externals={"FACTOR": 2.0}
+    )
+    builder = make_builder([doubled])
+    gtscript.stencil(backend="numpy", definition=factor_definition, externals={"FACTOR": 3.0})
+
+    assert builder.definition_ir.externals["FACTOR"] == 2.0
+    assert factor_definition._gtscript_["externals"]["FACTOR"] == 3.0
+
+
+def test_stencil_program_with_externals():
+    doubled = gtscript.stencil(
+        backend="numpy", definition=factor_definition, externals={"FACTOR": 2.0}
+    )
+    program = gtscript.stencil_program(
+        "numpy",
+        [(doubled, {"out_f": "tmp_f"}), (factor_definition, {"in_f": "tmp_f"})],
+        externals={"FACTOR": 3.0},
+        rebuild=True,
+    )
+
+    shape = (4, 4, 3)
+    data = np.random.randn(*shape)
+    in_f, tmp_f, out_f = (
+        gt_storage.from_array(
+            data, backend="numpy", default_origin=(0, 0, 0), shape=shape, dtype=np.float64
+        )
+        for _ in range(3)
+    )
+    program(in_f, tmp_f, out_f)
+
+    np.testing.assert_allclose(np.asarray(out_f), 6.0 * data)
+
+
+@pytest.mark.parametrize("backend", INTERNAL_CPU_BACKENDS)
+def test_stencil_program(backend):
+    scale = gtscript.stencil(backend=backend, definition=scale_definition)
+    laplacian = gtscript.stencil(backend=backend, definition=laplacian_definition)
+    program = gtscript.stencil_program(
+        backend,
+        [
+            (scale, {"in_f": "phi", "out_f": "scaled"}),
+            (laplacian_definition, {"in_f": "scaled", "out_f": "lap"}),
+            (scale, {"in_f": "lap", "out_f": "phi"}),
+        ],
+    )
+
+    shape = (10, 10, 5)
+    data = np.random.randn(*shape)
+    phi, scaled, lap = (
+        gt_storage.from_array(
+            data, backend=backend, default_origin=(1, 1, 0), shape=shape, dtype=np.float64
+        )
+        for _ in range(3)
+    )
+    ref_phi, ref_scaled, ref_lap = (
+        gt_storage.from_array(
+            data, backend=backend, default_origin=(1, 1, 0), shape=shape, dtype=np.float64
+        )
+        for _ in range(3)
+    )
+
+    program(phi, scaled, lap, alpha=2.0, origin=(2, 2, 0), domain=(6, 6, 5))
+
+    scale(ref_phi, ref_scaled, alpha=2.0, origin=(1, 1, 0), domain=(8, 8, 5))
+    laplacian(ref_scaled, ref_lap, origin=(2, 2, 0), domain=(6, 6, 5))
+    scale(ref_lap, ref_phi, alpha=2.0, origin=(2, 2, 0), domain=(6, 6, 5))
+
+    np.testing.assert_allclose(np.asarray(phi)[2:8, 2:8], np.asarray(ref_phi)[2:8, 2:8])
+    np.testing.assert_allclose(np.asarray(lap)[2:8, 2:8], np.asarray(ref_lap)[2:8, 2:8])
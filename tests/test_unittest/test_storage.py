@@ -681,6 +681,341 @@ def test_copy_cpu(method, backend):
     np.testing.assert_equal(stor_copy.view(np.ndarray), stor.view(np.ndarray))
 
 
+@pytest.mark.parametrize("backend", ["numpy", "gtmc"])
+def test_storage_pool(backend):
+    default_origin = (1, 1, 0)
+    shape = (10, 10, 5)
+    with gt_store.StoragePool() as pool:
+        stor = gt_store.zeros(backend, default_origin, shape, np.float64)
+        ptr = stor._raw_buffer.ctypes.data
+        view = stor[1:-1, 1:-1]
+        del stor
+        # the buffer is still used by the view
+        assert pool.stats.bytes_pooled == 0
+        del view
+        assert pool.stats.bytes_pooled > 0 and pool.stats.bytes_live == 0
+
+        stor = gt_store.ones(backend, default_origin, shape, np.float64)
+        assert stor._raw_buffer.ctypes.data == ptr
+        assert stor.default_origin == default_origin
+        assert np.all(np.asarray(stor) == 1)
+        stor._check_data()
+
+        other = gt_store.empty(backend, default_origin, shape, np.float32)
+        assert pool.stats.hits == 1 and pool.stats.misses == 2
+
+        pool.release(other)
+        with pytest.raises(ValueError):
+            pool.release(other)
+        assert gt_store.empty(backend, default_origin, shape, np.float32) is not None
+        assert pool.stats.hit_rate == 0.5
+
+    assert pool.stats.bytes_pooled == 0
+    assert gt_store.empty(backend, default_origin, shape, np.float64)._raw_buffer.base is None
+
+
+def test_storage_pool_is_thread_local():
+    import threading
+
+    pools = []
+    with gt_store.StoragePool() as pool:
+        thread = threading.Thread(target=lambda: pools.append(gt_store.pool.active_pool()))
+        thread.start()
+        thread.join()
+        assert gt_store.pool.active_pool() is pool
+    assert pools == [None]
+    assert gt_store.pool.active_pool() is None
+
+
+@pytest.mark.parametrize("backend", ["numpy", "gtmc"])
+def test_file_backed_storage(backend, tmp_path):
+    from gt4py import gtscript
+
+    default_origin = (2, 2, 0)
+    shape = (10, 11, 5)
+    path = tmp_path / "field.dat"
+    data = np.random.randn(*shape)
+    stor = gt_store.from_array(data, backend, default_origin, dtype=np.float64)
+    file_stor = gt_store.zeros(backend, default_origin, shape, np.float64, mmap_path=path)
+    assert file_stor.is_file_backed
+    assert file_stor.strides == stor.strides
+    assert file_stor._is_consistent(file_stor)
+    file_stor[...] = data
+    file_stor.flush()
+    del file_stor
+
+    @gtscript.stencil(backend="numpy")
+    def double(field: gtscript.Field[np.float64]):  # type: ignore
+        with computation(PARALLEL), interval(...):  # type: ignore  # noqa
+            field = 2.0 * field  # type: ignore  # noqa
+
+    file_stor = gt_store.from_file(path, backend, default_origin, shape, np.float64)
+    double(file_stor, origin=(0, 0, 0))
+    del file_stor
+    np.testing.assert_equal(
+        np.asarray(gt_store.from_file(path, backend, default_origin, shape, np.float64, mode="r")),
+        2.0 * data,
+    )
+
+    with pytest.raises(ValueError):
+        gt_store.from_file(path, backend, default_origin, (10, 11, 6), np.float64)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "gtx86", "gtmc"])
+def test_from_array_zero_copy(backend):
+    default_origin = (1, 1, 0)
+    shape = (8, 9, 4)
+    data = gt_store.empty(backend, default_origin, shape, np.float64).view(np.ndarray)
+    data[...] = np.random.randn(*shape)
+
+    stor = gt_store.from_array(data, backend, default_origin, copy=False)
+    assert isinstance(stor, gt_store.storage.CPUStorage)
+    assert np.shares_memory(stor, data)
+    assert stor.strides == data.strides
+    assert stor.default_origin == default_origin and stor.is_stencil_view
+    stor[1, 2, 3] = 42.0
+    assert data[1, 2, 3] == 42.0
+
+    with pytest.raises(ValueError):
+        gt_store.from_array(data, backend, default_origin, dtype=np.float32, copy=False)
+    with pytest.raises(ValueError):
+        gt_store.from_array(data, backend, default_origin, shape=(8, 9, 5), copy=False)
+    with pytest.raises(ValueError):
+        gt_store.from_array(data.transpose(1, 0, 2), backend, default_origin, copy=False)
+    if gt_backend.from_name(backend).storage_info["alignment"] > 1:
+        with pytest.raises(ValueError):
+            gt_store.from_array(data, backend, (2, 1, 0), copy=False)
+
+
+@pytest.mark.parametrize(["backend", "soa"], itertools.product(["numpy", "gtmc"], [False, True]))
+def test_allocate_many(backend, soa):
+    specs = {
+        name: dict(default_origin=(2, 2, 0), shape=(10, 11, 5), dtype=np.float64)
+        for name in ["u", "v", "w"]
+    }
+    specs["h"] = dict(
+        default_origin=(1, 1, 0), shape=(10, 11), dtype=np.float32, mask=[True, True, False]
+    )
+    storages = gt_store.allocate_many(specs, backend=backend, soa=soa)
+
+    assert list(storages.keys()) == list(specs.keys())
+    data = {}
+    for name, stor in storages.items():
+        ref = gt_store.empty(backend=backend, **specs[name])
+        assert stor.shape == ref.shape and stor.dtype == ref.dtype
+        assert stor.default_origin == ref.default_origin and stor.mask == ref.mask
+        assert stor._raw_buffer is storages["u"]._raw_buffer
+        if name != "h":
+            assert stor._is_consistent(stor)
+            assert (stor.strides == ref.strides) is not soa
+        data[name] = np.random.randn(*stor.shape)
+        stor[...] = data[name]
+    for name, stor in storages.items():
+        np.testing.assert_equal(np.asarray(stor), data[name].astype(stor.dtype))
+
+    if soa:
+        # rows along the innermost dimension are interleaved
+        row_offset = storages["v"].ctypes.data - storages["u"].ctypes.data
+        assert storages["w"].ctypes.data - storages["v"].ctypes.data == row_offset
+        assert 0 < row_offset < max(storages["u"].strides)
+
+
+@pytest.mark.parametrize(
+    ["backend", "periodic"], itertools.product(["numpy", "gtmc"], [True, False])
+)
+def test_halo_exchange(backend, periodic):
+    halo = 2
+    size = 5
+    global_data = np.random.randn(2 * size, 3 * size, 4)
+    storages = {}
+    updaters = {}
+    for coords in itertools.product(range(2), range(3)):
+        stor = gt_store.zeros(
+            backend, (halo, halo, 0), (size + 2 * halo, size + 2 * halo, 4), np.float64
+        )
+        stor[halo:-halo, halo:-halo] = global_data[
+            coords[0] * size : (coords[0] + 1) * size, coords[1] * size : (coords[1] + 1) * size
+        ]
+        storages[coords] = stor
+        updaters[coords] = gt_store.HaloUpdater(stor, (halo, halo))
+    assert updaters[(0, 0)].plan is updaters[(1, 2)].plan
+    assert updaters[(0, 0)].send_buffers[(1, 0)].size == halo * size * 4
+
+    gt_store.local_exchange(updaters, periodic=periodic)
+
+    padded_data = np.pad(
+        global_data, ((halo, halo), (halo, halo), (0, 0)), mode="wrap" if periodic else "constant"
+    )
+    for (i, j), stor in storages.items():
+        np.testing.assert_equal(
+            np.asarray(stor),
+            padded_data[i * size : (i + 1) * size + 2 * halo, j * size : (j + 1) * size + 2 * halo],
+        )
+
+
+def test_deferred_view_checks():
+    field = gt_store.ones(
+        backend="gtmc", default_origin=(1, 1, 0), shape=(8, 8, 4), dtype=np.float64
+    )
+
+    view = field[...]
+    assert view.__dict__["_view_parent"] is not None
+    assert view.is_stencil_view
+    assert view.__dict__["_view_parent"] is None
+
+    # the checks of views of unchecked views are deferred as well
+    assert not field[1:, :, :][...].is_stencil_view
+    assert not field.transpose((1, 0, 2))[...].is_stencil_view
+    assert field[...][...][...].is_stencil_view
+
+    masked = gt_store.ones(
+        backend="gtmc",
+        default_origin=(1, 1, 0),
+        shape=(8, 8, 4),
+        dtype=np.float64,
+        mask=[True, False, True],
+    )
+    assert not masked[...].is_stencil_view
+
+    # results of ufuncs do not share memory with the operands and are checked right away
+    result = field * 2.0
+    assert result.__dict__["_view_parent"] is None
+    assert result.is_stencil_view
+    assert np.all(np.asarray(result) == 2.0)
+
+
+@pytest.mark.parametrize(
+    ["backend", "load_backend", "mask"],
+    itertools.product(["numpy", "gtmc"], ["numpy", "gtmc"], [None, [True, False, True]]),
+)
+def test_save_load(tmp_path, backend, load_backend, mask):
+    path = tmp_path / "field.gts"
+    field = gt_store.empty(
+        backend=backend, default_origin=(3, 2, 1), shape=(10, 7, 5), dtype=np.float64, mask=mask
+    )
+    np.asarray(field)[...] = np.random.randn(*field.shape)
+    field.save(path)
+
+    loaded = gt_store.load(path, backend=load_backend)
+    assert loaded.backend == load_backend
+    assert loaded.default_origin == field.default_origin
+    assert list(loaded.mask) == list(field.mask)
+    assert loaded.is_stencil_view
+    assert np.array_equal(np.asarray(loaded), np.asarray(field))
+    # storages are mapped from the file only if the layouts match
+    assert loaded.is_file_backed == (backend == load_backend)
+
+    if loaded.is_file_backed:
+        loaded[...] = 1.0
+        loaded.flush()
+        del loaded
+        assert np.all(np.asarray(gt_store.load(path, mode=None)) == 1.0)
+
+
+@pytest.mark.parametrize(
+    ["backend", "target_backend", "inplace"],
+    itertools.product(["numpy", "gtmc"], ["numpy", "gtx86", "gtmc"], [False, True]),
+)
+def test_to_backend(backend, target_backend, inplace):
+    field = gt_store.empty(
+        backend=backend, default_origin=(3, 2, 1), shape=(70, 67, 9), dtype=np.float64
+    )
+    data = np.random.randn(*field.shape)
+    np.asarray(field)[...] = data
+
+    converted = field.to_backend(target_backend, inplace=inplace)
+    assert converted.backend == target_backend
+    assert converted.default_origin == field.default_origin
+    assert converted.is_stencil_view
+    assert np.array_equal(np.asarray(converted), data)
+    reference = gt_store.empty(
+        backend=target_backend, default_origin=(3, 2, 1), shape=(70, 67, 9), dtype=np.float64
+    )
+    assert converted.strides == reference.strides
+    # the buffer is reused if the (unpadded) layouts have the same size
+    padded = backend != "gtmc" and target_backend == "gtmc"
+    assert (converted._raw_buffer is field._raw_buffer) == (inplace and not padded)
+
+
+def test_blocked_copy():
+    src = np.random.randn(37, 129, 11)
+    dst = np.empty((11, 129, 37)).transpose()
+    gt_storage_utils.blocked_copy(dst, src, tile=16, block_bytes=4096)
+    assert np.array_equal(dst, src)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "gtmc"])
+def test_first_touch(backend):
+    default_origin, shape = (3, 3, 0), (13, 29, 5)
+    field = gt_store.ones(
+        backend=backend, default_origin=default_origin, shape=shape, dtype=np.float64, first_touch=4
+    )
+    reference = gt_store.empty(
+        backend=backend, default_origin=default_origin, shape=shape, dtype=np.float64
+    )
+    assert field.strides == reference.strides
+    assert field.is_stencil_view
+    assert np.all(np.asarray(field) == 1.0)
+
+    raw_buffer = np.full(1000, np.nan)
+    field = raw_buffer[7:967].reshape(32, 30)
+    gt_storage_utils.first_touch(raw_buffer, field, n_threads=3)
+    assert np.all(raw_buffer == 0.0)
+
+    with pytest.raises(ValueError, match="CPU backends"):
+        gt_store.empty(
+            backend="gtcuda",
+            default_origin=default_origin,
+            shape=shape,
+            dtype=np.float64,
+            first_touch=4,
+        )
+
+
+def test_explicit_sync_dirty_blocks():
+    from gt4py.storage.sync import NumpyDevice
+
+    device = NumpyDevice()
+    shape = (32, 16, 64)
+    field = gt_store.zeros(
+        backend="gtcuda", default_origin=(0, 0, 0), shape=shape, dtype=np.float64, device=device
+    )
+    assert isinstance(field, gt_store.storage.ExplicitlySyncedGPUStorage)
+    field.host_to_device(force=True)
+    assert field._is_clean
+
+    # modifying a K slab only transfers the blocks it spans
+    device.reset_stats()
+    field[:, :, 5] = 1.0
+    assert field._is_host_modified
+    field.host_to_device()
+    slab_bytes = shape[0] * shape[1] * field.itemsize
+    assert 0 < device.bytes_to_device <= slab_bytes + 2 * field.SYNC_BLOCK_BYTES
+    assert field._is_clean
+
+    # reading an element only transfers its block
+    field._device_field[:, :, 40] = 2.0
+    field[:, :, 40]._set_device_modified()
+    device.reset_stats()
+    assert field[3, 3, 40] == 2.0
+    assert device.bytes_to_host == field.SYNC_BLOCK_BYTES
+    assert not field._is_device_modified
+
+    field.synchronize()
+    assert field._is_clean
+    expected = np.zeros(shape)
+    expected[:, :, 5] = 1.0
+    expected[:, :, 40] = 2.0
+    assert np.array_equal(np.asarray(field), expected)
+    assert np.array_equal(field._device_field, expected)
+
+    copy = field.copy()
+    copy += 1.0
+    copy.host_to_device()
+    assert np.array_equal(copy._device_field, expected + 1.0)
+    assert np.array_equal(field._device_field, expected)
+
+
 @pytest.mark.requires_gpu
 @pytest.mark.parametrize("method", ["deepcopy", "copy_method"])
 def test_copy_gpu(method, backend="gtcuda"):